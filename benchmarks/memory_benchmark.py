@@ -0,0 +1,187 @@
+"""
+Benchmark de memoria de los resultados en memoria.
+
+Uso:
+    python -m benchmarks.memory_benchmark --cases 20000 --diffs-per-case 10
+
+Construye los mismos TestResult con la representación compacta (modelos con
+`__slots__` y diffs BodyDiff) y con la anterior (modelos con `__dict__` por
+instancia y diffs como dicts) y compara la memoria asignada con tracemalloc.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+from importlib import metadata
+from typing import Any
+
+from api_signature_tester.validator.validator_model import (
+    BodyDiff,
+    ComparationResult,
+    DiffType,
+    EndpointData,
+    TestResult,
+)
+
+REPRESENTATIONS = ("dict", "compact")
+
+
+class _DictModel:
+    """Modelo con `__dict__` por instancia, como antes de usar `__slots__`."""
+
+    def __init__(self, **attributes: Any):
+        for name, value in attributes.items():
+            setattr(self, name, value)
+
+
+# Una clase por modelo, para que cada una comparta las claves de sus __dict__
+class _DictEndpointData(_DictModel):
+    pass
+
+
+class _DictComparationResult(_DictModel):
+    pass
+
+
+class _DictTestResult(_DictModel):
+    pass
+
+
+def build_results(representation: str, cases: int, diffs_per_case: int) -> list[object]:
+    """Resultados con un diff de valor en cada uno de `diffs_per_case` campos."""
+    if representation not in REPRESENTATIONS:
+        raise ValueError(f"Representación desconocida: {representation}")
+    build = _build_compact if representation == "compact" else _build_dict
+    return [build(case_id, diffs_per_case) for case_id in range(cases)]
+
+
+def _build_compact(case_id: int, diffs_per_case: int) -> object:
+    diffs = [
+        BodyDiff(DiffType.VALUE_CHANGED, _diff_path(i), i, i + 1)
+        for i in range(diffs_per_case)
+    ]
+    return TestResult(
+        EndpointData(_url("source", case_id), "GET", {}, {}),
+        EndpointData(_url("new", case_id), "GET", {}, {}),
+        ComparationResult(not diffs, {}, diffs),
+        case_id=case_id,
+    )
+
+
+def _build_dict(case_id: int, diffs_per_case: int) -> object:
+    diffs = [
+        {
+            "Tipo": "Cambio de valor",
+            "Ruta": _diff_path(i),
+            "Valor anterior": i,
+            "Valor nuevo": i + 1,
+        }
+        for i in range(diffs_per_case)
+    ]
+    return _DictTestResult(
+        _source=_dict_endpoint(_url("source", case_id)),
+        _new=_dict_endpoint(_url("new", case_id)),
+        _comparation_result=_DictComparationResult(
+            _are_equal=not diffs,
+            _diff_status_code={},
+            _diff_body=diffs,
+            _fast_path=None,
+            _diff_latency={},
+        ),
+        _metrics=None,
+        _case_id=case_id,
+    )
+
+
+def _dict_endpoint(url: str) -> _DictEndpointData:
+    return _DictEndpointData(_url=url, _method="GET", _params={}, _headers={})
+
+
+def _url(side: str, case_id: int) -> str:
+    return f"http://localhost/{side}/{case_id}"
+
+
+def _diff_path(index: int) -> str:
+    return f"root['items'][{index}]['value']"
+
+
+def measure(build: Callable[[], object]) -> int:
+    """Bytes asignados por `build()` que siguen vivos al terminar."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return allocated
+
+
+def run_benchmark(cases: int, diffs_per_case: int) -> dict[str, Any]:
+    results = []
+    for representation in REPRESENTATIONS:
+        allocated = measure(
+            lambda r=representation: build_results(r, cases, diffs_per_case)
+        )
+        results.append(
+            {
+                "representation": representation,
+                "allocated_mb": allocated / (1024 * 1024),
+                "bytes_per_case": allocated / cases if cases else 0.0,
+            }
+        )
+
+    by_representation = {r["representation"]: r for r in results}
+    dict_mb = by_representation["dict"]["allocated_mb"]
+    compact_mb = by_representation["compact"]["allocated_mb"]
+    return {
+        "version": _get_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "scenario": {"cases": cases, "diffs_per_case": diffs_per_case},
+        "results": results,
+        "savings_ratio": 1 - compact_mb / dict_mb if dict_mb else 0.0,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cases", type=int, default=20000)
+    parser.add_argument("--diffs-per-case", type=int, default=10)
+    parser.add_argument("--output", default="benchmarks/results/memory-latest.json")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.cases, args.diffs_per_case)
+
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    for result in report["results"]:
+        print(
+            f"{result['representation']:>7}: {result['allocated_mb']:8.1f}MB "
+            f"{result['bytes_per_case']:8.0f} bytes/case"
+        )
+    print(f"savings: {report['savings_ratio']:.0%}")
+    print(f"Results written to {args.output}")
+    return 0
+
+
+def _get_version() -> str:
+    try:
+        return metadata.version("api-signature-tester")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,390 @@
+"""
+Benchmark de los motores de ejecución contra un servidor local.
+
+Uso:
+    python -m benchmarks.run_benchmark --cases 500 --engines sync,async,staged \
+        --json-decoders stdlib,orjson
+
+Cada motor corre en un proceso propio (para que el pico de RSS sea el suyo)
+y los resultados se escriben en un JSON que se puede comparar entre versiones.
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
+from importlib import metadata
+from typing import Any
+
+from api_signature_tester.config import (
+    DIFF_PROCESSES,
+    MAX_IN_FLIGHT,
+    STAGE_DECODE_WORKERS,
+    STAGE_FETCH_WORKERS,
+    STAGE_QUEUE_SIZE,
+)
+from api_signature_tester.etl.etl_source_data import TestCaseSource
+from api_signature_tester.main import defineEngine
+from api_signature_tester.validator.http_session_pool import HttpSessionPool
+from api_signature_tester.validator.json_decoder import (
+    get_available_decoders,
+    get_json_decoder,
+)
+from api_signature_tester.validator.pipeline_json_api import (
+    PipelineFullJsonApiValidator,
+)
+from api_signature_tester.validator.validator_model import (
+    DecodedCase,
+    EndpointData,
+    TestResult,
+)
+from benchmarks.stand_in_server import PayloadSpec, StandInServer
+
+ENGINES = ("sync", "async", "staged")
+
+
+class BenchmarkSettings:
+    """Reemplaza a `Settings` con propiedades fijas para el benchmark."""
+
+    def __init__(self, properties: dict[str, Any]):
+        self._properties = properties
+
+    def get_properties(self, key: str) -> Any | None:
+        return self._properties.get(key)
+
+
+class TimedPipeline(PipelineFullJsonApiValidator):
+    """Acumula el tiempo ocupado de cada etapa del pipeline."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._stage_seconds: dict[str, float] = {}
+        self._stage_lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = super().__getstate__()
+        state["_stage_lock"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        super().__setstate__(state)
+        self._stage_lock = threading.Lock()
+
+    def get_stage_seconds(self) -> dict[str, float]:
+        with self._stage_lock:
+            return dict(self._stage_seconds)
+
+    def _exetute_requests(self, source: EndpointData, new: EndpointData):
+        started = time.perf_counter()
+        try:
+            return super()._exetute_requests(source, new)
+        finally:
+            self._add_stage_time("fetch", started)
+
+    def decode_case(self, *args, **kwargs) -> DecodedCase:
+        started = time.perf_counter()
+        try:
+            return super().decode_case(*args, **kwargs)
+        finally:
+            self._add_stage_time("decode", started)
+
+    def compare_decoded_case(self, decoded_case: DecodedCase) -> TestResult:
+        started = time.perf_counter()
+        try:
+            return super().compare_decoded_case(decoded_case)
+        finally:
+            self._add_stage_time("diff", started)
+
+    def _add_stage_time(self, stage: str, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        with self._stage_lock:
+            self._stage_seconds[stage] = self._stage_seconds.get(stage, 0.0) + elapsed
+
+
+class TimedSource:
+    """Registra el momento en que el motor toma cada caso del loader."""
+
+    def __init__(self, source: TestCaseSource):
+        self._source = source
+        self._loaded_at: list[float] = []
+
+    def get_rest_data(self) -> Iterable:
+        for test_case in self._source.get_rest_data():
+            self._loaded_at.append(time.perf_counter())
+            yield test_case
+
+    def get_load_errors(self) -> list[str]:
+        return self._source.get_load_errors()
+
+    def get_loaded_at(self, index: int) -> float:
+        return self._loaded_at[index]
+
+
+def write_suite_csv(path: str, base_url: str, cases: int) -> None:
+    """Genera un CSV de casos en el formato que lee `LoaderCsv`."""
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            [
+                "source_url",
+                "source_method",
+                "source_params",
+                "source_headers",
+                "new_url",
+                "new_method",
+                "new_params",
+                "new_headers",
+            ]
+        )
+        for i in range(cases):
+            writer.writerow(
+                [
+                    f"{base_url}/source/{i}",
+                    "GET",
+                    "",
+                    "",
+                    f"{base_url}/new/{i}",
+                    "GET",
+                    "",
+                    "",
+                ]
+            )
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+    if len(values) == 1:
+        return {"p50": values[0], "p95": values[0], "p99": values[0]}
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return {"p50": cuts[49], "p95": cuts[94], "p99": cuts[98]}
+
+
+def run_engine(
+    engine_name: str,
+    csv_path: str,
+    max_in_flight: int,
+    diff_processes: int | None,
+    parallel_requests: bool,
+    json_decoder: str | None = None,
+) -> dict[str, Any]:
+    """
+    Ejecuta un motor sobre el CSV y devuelve sus métricas. La latencia de un
+    caso es el tiempo entre que el motor lo toma del loader y entrega su
+    resultado, incluida la espera en colas.
+    """
+    settings = BenchmarkSettings(
+        {
+            MAX_IN_FLIGHT: max_in_flight,
+            DIFF_PROCESSES: diff_processes,
+            STAGE_QUEUE_SIZE: max_in_flight * 4,
+            STAGE_FETCH_WORKERS: max_in_flight,
+            STAGE_DECODE_WORKERS: None,
+        }
+    )
+    decoder = get_json_decoder(json_decoder)
+    pipeline = TimedPipeline(
+        parallel_requests=parallel_requests,
+        parallel_workers=max_in_flight,
+        session_pool=HttpSessionPool(pool_size=max_in_flight),
+        json_decoder=decoder,
+    )
+    runner = _get_engine_class(engine_name)(
+        pipeline,
+        logging.getLogger("api_signature_tester.benchmark"),
+        settings,  # type: ignore[arg-type]
+        input_csv_path=csv_path,
+    )
+
+    source = TimedSource(runner.load_test_cases())
+    latencies_ms: list[float] = []
+    failed = 0
+    started = time.perf_counter()
+    try:
+        for index, result in enumerate(runner.run_test_cases(source)):
+            latencies_ms.append(
+                (time.perf_counter() - source.get_loaded_at(index)) * 1000
+            )
+            if not result.get_comparation_result().is_equal():
+                failed += 1
+        elapsed = time.perf_counter() - started
+        pool_stats = pipeline.get_pool_stats()
+    finally:
+        pipeline.close()
+
+    stage_seconds = pipeline.get_stage_seconds()
+    get_engine_stage_seconds = getattr(runner, "get_stage_seconds", None)
+    if get_engine_stage_seconds is not None:
+        # En el motor por etapas el diff corre en otros procesos: se usan los
+        # tiempos medidos por el propio motor.
+        stage_seconds = get_engine_stage_seconds()
+
+    usage_self = resource.getrusage(resource.RUSAGE_SELF)
+    usage_children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cases = len(latencies_ms)
+    return {
+        "engine": engine_name,
+        "json_decoder": decoder.get_name(),
+        "cases": cases,
+        "failed": failed,
+        "seconds": elapsed,
+        "cases_per_sec": len(latencies_ms) / elapsed if elapsed > 0 else 0.0,
+        "latency_ms": percentiles(latencies_ms),
+        "peak_rss_mb": _to_mb(usage_self.ru_maxrss),
+        "peak_rss_children_mb": _to_mb(usage_children.ru_maxrss),
+        "stage_seconds": stage_seconds,
+        "decode_ms_per_case": (
+            stage_seconds.get("decode", 0.0) * 1000 / cases if cases else 0.0
+        ),
+        "connection_reuse_ratio": (
+            pool_stats.get_reuse_ratio() if pool_stats is not None else None
+        ),
+    }
+
+
+def run_benchmark(
+    spec: PayloadSpec,
+    cases: int,
+    engines: list[str],
+    max_in_flight: int = 16,
+    diff_processes: int | None = None,
+    parallel_requests: bool = False,
+    isolated: bool = True,
+    json_decoders: list[str] | None = None,
+) -> dict[str, Any]:
+    """
+    :param isolated: ejecuta cada motor en un proceso nuevo. Sin aislamiento
+        el pico de RSS es acumulado entre motores.
+    :param json_decoders: backends JSON a medir; cada motor se ejecuta una
+        vez por backend. Por defecto, todos los instalados.
+    """
+    for engine_name in engines:
+        _get_engine_class(engine_name)
+    if json_decoders is None:
+        json_decoders = get_available_decoders()
+    for json_decoder in json_decoders:
+        get_json_decoder(json_decoder)
+
+    results = []
+    with StandInServer(spec) as server, tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "suite.csv")
+        write_suite_csv(csv_path, server.get_base_url(), cases)
+        for engine_name, json_decoder in itertools.product(engines, json_decoders):
+            args = (
+                engine_name,
+                csv_path,
+                max_in_flight,
+                diff_processes,
+                parallel_requests,
+                json_decoder,
+            )
+            if isolated:
+                with ProcessPoolExecutor(
+                    max_workers=1, mp_context=multiprocessing.get_context("spawn")
+                ) as executor:
+                    results.append(executor.submit(run_engine, *args).result())
+            else:
+                results.append(run_engine(*args))
+        body_bytes = server.get_body_bytes()
+
+    return {
+        "version": _get_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "created_at": datetime.now(UTC).isoformat(),
+        "scenario": {
+            "cases": cases,
+            "body_bytes": body_bytes,
+            "max_in_flight": max_in_flight,
+            "diff_processes": diff_processes,
+            "parallel_requests": parallel_requests,
+            "json_decoders": json_decoders,
+            **spec.to_dict(),
+        },
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cases", type=int, default=500)
+    parser.add_argument("--engines", default=",".join(ENGINES))
+    parser.add_argument("--payload-bytes", type=int, default=2048)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--diff-ratio", type=float, default=0.1)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--max-in-flight", type=int, default=16)
+    parser.add_argument("--diff-processes", type=int, default=None)
+    parser.add_argument("--parallel-requests", action="store_true")
+    parser.add_argument(
+        "--json-decoders",
+        default=",".join(get_available_decoders()),
+        help="backends JSON a comparar (stdlib, orjson)",
+    )
+    parser.add_argument("--output", default="benchmarks/results/latest.json")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        PayloadSpec(args.payload_bytes, args.depth, args.diff_ratio, args.latency_ms),
+        cases=args.cases,
+        engines=[e.strip() for e in args.engines.split(",") if e.strip()],
+        max_in_flight=args.max_in_flight,
+        diff_processes=args.diff_processes,
+        parallel_requests=args.parallel_requests,
+        json_decoders=[d.strip() for d in args.json_decoders.split(",") if d.strip()],
+    )
+
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    for result in report["results"]:
+        latency = result["latency_ms"]
+        print(
+            f"{result['engine']:>7} [{result['json_decoder']}]: "
+            f"{result['cases_per_sec']:8.1f} cases/s "
+            f"p50={latency['p50']:.1f}ms p95={latency['p95']:.1f}ms "
+            f"p99={latency['p99']:.1f}ms decode={result['decode_ms_per_case']:.2f}ms "
+            f"rss={result['peak_rss_mb']:.1f}MB"
+        )
+    print(f"Results written to {args.output}")
+    return 0
+
+
+def _get_engine_class(engine_name: str):
+    if engine_name not in ENGINES:
+        raise ValueError(f"Motor de ejecución desconocido: {engine_name}")
+    return defineEngine(BenchmarkSettings({"execution_engine": engine_name}))  # type: ignore[arg-type]
+
+
+def _get_version() -> str:
+    try:
+        return metadata.version("api-signature-tester")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _to_mb(max_rss: int) -> float:
+    # ru_maxrss está en KB en Linux y en bytes en macOS
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return max_rss / divisor
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+import json
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+"""Servidor HTTP local que simula los endpoints source y new de un benchmark."""
+
+
+class PayloadSpec:
+    def __init__(
+        self,
+        size_bytes: int = 2048,
+        depth: int = 2,
+        diff_ratio: float = 0.1,
+        latency_ms: float = 0.0,
+    ):
+        """
+        :param size_bytes: tamaño aproximado del body JSON.
+        :param depth: niveles de anidamiento de cada elemento del body.
+        :param diff_ratio: proporción de casos en los que new devuelve un body
+            distinto al de source.
+        :param latency_ms: demora fija agregada a cada respuesta.
+        """
+        if size_bytes < 1:
+            raise ValueError("size_bytes must be greater than 0")
+        if depth < 0:
+            raise ValueError("depth must be 0 or greater")
+        if not 0.0 <= diff_ratio <= 1.0:
+            raise ValueError("diff_ratio must be between 0 and 1")
+        self._size_bytes = size_bytes
+        self._depth = depth
+        self._diff_ratio = diff_ratio
+        self._latency_ms = latency_ms
+
+    def get_size_bytes(self) -> int:
+        return self._size_bytes
+
+    def get_depth(self) -> int:
+        return self._depth
+
+    def get_diff_ratio(self) -> float:
+        return self._diff_ratio
+
+    def get_latency_ms(self) -> float:
+        return self._latency_ms
+
+    def has_diff(self, index: int) -> bool:
+        """Reparte los casos con diff de forma uniforme y determinística."""
+        return math.floor((index + 1) * self._diff_ratio) > math.floor(
+            index * self._diff_ratio
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "size_bytes": self._size_bytes,
+            "depth": self._depth,
+            "diff_ratio": self._diff_ratio,
+            "latency_ms": self._latency_ms,
+        }
+
+
+def build_payload(size_bytes: int, depth: int) -> dict:
+    """Body JSON con una lista de elementos anidados de ~size_bytes."""
+
+    def nest(level: int, index: int):
+        if level == 0:
+            return {
+                "id": index,
+                "name": f"item-{index}",
+                "active": index % 2 == 0,
+                "score": index * 1.5,
+                "tags": ["alpha", "beta"],
+            }
+        return {"left": nest(level - 1, index), "right": nest(level - 1, index + 1)}
+
+    item_size = len(json.dumps(nest(depth, 0))) + 2
+    total = max(1, size_bytes // item_size)
+    return {"total": total, "items": [nest(depth, i) for i in range(total)]}
+
+
+class StandInServer:
+    """
+    Sirve `/source/<n>` y `/new/<n>` con bodies pregenerados. Para los casos
+    elegidos por `PayloadSpec.has_diff`, new agrega un campo al último
+    elemento, lo que obliga a ejecutar el diff completo.
+    """
+
+    def __init__(self, spec: PayloadSpec, host: str = "127.0.0.1", port: int = 0):
+        payload = build_payload(spec.get_size_bytes(), spec.get_depth())
+        self._body = json.dumps(payload).encode("utf-8")
+        payload["items"][-1]["changed"] = True
+        self._diff_body = json.dumps(payload).encode("utf-8")
+        self._spec = spec
+        self._server = ThreadingHTTPServer((host, port), self._create_handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    def get_base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def get_body_bytes(self) -> int:
+        return len(self._body)
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="stand-in-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _get_body(self, path: str) -> bytes | None:
+        parts = path.split("?", 1)[0].strip("/").split("/")
+        if len(parts) != 2 or parts[0] not in ("source", "new"):
+            return None
+        try:
+            index = int(parts[1])
+        except ValueError:
+            return None
+        if parts[0] == "new" and self._spec.has_diff(index):
+            return self._diff_body
+        return self._body
+
+    def _create_handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Cabecera y body se escriben por separado: con Nagle activo el
+            # body espera al ACK retrasado del cliente (~40 ms por respuesta).
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                latency_ms = server._spec.get_latency_ms()
+                if latency_ms > 0:
+                    time.sleep(latency_ms / 1000)
+
+                body = server._get_body(self.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
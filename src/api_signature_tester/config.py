@@ -13,8 +13,53 @@ LOG_LEVEL = "log_level"
 CSV_PATH = "csv_path"
 REPORT_MD_PATH = "report_md_path"
 REPORT_HTML_PATH = "report_html_path"
+REPORT_STREAMING = "report_streaming"
+REPORT_HTML_MODE = "report_html_mode"
+REPORT_HTML_SIDE_FILES = "report_html_side_files"
+REPORT_SQLITE_PATH = "report_sqlite_path"
 ENVIRONMENT = "environment"
 API_CONFIG_CONTENT_TYPE = "api_config_content_type"
+EXECUTION_ENGINE = "execution_engine"
+MAX_IN_FLIGHT = "max_in_flight"
+PARALLEL_REQUESTS = "parallel_requests"
+STAGE_QUEUE_SIZE = "stage_queue_size"
+STAGE_FETCH_WORKERS = "stage_fetch_workers"
+STAGE_DECODE_WORKERS = "stage_decode_workers"
+DIFF_PROCESSES = "diff_processes"
+HTTP_POOL_ENABLED = "http_pool_enabled"
+HTTP_POOL_SIZE = "http_pool_size"
+HTTP_KEEP_ALIVE = "http_keep_alive"
+RESPONSE_CACHE_MODE = "response_cache_mode"
+RESPONSE_CACHE_DIR = "response_cache_dir"
+RESPONSE_CACHE_TTL_SECONDS = "response_cache_ttl_seconds"
+RESPONSE_CACHE_MAX_BYTES = "response_cache_max_bytes"
+RESPONSE_CACHE_HEADERS = "response_cache_headers"
+LATENCY_MAX_RATIO = "latency_max_ratio"
+LATENCY_BUDGET_MS = "latency_budget_ms"
+LATENCY_SAMPLES = "latency_samples"
+REQUEST_CONNECT_TIMEOUT_SECONDS = "request_connect_timeout_seconds"
+REQUEST_READ_TIMEOUT_SECONDS = "request_read_timeout_seconds"
+REQUEST_RETRIES = "request_retries"
+REQUEST_RETRY_BACKOFF_SECONDS = "request_retry_backoff_seconds"
+REQUEST_RETRY_MAX_BACKOFF_SECONDS = "request_retry_max_backoff_seconds"
+REQUEST_HEDGING = "request_hedging"
+SCHEDULER_ENABLED = "scheduler_enabled"
+SCHEDULER_MAX_RPS = "scheduler_max_rps"
+SCHEDULER_MIN_RPS = "scheduler_min_rps"
+SCHEDULER_MAX_IN_FLIGHT = "scheduler_max_in_flight"
+SCHEDULER_INCREASE_RPS = "scheduler_increase_rps"
+SCHEDULER_BACKOFF_FACTOR = "scheduler_backoff_factor"
+SCHEDULER_LATENCY_THRESHOLD_MS = "scheduler_latency_threshold_ms"
+SHARD_STRATEGY = "shard_strategy"
+SHARD_OUTPUT_DIR = "shard_output_dir"
+JOURNAL_PATH = "journal_path"
+JSON_DECODER = "json_decoder"
+STREAMING_DIFF_MIN_BYTES = "streaming_diff_min_bytes"
+ARRAY_RULES = "array_rules"
+SAMPLING_RATE = "sampling_rate"
+SAMPLING_BUDGET = "sampling_budget"
+SAMPLING_SEED = "sampling_seed"
+SAMPLING_MIN_PER_STRATUM = "sampling_min_per_stratum"
 
 
 def _load_json(path: Path) -> dict:
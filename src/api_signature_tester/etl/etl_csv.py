@@ -1,10 +1,14 @@
 import csv
+import os
+from collections.abc import Iterator
 
 from api_signature_tester.etl.etl_source_data import (
     ETLDataProcess,
+    ETLDataStream,
     ETLProccess,
     TestData,
 )
+from api_signature_tester.etl.shard import SHARD_BY_ROW, Shard
 from api_signature_tester.validator.validator_model import EndpointData
 
 
@@ -17,49 +21,89 @@ class LoaderCsv(ETLProccess):
                 if index == 0:
                     continue  # Skip header row
                 try:
-                    source_data = EndpointData(
-                        url=row[0],
-                        method=row[1],
-                        params={
-                            k: v
-                            for k, v in (
-                                param.split("=") for param in row[2].split("&")
-                            )
-                        }
-                        if row[2]
-                        else {},
-                        headers={
-                            k: v
-                            for k, v in (
-                                header.split("=") for header in row[3].split("&")
-                            )
-                        }
-                        if row[3]
-                        else {},
-                    )
-                    new_data = EndpointData(
-                        url=row[4],
-                        method=row[5],
-                        params={
-                            k: v
-                            for k, v in (
-                                param.split("=") for param in row[6].split("&")
-                            )
-                        }
-                        if row[6]
-                        else {},
-                        headers={
-                            k: v
-                            for k, v in (
-                                header.split("=") for header in row[7].split("&")
-                            )
-                        }
-                        if row[7]
-                        else {},
-                    )
-                    etlData.add_test_data(
-                        test_data=TestData(source=source_data, new=new_data)
-                    )
+                    etlData.add_test_data(test_data=self._parse_row(row, index - 1))
                 except Exception as e:
                     etlData.add_load_error(f"Error processing row {index + 1}: {e}")
         return etlData
+
+    def stream_data(
+        self,
+        file_path: str,
+        shard: Shard | None = None,
+        skip_case_ids: set[int] | None = None,
+        case_ids: set[int] | None = None,
+    ) -> ETLDataStream:
+        """
+        Devuelve los casos de forma perezosa: el CSV se lee fila a fila a
+        medida que el motor consume los casos.
+
+        :param shard: si se indica, solo se devuelven los casos de ese shard.
+            Los errores de carga se reportan en el shard dueño de la fila por
+            posición, así cada error aparece en un único shard.
+        :param skip_case_ids: casos que no se devuelven (ya tienen resultado
+            en el journal de una ejecución anterior).
+        :param case_ids: si se indica, solo se devuelven estos casos (la
+            muestra de `StratifiedSampler`). Los errores de carga se siguen
+            reportando.
+        """
+        os.stat(file_path)  # Falla al crear el stream si el archivo no existe
+
+        def produce(stream: ETLDataStream) -> Iterator[TestData]:
+            with open(file_path) as file:
+                csv_reader = csv.reader(file)
+                for index, row in enumerate(csv_reader):
+                    if index == 0:
+                        continue  # Skip header row
+                    case_id = index - 1
+                    if skip_case_ids and case_id in skip_case_ids:
+                        continue
+                    if (
+                        shard is not None
+                        and shard.get_strategy() == SHARD_BY_ROW
+                        and not shard.owns_row(case_id)
+                    ):
+                        continue  # Sin parsear: la fila es de otro shard
+                    try:
+                        test_data = self._parse_row(row, case_id)
+                    except Exception as e:
+                        if shard is None or shard.owns_row(case_id):
+                            stream.add_load_error(
+                                f"Error processing row {index + 1}: {e}"
+                            )
+                        continue
+                    if case_ids is not None and case_id not in case_ids:
+                        continue
+                    if shard is None or shard.owns(test_data, case_id):
+                        yield test_data
+
+        return ETLDataStream(produce)
+
+    def _parse_row(self, row: list[str], case_id: int | None = None) -> TestData:
+        source_data = EndpointData(
+            url=row[0],
+            method=row[1],
+            params=self._parse_pairs(row[2]),
+            headers=self._parse_pairs(row[3]),
+        )
+        new_data = EndpointData(
+            url=row[4],
+            method=row[5],
+            params=self._parse_pairs(row[6]),
+            headers=self._parse_pairs(row[7]),
+        )
+        # Columna opcional: expresión JMESPath a validar en este caso
+        test_path_json = row[8].strip() if len(row) > 8 and row[8].strip() else None
+        return TestData(
+            source=source_data,
+            new=new_data,
+            test_path_json=test_path_json,
+            case_id=case_id,
+        )
+
+    def _parse_pairs(self, value: str) -> dict[str, str]:
+        """Convierte una cadena `a=1&b=2` en un dict."""
+        return (
+            {k: v for k, v in (pair.split("=") for pair in value.split("&"))}
+            if value
+            else {}
+        )
@@ -1,18 +1,34 @@
-from typing import Protocol
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Protocol
 
-from api_signature_tester.validator.validator_model import EndpointData
+from api_signature_tester.validator.validator_model import (
+    EndpointData,
+    TestEndpointModel,
+)
 
+if TYPE_CHECKING:
+    from api_signature_tester.etl.shard import Shard
 
-class TestData:
-    def __init__(self, source: EndpointData, new: EndpointData):
-        self._source = source
-        self._new = new
 
-    def get_source(self) -> EndpointData:
-        return self._source
+class TestData(TestEndpointModel):
+    __slots__ = ()
 
-    def get_new(self) -> EndpointData:
-        return self._new
+    def __init__(
+        self,
+        source: EndpointData,
+        new: EndpointData,
+        test_path_json: str | None = None,
+        case_id: int | None = None,
+    ):
+        super().__init__(source, new, test_path_json, case_id)
+
+
+class TestCaseSource(Protocol):
+    """Origen de casos de prueba consumido por los motores de ejecución."""
+
+    def get_rest_data(self) -> Iterable[TestData]: ...
+
+    def get_load_errors(self) -> list[str]: ...
 
 
 class ETLDataProcess:
@@ -33,5 +49,55 @@ class ETLDataProcess:
         return self._load_errors
 
 
+class ETLDataStream:
+    """
+    Variante perezosa de ETLDataProcess. Los casos se producen a medida que se
+    consumen, por lo que la memoria no depende del tamaño de la entrada.
+
+    Los errores de carga se registran aparte sin cortar la iteración. Se
+    guardan como máximo `max_load_errors` mensajes; el resto solo se cuenta.
+    """
+
+    DEFAULT_MAX_LOAD_ERRORS = 1000
+
+    def __init__(
+        self,
+        producer: Callable[["ETLDataStream"], Iterator[TestData]],
+        max_load_errors: int = DEFAULT_MAX_LOAD_ERRORS,
+    ):
+        """
+        :param producer: función que recibe el stream (para registrar errores)
+            y devuelve un iterador de TestData. Se invoca en cada iteración.
+        """
+        self._producer = producer
+        self._max_load_errors = max_load_errors
+        self._load_errors: list[str] = []
+        self._load_error_count = 0
+
+    def add_load_error(self, error_message: str) -> None:
+        self._load_error_count += 1
+        if len(self._load_errors) < self._max_load_errors:
+            self._load_errors.append(error_message)
+
+    def get_rest_data(self) -> Iterator[TestData]:
+        self._load_errors = []
+        self._load_error_count = 0
+        return self._producer(self)
+
+    def get_load_errors(self) -> list[str]:
+        return self._load_errors
+
+    def get_load_error_count(self) -> int:
+        return self._load_error_count
+
+
 class ETLProccess(Protocol):
     def load_data(self, file_path: str) -> ETLDataProcess: ...
+
+    def stream_data(
+        self,
+        file_path: str,
+        shard: "Shard | None" = None,
+        skip_case_ids: set[int] | None = None,
+        case_ids: set[int] | None = None,
+    ) -> ETLDataStream: ...
@@ -0,0 +1,209 @@
+import hashlib
+import math
+import random
+import re
+from collections.abc import Iterable
+from urllib.parse import urlsplit
+
+from api_signature_tester.etl.etl_source_data import TestData
+from api_signature_tester.validator.validator_model import EndpointData
+
+"""
+Muestreo estratificado de los casos: en lugar de ejecutar toda la entrada se
+elige al azar un subconjunto de cada estrato (método HTTP + template de la
+ruta), así una ejecución corta cubre todos los endpoints.
+"""
+
+Stratum = tuple[str, str]
+
+# Segmentos de ruta que son identificadores: números, UUIDs y hashes hex
+_ID_SEGMENT = re.compile(
+    r"^(\d+"
+    r"|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    r"|(?=[a-fA-F]*\d)[0-9a-fA-F]{16,})$"
+)
+ID_PLACEHOLDER = "{id}"
+
+
+def path_template(url: str) -> str:
+    """
+    Ruta de la URL con los segmentos que son identificadores reemplazados por
+    `{id}`: `http://api/v1/users/42/orders` -> `/v1/users/{id}/orders`.
+    Host y query no forman parte del template.
+    """
+    path = urlsplit(url).path or "/"
+    return "/".join(
+        ID_PLACEHOLDER if _ID_SEGMENT.match(segment) else segment
+        for segment in path.split("/")
+    )
+
+
+def get_stratum(endpoint: EndpointData) -> Stratum:
+    """Estrato de un caso: método en mayúsculas y template de la ruta de source."""
+    return endpoint.get_method().upper(), path_template(endpoint.get_url())
+
+
+class SamplingPlan:
+    """Casos elegidos por `StratifiedSampler` y el tamaño de cada estrato."""
+
+    def __init__(
+        self,
+        population: dict[Stratum, int],
+        selected: dict[Stratum, list[int]],
+        seed: int,
+    ):
+        self._population = population
+        self._selected = selected
+        self._seed = seed
+        self._case_ids = {
+            case_id for case_ids in selected.values() for case_id in case_ids
+        }
+
+    def get_strata(self) -> list[Stratum]:
+        return sorted(self._population)
+
+    def get_population(self, stratum: Stratum) -> int:
+        """Casos de la entrada en el estrato."""
+        return self._population.get(stratum, 0)
+
+    def get_sample_size(self, stratum: Stratum) -> int:
+        return len(self._selected.get(stratum, []))
+
+    def get_total_population(self) -> int:
+        return sum(self._population.values())
+
+    def get_case_ids(self) -> set[int]:
+        """`case_id` de todos los casos elegidos."""
+        return self._case_ids
+
+    def get_seed(self) -> int:
+        return self._seed
+
+    def __str__(self) -> str:
+        return (
+            f"{len(self._case_ids)} of {self.get_total_population()} cases in "
+            f"{len(self._population)} strata (seed {self._seed})"
+        )
+
+
+class StratifiedSampler:
+    """
+    Elige un subconjunto aleatorio de los casos por estrato (`get_stratum`).
+
+    - `rate`: cada estrato aporta `ceil(rate * casos)` casos.
+    - `budget`: se eligen `budget` casos en total, repartidos en proporción al
+      tamaño de cada estrato. Si el presupuesto no alcanza para todos los
+      estratos, quedan afuera los más chicos.
+
+    En ambos modos cada estrato aporta al menos `min_per_stratum` casos (o
+    todos los que tiene). Con el mismo `seed` y la misma entrada se eligen los
+    mismos casos, lo que permite combinar el muestreo con shards o `resume`.
+    Sin `seed` la semilla se deriva de la entrada (`case_id` de cada estrato)
+    y de las opciones del muestreo, así cada shard y cada ejecución retomada
+    eligen el mismo plan sin tener que fijarla.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        budget: int | None = None,
+        seed: int | None = None,
+        min_per_stratum: int = 1,
+    ):
+        """
+        :param rate: fracción de cada estrato, entre 0 (excluido) y 1.
+        :param budget: cantidad total de casos. Se usa `rate` o `budget`.
+        :param seed: semilla del generador aleatorio; por defecto se deriva
+            de la entrada en `plan` (se informa en el plan).
+        """
+        if (rate is None) == (budget is None):
+            raise ValueError("Se debe indicar rate o budget para el muestreo")
+        if rate is not None and not 0 < rate <= 1:
+            raise ValueError("rate debe estar entre 0 (excluido) y 1")
+        if budget is not None and budget < 1:
+            raise ValueError("budget debe ser mayor que 0")
+        if min_per_stratum < 0:
+            raise ValueError("min_per_stratum no puede ser negativo")
+        self._rate = rate
+        self._budget = budget
+        self._seed = seed
+        self._min_per_stratum = min_per_stratum
+
+    def get_seed(self) -> int | None:
+        """Semilla indicada o None si se deriva de la entrada."""
+        return self._seed
+
+    def plan(self, test_cases: Iterable[TestData]) -> SamplingPlan:
+        """
+        Agrupa los casos por estrato y elige la muestra. Solo se guardan los
+        `case_id`, no los casos; los que no tienen `case_id` se numeran por
+        posición, como en `LoaderCsv`.
+        """
+        strata: dict[Stratum, list[int]] = {}
+        for index, test_case in enumerate(test_cases):
+            case_id = test_case.get_case_id()
+            strata.setdefault(get_stratum(test_case.get_source()), []).append(
+                index if case_id is None else case_id
+            )
+
+        population = {stratum: len(case_ids) for stratum, case_ids in strata.items()}
+        sizes = self._allocate(population)
+        seed = self._seed if self._seed is not None else self._derive_seed(strata)
+        rng = random.Random(seed)  # noqa: S311
+        selected = {
+            stratum: sorted(rng.sample(strata[stratum], sizes[stratum]))
+            for stratum in sorted(strata)
+            if sizes[stratum]
+        }
+        return SamplingPlan(population, selected, seed)
+
+    def _derive_seed(self, strata: dict[Stratum, list[int]]) -> int:
+        """
+        Semilla que depende solo de la entrada y de las opciones: todos los
+        procesos que leen el mismo CSV eligen la misma muestra.
+        """
+        digest = hashlib.sha256(
+            f"{self._rate}|{self._budget}|{self._min_per_stratum}".encode()
+        )
+        for stratum in sorted(strata):
+            digest.update(f"\n{stratum[0]} {stratum[1]}:".encode())
+            digest.update(",".join(map(str, strata[stratum])).encode())
+        return int.from_bytes(digest.digest()[:4], "big")
+
+    def _allocate(self, population: dict[Stratum, int]) -> dict[Stratum, int]:
+        if self._rate is not None:
+            rate = self._rate
+            return {
+                stratum: min(size, max(self._min_per_stratum, math.ceil(rate * size)))
+                for stratum, size in population.items()
+            }
+
+        budget = self._budget or 0
+        sizes = dict.fromkeys(population, 0)
+        # Mínimo por estrato, empezando por los más grandes
+        for stratum in sorted(population, key=lambda s: (-population[s], s)):
+            minimum = min(self._min_per_stratum, population[stratum], budget)
+            sizes[stratum] = minimum
+            budget -= minimum
+
+        # El resto en proporción al tamaño (mayores restos), sin pasar el total
+        while budget > 0:
+            open_strata = [s for s in population if sizes[s] < population[s]]
+            if not open_strata:
+                break
+            weight = sum(population[s] for s in open_strata)
+            shares = {s: budget * population[s] / weight for s in open_strata}
+            assigned = 0
+            for stratum in open_strata:
+                extra = min(int(shares[stratum]), population[stratum] - sizes[stratum])
+                sizes[stratum] += extra
+                assigned += extra
+            if assigned == 0:
+                by_remainder = sorted(
+                    open_strata, key=lambda s: (-(shares[s] % 1), -population[s], s)
+                )
+                for stratum in by_remainder[:budget]:
+                    sizes[stratum] += 1
+                    assigned += 1
+            budget -= assigned
+        return sizes
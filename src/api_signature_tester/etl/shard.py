@@ -0,0 +1,83 @@
+import hashlib
+import json
+
+from api_signature_tester.etl.etl_source_data import TestData
+
+SHARD_BY_ROW = "row"
+SHARD_BY_HASH = "hash"
+
+
+class Shard:
+    """
+    Porción de la entrada que ejecuta un nodo. La asignación es determinística
+    y no necesita coordinación: N nodos con el mismo CSV y `index` 0..N-1
+    ejecutan cada caso exactamente una vez.
+
+    - `row`: el caso `case_id` va al shard `case_id % count`.
+    - `hash`: se usa un hash de la request de source (método, URL y params
+      ordenados), así el mismo caso cae en el mismo shard aunque se agreguen
+      o reordenen filas del CSV.
+    """
+
+    def __init__(self, index: int, count: int, strategy: str = SHARD_BY_ROW):
+        """
+        :param index: shard de este nodo, entre 0 y count - 1.
+        :param count: cantidad total de shards.
+        """
+        if count < 1:
+            raise ValueError("Shard count must be greater than 0")
+        if not 0 <= index < count:
+            raise ValueError("Shard index must be between 0 and count - 1")
+        if strategy not in (SHARD_BY_ROW, SHARD_BY_HASH):
+            raise ValueError(f"Estrategia de sharding desconocida: {strategy}")
+        self._index = index
+        self._count = count
+        self._strategy = strategy
+
+    @classmethod
+    def parse(cls, value: str, strategy: str = SHARD_BY_ROW) -> "Shard":
+        """Crea el shard a partir de `i/N`, con i entre 1 y N."""
+        try:
+            number, count = (int(part) for part in value.split("/"))
+        except ValueError:
+            raise ValueError(
+                f"Shard inválido: {value} (formato esperado i/N)"
+            ) from None
+        if not 1 <= number <= count:
+            raise ValueError(f"Shard inválido: {value} (i debe estar entre 1 y N)")
+        return cls(number - 1, count, strategy)
+
+    def get_index(self) -> int:
+        return self._index
+
+    def get_count(self) -> int:
+        return self._count
+
+    def get_strategy(self) -> str:
+        return self._strategy
+
+    def owns_row(self, case_id: int) -> bool:
+        """Decide por posición; se usa también para filas que no se pudieron leer."""
+        return case_id % self._count == self._index
+
+    def owns(self, test_data: TestData, case_id: int) -> bool:
+        if self._strategy == SHARD_BY_ROW:
+            return self.owns_row(case_id)
+        return self.get_request_hash(test_data) % self._count == self._index
+
+    @staticmethod
+    def get_request_hash(test_data: TestData) -> int:
+        source = test_data.get_source()
+        normalized = json.dumps(
+            [
+                source.get_method().upper(),
+                source.get_url(),
+                sorted(source.get_params().items()),
+            ],
+            separators=(",", ":"),
+        )
+        digest = hashlib.sha256(normalized.encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big")
+
+    def __str__(self) -> str:
+        return f"{self._index + 1}/{self._count} ({self._strategy})"
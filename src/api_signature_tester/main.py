@@ -1,23 +1,238 @@
-from api_signature_tester.config import API_CONFIG_CONTENT_TYPE, Settings, get_logger
-from api_signature_tester.pipeline.sync_process import ApiSignatureTesterSynchBase
+import argparse
+import glob
+import os
+from typing import Any
+
+from api_signature_tester.config import (
+    API_CONFIG_CONTENT_TYPE,
+    ARRAY_RULES,
+    EXECUTION_ENGINE,
+    HTTP_KEEP_ALIVE,
+    HTTP_POOL_ENABLED,
+    HTTP_POOL_SIZE,
+    JOURNAL_PATH,
+    JSON_DECODER,
+    LATENCY_BUDGET_MS,
+    LATENCY_MAX_RATIO,
+    LATENCY_SAMPLES,
+    MAX_IN_FLIGHT,
+    PARALLEL_REQUESTS,
+    REPORT_HTML_MODE,
+    REPORT_HTML_SIDE_FILES,
+    REPORT_SQLITE_PATH,
+    REQUEST_CONNECT_TIMEOUT_SECONDS,
+    REQUEST_HEDGING,
+    REQUEST_READ_TIMEOUT_SECONDS,
+    REQUEST_RETRIES,
+    REQUEST_RETRY_BACKOFF_SECONDS,
+    REQUEST_RETRY_MAX_BACKOFF_SECONDS,
+    RESPONSE_CACHE_DIR,
+    RESPONSE_CACHE_HEADERS,
+    RESPONSE_CACHE_MAX_BYTES,
+    RESPONSE_CACHE_MODE,
+    RESPONSE_CACHE_TTL_SECONDS,
+    SAMPLING_BUDGET,
+    SAMPLING_MIN_PER_STRATUM,
+    SAMPLING_RATE,
+    SAMPLING_SEED,
+    SCHEDULER_BACKOFF_FACTOR,
+    SCHEDULER_ENABLED,
+    SCHEDULER_INCREASE_RPS,
+    SCHEDULER_LATENCY_THRESHOLD_MS,
+    SCHEDULER_MAX_IN_FLIGHT,
+    SCHEDULER_MAX_RPS,
+    SCHEDULER_MIN_RPS,
+    SHARD_OUTPUT_DIR,
+    SHARD_STRATEGY,
+    STREAMING_DIFF_MIN_BYTES,
+    Settings,
+    get_logger,
+)
+from api_signature_tester.etl.sampling import StratifiedSampler
+from api_signature_tester.etl.shard import SHARD_BY_HASH, SHARD_BY_ROW, Shard
+from api_signature_tester.pipeline.async_process import ApiSignatureTesterAsync
+from api_signature_tester.pipeline.staged_process import ApiSignatureTesterStaged
+from api_signature_tester.pipeline.sync_process import (
+    ApiSignatureTesterSynch,
+    ApiSignatureTesterSynchBase,
+)
+from api_signature_tester.report.html_paged_report import create_html_report_writer
+from api_signature_tester.report.reporter import ReportWriter
+from api_signature_tester.report.result_merge import merge_partial_reports
+from api_signature_tester.report.sqlite_report_writer import SqliteReportWriter
+from api_signature_tester.validator.array_rules import ArrayRules
+from api_signature_tester.validator.host_scheduler import HostScheduler
+from api_signature_tester.validator.http_session_pool import HttpSessionPool
+from api_signature_tester.validator.json_decoder import get_json_decoder
 from api_signature_tester.validator.pipeline_api_validaror import PipelineApiValidaror
 from api_signature_tester.validator.pipeline_json_api import (
     PipelineFullJsonApiValidator,
     PipelineJsonApiParcialValidator,
 )
+from api_signature_tester.validator.response_cache import ResponseCache
+from api_signature_tester.validator.validator_model import LatencyPolicy, RetryPolicy
 
 
-def run():
+def run(argv: list[str] | None = None):
+    """
+    Uso:
+        python -m api_signature_tester [--shard i/N] [--shard-strategy row|hash]
+            [--journal PATH] [--resume]
+            [--sample-rate R | --sample-budget N] [--sample-seed S]
+        python -m api_signature_tester merge [PARTIAL ...]
+    """
+    args = parseArguments(argv)
     settings = Settings()
 
+    if args.command == "merge":
+        runMerge(settings, args.partials)
+        return
+
+    if (
+        args.resume
+        and args.shard is None
+        and not (args.journal or settings.get_properties(JOURNAL_PATH))
+    ):
+        raise ValueError("--resume necesita un journal (--journal o journal_path)")
+
+    shard = None
+    if args.shard is not None:
+        strategy = args.shard_strategy or settings.get_properties(SHARD_STRATEGY)
+        shard = Shard.parse(args.shard, str(strategy or SHARD_BY_ROW))
+
     p = definePipelineValidator(
         content_type=None, path_to_validate=None, settings=settings
     )
-    ApiSignatureTesterSynchBase(p, get_logger(), settings).execute()
+    defineEngine(settings)(
+        p,
+        get_logger(),
+        settings,
+        shard=shard,
+        input_journal_path=args.journal,
+        resume=args.resume,
+        sampler=defineSampler(settings, args),
+    ).execute()
+
+
+def parseArguments(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="api_signature_tester")
+    parser.add_argument(
+        "--shard",
+        help="ejecuta solo el shard i de N (1 <= i <= N) y escribe un archivo parcial",
+    )
+    parser.add_argument(
+        "--shard-strategy",
+        choices=(SHARD_BY_ROW, SHARD_BY_HASH),
+        help="reparto de casos: por fila del CSV o por hash de la request",
+    )
+    parser.add_argument(
+        "--journal",
+        help="journal de resultados (el archivo parcial si se usa --shard)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="retoma una ejecución cortada: omite los casos que ya están en el journal",
+    )
+    sample_group = parser.add_mutually_exclusive_group()
+    sample_group.add_argument(
+        "--sample-rate",
+        type=float,
+        help="ejecuta una muestra estratificada: fracción de cada endpoint (0-1]",
+    )
+    sample_group.add_argument(
+        "--sample-budget",
+        type=int,
+        help="ejecuta una muestra estratificada de N casos en total",
+    )
+    parser.add_argument(
+        "--sample-seed",
+        type=int,
+        help="semilla del muestreo; por defecto se deriva de la entrada",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    merge_parser = subparsers.add_parser(
+        "merge", help="combina los archivos parciales en los reportes Markdown/HTML"
+    )
+    merge_parser.add_argument(
+        "partials",
+        nargs="*",
+        help="archivos parciales; por defecto todos los de shard_output_dir",
+    )
+    return parser.parse_args(argv)
+
+
+def runMerge(settings: Settings, partial_paths: list[str]) -> None:
+    logger = get_logger()
+    if not partial_paths:
+        output_dir = str(settings.get_properties(SHARD_OUTPUT_DIR) or ".")
+        partial_paths = sorted(glob.glob(os.path.join(output_dir, "*.jsonl")))
+    if not partial_paths:
+        raise ValueError("No se encontraron archivos parciales para combinar")
+
+    sqlite_path = settings.get_properties(REPORT_SQLITE_PATH)
+    sqlite_writers: list[tuple[ReportWriter, str]] = (
+        [(SqliteReportWriter(), str(sqlite_path))] if sqlite_path else []
+    )
+    total = merge_partial_reports(
+        partial_paths,
+        str(settings.get_properties("report_md_path")),
+        str(settings.get_properties("report_html_path")),
+        create_html_report_writer(
+            settings.get_properties(REPORT_HTML_MODE),
+            bool(settings.get_properties(REPORT_HTML_SIDE_FILES)),
+        ),
+        sqlite_writers,
+    )
+    logger.info(f"Merged {total} cases from {len(partial_paths)} partial files")
+
+
+def defineSampler(
+    settings: Settings, args: argparse.Namespace
+) -> StratifiedSampler | None:
+    """
+    Muestreo estratificado según los argumentos o, si no se indican, la
+    configuración (`sampling_rate` / `sampling_budget`). None ejecuta todos
+    los casos.
+    """
+    rate = args.sample_rate
+    budget = args.sample_budget
+    if rate is None and budget is None:
+        rate = settings.get_properties(SAMPLING_RATE)
+        budget = settings.get_properties(SAMPLING_BUDGET)
+    if rate is None and budget is None:
+        return None
+
+    seed = args.sample_seed
+    if seed is None:
+        seed = settings.get_properties(SAMPLING_SEED)
+    min_per_stratum = settings.get_properties(SAMPLING_MIN_PER_STRATUM)
+    return StratifiedSampler(
+        rate=None if rate is None else float(rate),
+        budget=None if budget is None else int(budget),
+        seed=None if seed is None else int(seed),
+        min_per_stratum=1 if min_per_stratum is None else int(min_per_stratum),
+    )
+
+
+def defineEngine(settings: Settings) -> type[ApiSignatureTesterSynch]:
+    engine = settings.get_properties(EXECUTION_ENGINE) or "sync"
+
+    engines: dict[str, type[ApiSignatureTesterSynch]] = {
+        "sync": ApiSignatureTesterSynchBase,
+        "async": ApiSignatureTesterAsync,
+        "staged": ApiSignatureTesterStaged,
+    }
+    result = engines.get(str(engine).lower())
+
+    if result is None:
+        raise ValueError(f"Motor de ejecución desconocido: {engine}")
+
+    return result
 
 
 def definePipelineValidator(
-    settings: Settings, content_type: str, path_to_validate: str | None
+    settings: Settings, content_type: str | None, path_to_validate: str | None
 ) -> PipelineApiValidaror:
     content_type = (
         content_type
@@ -27,16 +242,92 @@ def definePipelineValidator(
 
     if content_type == "application/json":
         if path_to_validate is not None:
-            return PipelineJsonApiParcialValidator(path_to_validate)
+            return PipelineJsonApiParcialValidator(
+                path_to_validate, **definePipelineOptions(settings)
+            )
 
         if path_to_validate is None:
             # Implementar y retornar un validador para HTML cuando esté disponible
-            return PipelineFullJsonApiValidator()
+            return PipelineFullJsonApiValidator(**definePipelineOptions(settings))
 
     raise ValueError(
         "No se pudo definir un validador adecuado para los parámetros proporcionados."
     )
 
 
+def definePipelineOptions(settings: Settings) -> dict[str, Any]:
+    """Opciones comunes de los validadores leídas desde la configuración."""
+    session_pool = None
+    if settings.get_properties(HTTP_POOL_ENABLED):
+        session_pool = HttpSessionPool(
+            pool_size=int(settings.get_properties(HTTP_POOL_SIZE) or 10),
+            keep_alive=settings.get_properties(HTTP_KEEP_ALIVE) is not False,
+        )
+
+    response_cache = None
+    cache_mode = settings.get_properties(RESPONSE_CACHE_MODE)
+    if cache_mode:
+        response_cache = ResponseCache(
+            cache_dir=str(settings.get_properties(RESPONSE_CACHE_DIR)),
+            mode=str(cache_mode),
+            ttl_seconds=settings.get_properties(RESPONSE_CACHE_TTL_SECONDS),
+            max_bytes=settings.get_properties(RESPONSE_CACHE_MAX_BYTES),
+            header_keys=settings.get_properties(RESPONSE_CACHE_HEADERS),
+        )
+
+    latency_policy = None
+    max_ratio = settings.get_properties(LATENCY_MAX_RATIO)
+    budget_ms = settings.get_properties(LATENCY_BUDGET_MS)
+    if max_ratio is not None or budget_ms is not None:
+        latency_policy = LatencyPolicy(
+            max_ratio=max_ratio,
+            budget_ms=budget_ms,
+            samples=int(settings.get_properties(LATENCY_SAMPLES) or 1),
+        )
+
+    scheduler = None
+    if settings.get_properties(SCHEDULER_ENABLED):
+        scheduler = HostScheduler(
+            max_rps=settings.get_properties(SCHEDULER_MAX_RPS),
+            min_rps=float(settings.get_properties(SCHEDULER_MIN_RPS) or 1),
+            max_in_flight=int(settings.get_properties(SCHEDULER_MAX_IN_FLIGHT) or 8),
+            increase_rps=float(settings.get_properties(SCHEDULER_INCREASE_RPS) or 1),
+            backoff_factor=float(
+                settings.get_properties(SCHEDULER_BACKOFF_FACTOR) or 0.5
+            ),
+            latency_threshold_ms=settings.get_properties(
+                SCHEDULER_LATENCY_THRESHOLD_MS
+            ),
+        )
+
+    retry_policy = RetryPolicy(
+        connect_timeout_seconds=settings.get_properties(
+            REQUEST_CONNECT_TIMEOUT_SECONDS
+        ),
+        read_timeout_seconds=settings.get_properties(REQUEST_READ_TIMEOUT_SECONDS),
+        retries=int(settings.get_properties(REQUEST_RETRIES) or 0),
+        backoff_seconds=float(
+            settings.get_properties(REQUEST_RETRY_BACKOFF_SECONDS) or 0.5
+        ),
+        max_backoff_seconds=float(
+            settings.get_properties(REQUEST_RETRY_MAX_BACKOFF_SECONDS) or 8
+        ),
+        hedging=bool(settings.get_properties(REQUEST_HEDGING)),
+    )
+
+    return {
+        "parallel_requests": bool(settings.get_properties(PARALLEL_REQUESTS)),
+        "parallel_workers": settings.get_properties(MAX_IN_FLIGHT),
+        "session_pool": session_pool,
+        "response_cache": response_cache,
+        "latency_policy": latency_policy,
+        "scheduler": scheduler,
+        "retry_policy": retry_policy,
+        "json_decoder": get_json_decoder(settings.get_properties(JSON_DECODER)),
+        "streaming_diff_min_bytes": settings.get_properties(STREAMING_DIFF_MIN_BYTES),
+        "array_rules": ArrayRules(settings.get_properties(ARRAY_RULES)),
+    }
+
+
 if __name__ == "__main__":
     run()
@@ -0,0 +1,139 @@
+import asyncio
+import logging
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+from api_signature_tester.config import MAX_IN_FLIGHT, Settings
+from api_signature_tester.etl.etl_source_data import TestCaseSource
+from api_signature_tester.etl.sampling import StratifiedSampler
+from api_signature_tester.etl.shard import Shard
+from api_signature_tester.pipeline.sync_process import ApiSignatureTesterSynchBase
+from api_signature_tester.validator.pipeline_api_validaror import PipelineApiValidaror
+from api_signature_tester.validator.validator_model import TestEndpointModel, TestResult
+
+
+class ApiSignatureTesterAsync(ApiSignatureTesterSynchBase):
+    """
+    Motor de ejecución concurrente sobre un event loop de asyncio.
+    Reutiliza la carga de casos, el pipeline de validación y los reportes de
+    ApiSignatureTesterSynchBase, pero mantiene hasta `max_in_flight` casos en
+    ejecución al mismo tiempo.
+
+    Como `requests` es bloqueante, cada caso se despacha desde el loop a un
+    thread del executor. Los resultados se entregan en el orden de carga.
+    """
+
+    DEFAULT_MAX_IN_FLIGHT = 16
+    # Casos que se pueden lanzar por delante del más antiguo sin entregar,
+    # en múltiplos de max_in_flight
+    REORDER_WINDOW_FACTOR = 4
+
+    def __init__(
+        self,
+        pipeline: PipelineApiValidaror,
+        logger: logging.Logger,
+        settings: Settings,
+        input_csv_path: str | None = None,
+        input_md_report_path: str | None = None,
+        input_html_report_path: str | None = None,
+        max_in_flight: int | None = None,
+        shard: Shard | None = None,
+        input_journal_path: str | None = None,
+        resume: bool = False,
+        sampler: StratifiedSampler | None = None,
+    ):
+        super().__init__(
+            pipeline,
+            logger,
+            settings,
+            input_csv_path,
+            input_md_report_path,
+            input_html_report_path,
+            shard,
+            input_journal_path,
+            resume,
+            sampler,
+        )
+        self._max_in_flight = max_in_flight
+        self._executor: ThreadPoolExecutor | None = None
+
+    def get_max_in_flight(self) -> int:
+        value = (
+            self._max_in_flight
+            if self._max_in_flight is not None
+            else self._settings.get_properties(MAX_IN_FLIGHT)
+        )
+        max_in_flight = int(value) if value is not None else self.DEFAULT_MAX_IN_FLIGHT
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be greater than 0")
+        return max_in_flight
+
+    def run_test_cases(self, test_cases: TestCaseSource) -> Iterator[TestResult]:
+        """
+        Lanza los casos sobre el event loop con hasta `max_in_flight` en
+        ejecución: apenas termina un caso se lanza el siguiente, aunque uno
+        más antiguo siga en curso. Los resultados que terminan antes de su
+        turno esperan en un buffer de reordenamiento y se entregan en el
+        orden de carga. Entre el caso más antiguo sin entregar y el último
+        lanzado hay como máximo `max_in_flight * REORDER_WINDOW_FACTOR`
+        casos, así la memoria queda acotada aunque un caso se demore.
+        """
+        max_in_flight = self.get_max_in_flight()
+        window = max_in_flight * self.REORDER_WINDOW_FACTOR
+        loop = asyncio.new_event_loop()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix="api-signature-case"
+        )
+        running: dict[asyncio.Task[TestResult], int] = {}
+        finished: dict[int, asyncio.Task[TestResult]] = {}
+        cases = iter(test_cases.get_rest_data())
+        loaded = 0
+        next_index = 0
+
+        try:
+            while True:
+                while len(running) < max_in_flight and loaded - next_index < window:
+                    test_case = next(cases, None)
+                    if test_case is None:
+                        break
+                    task = loop.create_task(self.execute_test_case_async(test_case))
+                    running[task] = loaded
+                    loaded += 1
+
+                if next_index in finished:
+                    # result() propaga el error del caso en su turno
+                    yield finished.pop(next_index).result()
+                    next_index += 1
+                    continue
+                if not running:
+                    break
+
+                done, _ = loop.run_until_complete(
+                    asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                )
+                for task in done:
+                    finished[running.pop(task)] = task
+        finally:
+            pending = list(running)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(
+                    asyncio.gather(*pending, return_exceptions=True)
+                )
+            for task in finished.values():
+                if not task.cancelled():
+                    task.exception()  # Evita el aviso de excepción no leída
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            loop.close()
+
+    async def execute_test_case_async(self, test_case: TestEndpointModel) -> TestResult:
+        """
+        Ejecuta un caso sin bloquear el loop. Las subclases con un cliente HTTP
+        asíncrono pueden sobrescribir este método.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self.execute_test_case, test_case
+        )
@@ -0,0 +1,315 @@
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any
+
+from api_signature_tester.config import (
+    DIFF_PROCESSES,
+    STAGE_DECODE_WORKERS,
+    STAGE_FETCH_WORKERS,
+    STAGE_QUEUE_SIZE,
+    Settings,
+)
+from api_signature_tester.etl.etl_source_data import TestCaseSource
+from api_signature_tester.etl.sampling import StratifiedSampler
+from api_signature_tester.etl.shard import Shard
+from api_signature_tester.pipeline.sync_process import ApiSignatureTesterSynchBase
+from api_signature_tester.validator.pipeline_api_validaror import PipelineApiValidaror
+from api_signature_tester.validator.validator_model import DecodedCase, TestResult
+
+_DONE = object()
+
+# Pipeline usado por los procesos de la etapa de diff (uno por proceso).
+_worker_pipeline: PipelineApiValidaror | None = None
+
+
+def _init_diff_worker(pipeline: PipelineApiValidaror) -> None:
+    global _worker_pipeline
+    _worker_pipeline = pipeline
+
+
+def _compare_in_worker(decoded_case: DecodedCase) -> TestResult:
+    if _worker_pipeline is None:
+        raise RuntimeError("El proceso de diff no fue inicializado")
+    return _worker_pipeline.compare_decoded_case(decoded_case)
+
+
+class _StageError:
+    def __init__(self, stage: str, error: BaseException):
+        self.stage = stage
+        self.error = error
+
+
+class ApiSignatureTesterStaged(ApiSignatureTesterSynchBase):
+    """
+    Motor por etapas: load → fetch → decode → diff → report.
+
+    Las etapas se conectan con colas acotadas y corren en threads, salvo el
+    diff (DeepDiff es CPU puro y retiene el GIL), que se ejecuta en un
+    ProcessPoolExecutor. Una ventana de `stage_queue_size` casos limita los
+    casos en vuelo entre todas las etapas: el loader no lee un caso nuevo hasta
+    que el reporte consume uno, así un fetch rápido no puede llenar la memoria.
+    Los resultados se entregan en el orden de carga.
+    """
+
+    DEFAULT_FETCH_WORKERS = 16
+    DEFAULT_DECODE_WORKERS = 2
+    DEFAULT_QUEUE_SIZE = 64
+
+    def __init__(
+        self,
+        pipeline: PipelineApiValidaror,
+        logger: logging.Logger,
+        settings: Settings,
+        input_csv_path: str | None = None,
+        input_md_report_path: str | None = None,
+        input_html_report_path: str | None = None,
+        fetch_workers: int | None = None,
+        decode_workers: int | None = None,
+        diff_processes: int | None = None,
+        queue_size: int | None = None,
+        shard: Shard | None = None,
+        input_journal_path: str | None = None,
+        resume: bool = False,
+        sampler: StratifiedSampler | None = None,
+    ):
+        """
+        :param diff_processes: procesos para la etapa de diff. 0 ejecuta el
+            diff en los threads de decode; None usa la configuración o, si no
+            está definida, un proceso por CPU.
+        """
+        super().__init__(
+            pipeline,
+            logger,
+            settings,
+            input_csv_path,
+            input_md_report_path,
+            input_html_report_path,
+            shard,
+            input_journal_path,
+            resume,
+            sampler,
+        )
+        self._fetch_workers = fetch_workers
+        self._decode_workers = decode_workers
+        self._diff_processes = diff_processes
+        self._queue_size = queue_size
+        self._stage_seconds: dict[str, float] = {}
+        self._stage_lock = threading.Lock()
+
+    def get_stage_seconds(self) -> dict[str, float]:
+        """Tiempo ocupado acumulado por etapa (sumado entre workers)."""
+        with self._stage_lock:
+            return dict(self._stage_seconds)
+
+    def run_test_cases(self, test_cases: TestCaseSource) -> Iterator[TestResult]:
+        queue_size = self._get_stage_size(
+            self._queue_size, STAGE_QUEUE_SIZE, self.DEFAULT_QUEUE_SIZE
+        )
+        fetch_workers = self._get_stage_size(
+            self._fetch_workers, STAGE_FETCH_WORKERS, self.DEFAULT_FETCH_WORKERS
+        )
+        decode_workers = self._get_stage_size(
+            self._decode_workers, STAGE_DECODE_WORKERS, self.DEFAULT_DECODE_WORKERS
+        )
+        diff_processes = self._get_diff_processes()
+
+        self._stage_seconds = {}
+        window = threading.Semaphore(queue_size)
+        stop = threading.Event()
+        fetch_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        decode_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        # Acotada por la ventana: nunca hay más de queue_size casos en vuelo
+        report_queue: queue.Queue = queue.Queue()
+        diff_executor = self._create_diff_executor(diff_processes)
+
+        self._start_stage(
+            "fetch",
+            fetch_workers,
+            fetch_queue,
+            decode_queue,
+            report_queue,
+            stop,
+            self._fetch,
+        )
+        self._start_stage(
+            "decode",
+            decode_workers,
+            decode_queue,
+            report_queue,
+            report_queue,
+            stop,
+            lambda item: self._decode_and_submit(item, diff_executor),
+        )
+        threading.Thread(
+            target=self._load_stage,
+            args=(test_cases, fetch_queue, report_queue, window, stop),
+            name="api-signature-load",
+            daemon=True,
+        ).start()
+
+        buffer: dict[int, Future] = {}
+        next_index = 0
+        try:
+            while True:
+                item = report_queue.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, _StageError):
+                    raise RuntimeError(
+                        f"Falló la etapa {item.stage} del pipeline"
+                    ) from item.error
+
+                index, future = item
+                buffer[index] = future
+                while next_index in buffer:
+                    started = time.perf_counter()
+                    result = buffer.pop(next_index).result()
+                    self._add_stage_time("diff_wait", started)
+                    next_index += 1
+                    window.release()
+                    yield result
+        finally:
+            stop.set()
+            if diff_executor is not None:
+                diff_executor.shutdown(wait=True, cancel_futures=True)
+            self._logger.info(f"Stage busy seconds: {self.get_stage_seconds()}")
+
+    def _load_stage(
+        self,
+        test_cases: TestCaseSource,
+        fetch_queue: queue.Queue,
+        report_queue: queue.Queue,
+        window: threading.Semaphore,
+        stop: threading.Event,
+    ) -> None:
+        try:
+            for index, test_case in enumerate(test_cases.get_rest_data()):
+                while not window.acquire(timeout=0.1):
+                    if stop.is_set():
+                        return
+                if not self._put(fetch_queue, (index, test_case), stop):
+                    return
+            self._put(fetch_queue, _DONE, stop)
+        except Exception as e:
+            report_queue.put(_StageError("load", e))
+
+    def _start_stage(
+        self,
+        name: str,
+        workers: int,
+        inbox: queue.Queue,
+        outbox: queue.Queue,
+        report_queue: queue.Queue,
+        stop: threading.Event,
+        handler: Callable[[Any], Any],
+    ) -> None:
+        remaining = [workers]
+        remaining_lock = threading.Lock()
+
+        def work() -> None:
+            while not stop.is_set():
+                try:
+                    item = inbox.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+
+                if item is _DONE:
+                    # Propaga el fin a los demás workers de la etapa; el último
+                    # en terminar avisa a la etapa siguiente.
+                    self._put(inbox, _DONE, stop)
+                    with remaining_lock:
+                        remaining[0] -= 1
+                        last = remaining[0] == 0
+                    if last:
+                        self._put(outbox, _DONE, stop)
+                    return
+
+                started = time.perf_counter()
+                try:
+                    output = handler(item)
+                except Exception as e:
+                    report_queue.put(_StageError(name, e))
+                    return
+                self._add_stage_time(name, started)
+                if not self._put(outbox, output, stop):
+                    return
+
+        for i in range(workers):
+            threading.Thread(
+                target=work, name=f"api-signature-{name}-{i}", daemon=True
+            ).start()
+
+    def _fetch(self, item: tuple) -> tuple:
+        index, test_case = item
+        response_source, response_new = self._pipeline._exetute_requests(
+            test_case.get_source(), test_case.get_new()
+        )
+        return index, test_case, response_source, response_new
+
+    def _decode_and_submit(self, item: tuple, diff_executor: Executor | None) -> tuple:
+        index, test_case, response_source, response_new = item
+        decoded_case = self._pipeline.decode_case(
+            test_case.get_source(),
+            test_case.get_new(),
+            response_source,
+            response_new,
+            test_case.get_test_path_json(),
+            test_case.get_case_id(),
+        )
+
+        if diff_executor is not None:
+            return index, diff_executor.submit(_compare_in_worker, decoded_case)
+
+        future: Future = Future()
+        future.set_result(self._pipeline.compare_decoded_case(decoded_case))
+        return index, future
+
+    def _create_diff_executor(self, diff_processes: int) -> Executor | None:
+        if diff_processes == 0:
+            return None
+        # spawn: los threads de las otras etapas ya están corriendo y un fork
+        # desde un proceso con threads puede quedar bloqueado.
+        return ProcessPoolExecutor(
+            max_workers=diff_processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_diff_worker,
+            initargs=(self._pipeline,),
+        )
+
+    def _get_diff_processes(self) -> int:
+        value = self._diff_processes
+        if value is None:
+            configured = self._settings.get_properties(DIFF_PROCESSES)
+            value = int(configured) if configured is not None else os.cpu_count() or 1
+        if value < 0:
+            raise ValueError("diff_processes must be 0 or greater")
+        return value
+
+    def _get_stage_size(self, value: int | None, key: str, default: int) -> int:
+        if value is None:
+            configured = self._settings.get_properties(key)
+            value = int(configured) if configured is not None else default
+        if value < 1:
+            raise ValueError(f"{key} must be greater than 0")
+        return value
+
+    def _add_stage_time(self, stage: str, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        with self._stage_lock:
+            self._stage_seconds[stage] = self._stage_seconds.get(stage, 0.0) + elapsed
+
+    @staticmethod
+    def _put(target: queue.Queue, item: Any, stop: threading.Event) -> bool:
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
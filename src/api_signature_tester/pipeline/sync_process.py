@@ -1,13 +1,35 @@
 import logging
+import os
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 
-from api_signature_tester.config import Settings
+from api_signature_tester.config import (
+    JOURNAL_PATH,
+    REPORT_HTML_MODE,
+    REPORT_HTML_SIDE_FILES,
+    REPORT_SQLITE_PATH,
+    REPORT_STREAMING,
+    SHARD_OUTPUT_DIR,
+    Settings,
+)
 from api_signature_tester.etl.etl_csv import LoaderCsv
-from api_signature_tester.etl.etl_source_data import ETLDataProcess, ETLProccess
-from api_signature_tester.report.html_report_genetaror import HTMLReportGenerator
+from api_signature_tester.etl.etl_source_data import ETLProccess, TestCaseSource
+from api_signature_tester.etl.sampling import SamplingPlan, StratifiedSampler
+from api_signature_tester.etl.shard import Shard
+from api_signature_tester.report.html_paged_report import create_html_report_writer
+from api_signature_tester.report.html_report_genetaror import HTMLReportWriter
+from api_signature_tester.report.incremental_report_writer import (
+    IncrementalReportWriter,
+    share_default_summaries,
+)
 from api_signature_tester.report.markdown_report_generator import (
-    MarkdownReportGenerator,
+    MarkdownReportWriter,
 )
+from api_signature_tester.report.reporter import ReportWriter
+from api_signature_tester.report.result_journal import ResultJournal
+from api_signature_tester.report.result_merge import merge_partial_reports
+from api_signature_tester.report.sampling_summary import SamplingSummary
+from api_signature_tester.report.sqlite_report_writer import SqliteReportWriter
 from api_signature_tester.validator.pipeline_api_validaror import PipelineApiValidaror
 from api_signature_tester.validator.validator_model import TestEndpointModel, TestResult
 
@@ -21,27 +43,155 @@ class ApiSignatureTesterSynch(ABC):
         input_csv_path: str | None = None,
         input_md_report_path: str | None = None,
         input_html_report_path: str | None = None,
+        shard: Shard | None = None,
+        input_journal_path: str | None = None,
+        resume: bool = False,
+        sampler: StratifiedSampler | None = None,
     ):
+        """
+        :param shard: porción de la entrada a ejecutar. Un shard no genera los
+            reportes Markdown/HTML: su journal es el archivo parcial que se
+            combina con `result_merge.merge_partial_reports`.
+        :param input_journal_path: journal de resultados. Por defecto es
+            `<shard_output_dir>/results-<i>-of-<N>.jsonl` si hay shard o la
+            propiedad `journal_path`.
+        :param resume: conserva el journal existente y omite los casos que ya
+            tienen resultado.
+        :param sampler: ejecuta solo una muestra estratificada de los casos
+            y agrega a los reportes la tasa de fallos por estrato.
+        """
         self._pipeline = pipeline
         self._logger = logger
         self._settings = settings
         self._input_csv_path = input_csv_path
         self._input_md_report_path = input_md_report_path
         self._input_html_report_path = input_html_report_path
+        self._shard = shard
+        self._input_journal_path = input_journal_path
+        self._resume = resume
+        self._sampler = sampler
+        self._sampling_plan: SamplingPlan | None = None
 
     def execute(self):
         self._logger.info("Starting API Signature Tester...")
 
         test_cases = self.load_test_cases()
+        sampling_summary = self.create_sampling_summary()
         results_tests = []
+        report_writers = self.open_report_writers()
+        total_cases = 0
+        fast_path_cases = 0
 
-        for test_case in test_cases.get_rest_data():
-            results_tests.append(self.execute_test_case(test_case))
+        try:
+            for result in self.run_test_cases(test_cases):
+                total_cases += 1
+                if result.get_comparation_result().get_fast_path() is not None:
+                    fast_path_cases += 1
+                if sampling_summary is not None:
+                    sampling_summary.append(result)
+                if report_writers:
+                    for report_writer in report_writers:
+                        report_writer.append(result)
+                else:
+                    results_tests.append(result)
+            self.log_load_errors(test_cases)
+            self.log_pipeline_stats()
+            self._logger.info(
+                f"Fast path: {fast_path_cases} of {total_cases} cases skipped the"
+                " full body diff"
+            )
+            if sampling_summary is not None:
+                self.log_sampling_result(sampling_summary)
+        finally:
+            self._pipeline.close()
+            for report_writer in report_writers:
+                report_writer.close()
 
-        self.generate_report(results_tests)
+        journal_path = self.get_journal_path()
+        if journal_path is not None:
+            if self._shard is None:
+                self.generate_report_from_journal(journal_path)
+        elif not report_writers:
+            self.generate_report(results_tests)
 
         self._logger.info("API Signature Tester finished.")
 
+    def run_test_cases(self, test_cases: TestCaseSource) -> Iterator[TestResult]:
+        """
+        Ejecuta los casos de prueba y devuelve los resultados en el mismo orden
+        en que fueron cargados. Los motores concurrentes sobrescriben este método.
+        """
+        for test_case in test_cases.get_rest_data():
+            yield self.execute_test_case(test_case)
+
+    def open_report_writers(self) -> list[ReportWriter]:
+        """
+        Reportes incrementales a los que se envía cada resultado apenas se
+        compara. Si la lista está vacía, los resultados se acumulan y se
+        reportan al final con `generate_report`.
+        """
+        return []
+
+    def create_markdown_report_writer(self) -> MarkdownReportWriter:
+        writer = MarkdownReportWriter()
+        self.add_sampling_summary(writer)
+        return writer
+
+    def create_html_report_writer(self) -> HTMLReportWriter:
+        """Writer del reporte HTML según `report_html_mode` (full o paged)."""
+        writer = create_html_report_writer(
+            self._settings.get_properties(REPORT_HTML_MODE),
+            bool(self._settings.get_properties(REPORT_HTML_SIDE_FILES)),
+        )
+        self.add_sampling_summary(writer)
+        return writer
+
+    def create_sampling_summary(self) -> SamplingSummary | None:
+        """Resumen por estrato si la ejecución es por muestreo."""
+        if self._sampling_plan is None:
+            return None
+        return SamplingSummary(self._sampling_plan)
+
+    def add_sampling_summary(self, writer: IncrementalReportWriter) -> None:
+        sampling_summary = self.create_sampling_summary()
+        if sampling_summary is not None:
+            writer.add_summary(sampling_summary)
+
+    def get_extra_report_writers(self) -> list[tuple[ReportWriter, str]]:
+        """
+        Reportes adicionales (writer, archivo de salida) según la
+        configuración: la base SQLite de `report_sqlite_path`.
+        """
+        sqlite_path = self._settings.get_properties(REPORT_SQLITE_PATH)
+        if not sqlite_path:
+            return []
+        return [(SqliteReportWriter(), str(sqlite_path))]
+
+    def log_load_errors(self, test_cases: TestCaseSource) -> None:
+        for error in test_cases.get_load_errors():
+            self._logger.warning(error)
+
+    def log_sampling_result(self, sampling_summary: SamplingSummary) -> None:
+        estimate = sampling_summary.get_failure_rate()
+        if estimate is None:
+            return
+        rate, low, high = estimate
+        self._logger.info(
+            f"Sampling: estimated failure rate {rate:.1%} "
+            f"(95% CI {low:.1%} - {high:.1%})"
+        )
+
+    def log_pipeline_stats(self) -> None:
+        pool_stats = self._pipeline.get_pool_stats()
+        if pool_stats is not None:
+            self._logger.info(f"HTTP connection pool: {pool_stats}")
+        self._logger.info(
+            f"JSON decoder: {self._pipeline.get_json_decoder().get_name()}"
+        )
+        scheduler = self._pipeline.get_scheduler()
+        if scheduler is not None:
+            self._logger.info(f"Host scheduler: {scheduler}")
+
     def get_input_csv_path(self) -> str:
         return str(
             self._input_csv_path
@@ -63,8 +213,47 @@ class ApiSignatureTesterSynch(ABC):
             else self._settings.get_properties("report_html_path")
         )
 
+    def get_shard(self) -> Shard | None:
+        return self._shard
+
+    def get_sampling_plan(self) -> SamplingPlan | None:
+        """Muestra elegida al cargar los casos o None si se ejecutan todos."""
+        return self._sampling_plan
+
+    def get_journal_path(self) -> str | None:
+        """Journal de resultados o None si la ejecución no usa journal."""
+        if self._input_journal_path is not None:
+            return self._input_journal_path
+        if self._shard is None:
+            journal_path = self._settings.get_properties(JOURNAL_PATH)
+            return str(journal_path) if journal_path else None
+        output_dir = self._settings.get_properties(SHARD_OUTPUT_DIR) or "."
+        return os.path.join(
+            str(output_dir),
+            f"results-{self._shard.get_index() + 1}-of-{self._shard.get_count()}.jsonl",
+        )
+
+    def is_resume(self) -> bool:
+        return self._resume
+
+    def generate_report_from_journal(self, journal_path: str) -> None:
+        """
+        Genera los reportes Markdown/HTML leyendo el journal, sin mantener
+        los resultados en memoria. Incluye los casos de ejecuciones previas
+        retomadas con `resume`.
+        """
+        total = merge_partial_reports(
+            [journal_path],
+            self.get_input_md_report_path(),
+            self.get_input_html_report_path(),
+            self.create_html_report_writer(),
+            self.get_extra_report_writers(),
+            self.create_markdown_report_writer(),
+        )
+        self._logger.info(f"Reports generated from {total} cases in {journal_path}")
+
     @abstractmethod
-    def load_test_cases(self) -> ETLDataProcess:
+    def load_test_cases(self) -> TestCaseSource:
         pass
 
     @abstractmethod
@@ -91,6 +280,10 @@ class ApiSignatureTesterSynchBase(ApiSignatureTesterSynch):
         input_csv_path: str | None = None,
         input_md_report_path: str | None = None,
         input_html_report_path: str | None = None,
+        shard: Shard | None = None,
+        input_journal_path: str | None = None,
+        resume: bool = False,
+        sampler: StratifiedSampler | None = None,
     ):
         super().__init__(
             pipeline,
@@ -99,9 +292,13 @@ class ApiSignatureTesterSynchBase(ApiSignatureTesterSynch):
             input_csv_path,
             input_md_report_path,
             input_html_report_path,
+            shard,
+            input_journal_path,
+            resume,
+            sampler,
         )
 
-    def load_test_cases(self) -> ETLDataProcess:
+    def load_test_cases(self) -> TestCaseSource:
         csv_path_value = self.get_input_csv_path()
 
         if not isinstance(csv_path_value, str):
@@ -109,10 +306,59 @@ class ApiSignatureTesterSynchBase(ApiSignatureTesterSynch):
         csv_path: str = csv_path_value
 
         etl: ETLProccess = LoaderCsv()
-        return etl.load_data(csv_path)
+        if self._shard is not None:
+            self._logger.info(f"Running shard {self._shard}")
+
+        completed_case_ids = None
+        journal_path = self.get_journal_path()
+        if self._resume and journal_path is not None:
+            completed_case_ids = ResultJournal.read_case_ids(journal_path)
+            self._logger.info(
+                f"Resuming: {len(completed_case_ids)} cases already in {journal_path}"
+            )
+
+        sampled_case_ids = None
+        if self._sampler is not None:
+            # Primera lectura del CSV: la muestra se elige sobre toda la
+            # entrada, así todos los shards y un resume usan el mismo plan
+            # (la semilla sin fijar también se deriva de la entrada)
+            self._sampling_plan = self._sampler.plan(
+                etl.stream_data(csv_path).get_rest_data()
+            )
+            sampled_case_ids = self._sampling_plan.get_case_ids()
+            self._logger.info(f"Sampling {self._sampling_plan}")
+        return etl.stream_data(
+            csv_path, self._shard, completed_case_ids, sampled_case_ids
+        )
 
     def execute_test_case(self, test_case: TestEndpointModel) -> TestResult:
-        return self._pipeline.execute(test_case.get_source(), test_case.get_new())
+        return self._pipeline.execute(
+            test_case.get_source(),
+            test_case.get_new(),
+            test_case.get_test_path_json(),
+            test_case.get_case_id(),
+        )
+
+    def open_report_writers(self) -> list[ReportWriter]:
+        journal_path = self.get_journal_path()
+        if journal_path is not None:
+            journal = ResultJournal(resume=self._resume)
+            journal.open(journal_path)
+            return [journal]
+
+        if not self._settings.get_properties(REPORT_STREAMING):
+            return []
+
+        md_writer = self.create_markdown_report_writer()
+        html_writer = self.create_html_report_writer()
+        share_default_summaries([md_writer, html_writer])
+        md_writer.open(self.get_input_md_report_path())
+        html_writer.open(self.get_input_html_report_path())
+        report_writers: list[ReportWriter] = [md_writer, html_writer]
+        for writer, output_file in self.get_extra_report_writers():
+            writer.open(output_file)
+            report_writers.append(writer)
+        return report_writers
 
     def generate_report(self, results_tests):
         md_path_value = self.get_input_md_report_path()
@@ -126,7 +372,17 @@ class ApiSignatureTesterSynchBase(ApiSignatureTesterSynch):
         md_path: str = md_path_value
         html_path: str = html_path_value
 
-        reportGenerator = MarkdownReportGenerator()
-        reportGenerator.generate(results_tests, md_path)
-        re = HTMLReportGenerator()
-        re.generate(results_tests, html_path)
+        writers: list[tuple[ReportWriter, str]] = [
+            (self.create_markdown_report_writer(), md_path),
+            (self.create_html_report_writer(), html_path),
+            *self.get_extra_report_writers(),
+        ]
+        # El writer Markdown calcula los resúmenes que muestran ambos
+        share_default_summaries(writer for writer, _ in writers)
+        for writer, output_file in writers:
+            writer.open(output_file)
+            try:
+                for test_result in results_tests:
+                    writer.append(test_result)
+            finally:
+                writer.close()
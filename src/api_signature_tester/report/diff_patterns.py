@@ -0,0 +1,141 @@
+from api_signature_tester.validator.array_rules import path_pattern
+
+"""
+Agregación de las diferencias de todos los casos por patrón: tipo de diff y
+ruta con los índices de array reemplazados por `[*]`.
+"""
+
+STATUS_CODE_DIFF = "Status code"
+
+
+class DiffPattern:
+    """Un patrón de diferencia con sus contadores y algunos casos de ejemplo."""
+
+    def __init__(self, diff_type: str, path: str):
+        self._diff_type = diff_type
+        self._path = path
+        self._cases = 0
+        self._occurrences = 0
+        self._sample_case_ids: list[int] = []
+
+    def get_diff_type(self) -> str:
+        return self._diff_type
+
+    def get_path(self) -> str:
+        return self._path
+
+    def get_cases(self) -> int:
+        """Casos con al menos una diferencia de este patrón."""
+        return self._cases
+
+    def get_occurrences(self) -> int:
+        """Diferencias de este patrón, contando todas las de cada caso."""
+        return self._occurrences
+
+    def get_sample_case_ids(self) -> list[int]:
+        """Los primeros casos en que apareció el patrón."""
+        return self._sample_case_ids
+
+    def add_case(self, case_id: int, occurrences: int, max_samples: int) -> None:
+        self._cases += 1
+        self._occurrences += occurrences
+        if len(self._sample_case_ids) < max_samples:
+            self._sample_case_ids.append(case_id)
+
+
+class DiffPatternSummary:
+    """
+    Patrones de diferencias más frecuentes de la ejecución (`ReportSummary`).
+    Se calcula caso a caso: la memoria depende de la cantidad de patrones
+    distintos y no de la de casos. Si un renombre de campo aparece en 100k
+    casos como `root['data'][N]['campo']`, el resumen tiene una sola fila.
+
+    Los status codes distintos también se agrupan (`STATUS_CODE_DIFF`, con
+    `old -> new` como ruta).
+    """
+
+    def __init__(self, top: int = 20, max_samples: int = 5, max_patterns: int = 10000):
+        """
+        :param top: patrones que se muestran, ordenados por cantidad de casos.
+        :param max_samples: IDs de casos de ejemplo guardados por patrón.
+        :param max_patterns: patrones distintos que se guardan. Los que
+            aparecen después de alcanzar el límite solo se cuentan.
+        """
+        if top < 1 or max_patterns < 1:
+            raise ValueError("top y max_patterns deben ser mayores que 0")
+        self._top = top
+        self._max_samples = max_samples
+        self._max_patterns = max_patterns
+        self._patterns: dict[tuple[str, str], DiffPattern] = {}
+        self._appended = 0
+        self._untracked_occurrences = 0
+
+    def append(self, test_result) -> None:
+        case_id = test_result.get_case_id()
+        if case_id is None:
+            case_id = self._appended
+        self._appended += 1
+
+        comparation_result = test_result.get_comparation_result()
+        occurrences: dict[tuple[str, str], int] = {}
+        status_code = comparation_result.get_diff_status_code().get("status_code")
+        if status_code:
+            key = (
+                STATUS_CODE_DIFF,
+                f"{status_code.get('old_value')} -> {status_code.get('new_value')}",
+            )
+            occurrences[key] = 1
+        for diff in comparation_result.get_diff_body():
+            key = (str(diff.get("Tipo", "")), path_pattern(str(diff.get("Ruta", ""))))
+            occurrences[key] = occurrences.get(key, 0) + 1
+
+        for key, count in occurrences.items():
+            pattern = self._patterns.get(key)
+            if pattern is None:
+                if len(self._patterns) >= self._max_patterns:
+                    self._untracked_occurrences += count
+                    continue
+                pattern = self._patterns[key] = DiffPattern(*key)
+            pattern.add_case(case_id, count, self._max_samples)
+
+    def get_patterns(self) -> list[DiffPattern]:
+        """Todos los patrones, de más a menos casos (y ocurrencias)."""
+        return sorted(
+            self._patterns.values(),
+            key=lambda p: (-p.get_cases(), -p.get_occurrences(), p.get_path()),
+        )
+
+    def get_untracked_occurrences(self) -> int:
+        """Diferencias de patrones descartados por `max_patterns`."""
+        return self._untracked_occurrences
+
+    def get_title(self) -> str:
+        return "Patrones de diferencias más frecuentes"
+
+    def get_headers(self) -> list[str]:
+        return ["Tipo", "Ruta", "Casos", "Ocurrencias", "Casos de ejemplo"]
+
+    def get_rows(self) -> list[list[str]]:
+        patterns = self.get_patterns()
+        rows = [
+            [
+                pattern.get_diff_type(),
+                pattern.get_path(),
+                str(pattern.get_cases()),
+                str(pattern.get_occurrences()),
+                ", ".join(str(case_id) for case_id in pattern.get_sample_case_ids()),
+            ]
+            for pattern in patterns[: self._top]
+        ]
+        others = patterns[self._top :]
+        if others or self._untracked_occurrences:
+            occurrences = self._untracked_occurrences + sum(
+                pattern.get_occurrences() for pattern in others
+            )
+            label = (
+                "(otros patrones)"
+                if self._untracked_occurrences
+                else f"(otros {len(others)} patrones)"
+            )
+            rows.append(["", label, "", str(occurrences), ""])
+        return rows
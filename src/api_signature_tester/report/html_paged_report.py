@@ -0,0 +1,331 @@
+import json
+import os
+from typing import Any
+
+from api_signature_tester.report.html_report_genetaror import HTMLReportWriter
+from api_signature_tester.report.metrics_summary import (
+    CASE_METRICS_HEADERS,
+    format_latency_diff,
+    format_ms,
+    get_case_metrics_rows,
+)
+
+"""
+Reporte HTML para ejecuciones con muchos casos: los casos se guardan como
+JSON compacto y una vista en el navegador los muestra con scroll virtual,
+filtros y paginación, sin un bloque HTML por caso.
+"""
+
+HTML_MODE_FULL = "full"
+HTML_MODE_PAGED = "paged"
+
+PAGED_STYLE = """
+    <style>
+        body { max-width: 1200px; }
+        #filter-bar input {
+            padding: 8px;
+            border: 1px solid #ccc;
+            border-radius: 6px;
+            min-width: 280px;
+        }
+        #case-list {
+            height: 60vh;
+            overflow-y: auto;
+            border: 1px solid #ddd;
+            border-radius: 8px;
+            background: #fff;
+        }
+        #case-spacer { position: relative; }
+        #case-rows { position: absolute; top: 0; left: 0; right: 0; }
+        .case-row {
+            height: 32px;
+            line-height: 32px;
+            padding: 0 12px;
+            white-space: nowrap;
+            overflow: hidden;
+            text-overflow: ellipsis;
+            cursor: pointer;
+            border-bottom: 1px solid #f0f0f0;
+        }
+        .case-row:hover, .case-row.selected { background: #e3f2fd; }
+        #case-detail { margin-top: 20px; }
+        #case-detail td { word-break: break-all; }
+        .pager { text-align: center; margin: 10px 0; }
+        .pager button { margin: 0 6px; }
+    </style>
+"""
+
+PAGED_BODY = """
+    <div id="filter-bar">
+        <button id="btn-all">🔁 Ver Todos</button>
+        <button id="btn-passed">✅ Solo Éxitos</button>
+        <button id="btn-failed">❌ Solo Errores</button>
+        <input id="case-search" type="search" placeholder="Filtrar por URL o ruta">
+    </div>
+    <p class="info" id="case-count"></p>
+    <div id="case-list"><div id="case-spacer"><div id="case-rows"></div></div></div>
+    <div id="case-detail"></div>
+"""
+
+# Vista de los casos. Cada caso es un array (ver `case_to_record`); el texto
+# se asigna con textContent, así los valores no se interpretan como HTML.
+PAGED_SCRIPT = """
+    <script>
+    const REPORT = {
+        cases: [],
+        add(chunk) { for (const c of chunk) this.cases.push(c); },
+    };
+    document.addEventListener('DOMContentLoaded', () => {
+        const ROW_HEIGHT = 32, DIFFS_PER_PAGE = 100;
+        const METRICS_HEADERS = %(metrics_headers)s;
+        const list = document.getElementById('case-list');
+        const rows = document.getElementById('case-rows');
+        const detail = document.getElementById('case-detail');
+        let filter = 'all', query = '', view = [], selected = -1;
+
+        function el(tag, text, cls) {
+            const node = document.createElement(tag);
+            if (text !== undefined) node.textContent = text;
+            if (cls) node.className = cls;
+            return node;
+        }
+        function show(value) {
+            return typeof value === 'string' ? value : JSON.stringify(value);
+        }
+        function table(headers, data) {
+            const t = el('table'), head = el('tr');
+            headers.forEach(h => head.appendChild(el('th', h)));
+            t.appendChild(head);
+            data.forEach(row => {
+                const tr = el('tr');
+                row.forEach(cell => tr.appendChild(el('td', show(cell))));
+                t.appendChild(tr);
+            });
+            return t;
+        }
+        function title(c) {
+            return '#' + c[0] + ' ' + (c[2] ? '✅' : '❌');
+        }
+        function matches(c) {
+            if (filter === 'passed' && !c[2]) return false;
+            if (filter === 'failed' && c[2]) return false;
+            if (!query) return true;
+            return c[4].toLowerCase().includes(query)
+                || c[5].toLowerCase().includes(query)
+                || c[8].some(d => d[1].toLowerCase().includes(query));
+        }
+        function applyFilter() {
+            view = [];
+            REPORT.cases.forEach((c, i) => { if (matches(c)) view.push(i); });
+            const spacer = document.getElementById('case-spacer');
+            spacer.style.height = (view.length * ROW_HEIGHT) + 'px';
+            document.getElementById('case-count').textContent =
+                view.length + ' de ' + REPORT.cases.length + ' casos';
+            list.scrollTop = 0;
+            renderRows();
+        }
+        function renderRows() {
+            const first = Math.floor(list.scrollTop / ROW_HEIGHT);
+            const visible = Math.ceil(list.clientHeight / ROW_HEIGHT) + 1;
+            const last = Math.min(view.length, first + visible);
+            const nodes = [];
+            for (let i = first; i < last; i++) {
+                const index = view[i], c = REPORT.cases[index];
+                const row = el('div', title(c) + ' ' + c[3] + ' ' + c[4],
+                    'case-row' + (index === selected ? ' selected' : ''));
+                row.addEventListener('click', () => showCase(index, 0));
+                nodes.push(row);
+            }
+            rows.style.transform = 'translateY(' + (first * ROW_HEIGHT) + 'px)';
+            rows.replaceChildren(...nodes);
+        }
+        function showCase(index, page) {
+            selected = index;
+            renderRows();
+            const c = REPORT.cases[index];
+            const nodes = [el('h2', 'Comparación ' + title(c))];
+            if (c[1] !== null) nodes.push(el('p', 'Caso: ' + c[1]));
+            nodes.push(el('p', 'Source URL: ' + c[4]), el('p', 'New URL: ' + c[5]),
+                el('p', 'Método: ' + c[3]),
+                el('p', 'Status Code Diff: ' + (c[6] || 'Sin diferencias')));
+            if (c[7]) nodes.push(el('p', 'Regresión de latencia: ' + c[7]));
+            const diffs = c[8];
+            if (diffs.length) {
+                const pages = Math.ceil(diffs.length / DIFFS_PER_PAGE);
+                const start = page * DIFFS_PER_PAGE;
+                nodes.push(el('p', 'Diferencias en Body: ' + diffs.length));
+                nodes.push(table(['Tipo', 'Ruta', 'Valor Anterior', 'Valor Nuevo'],
+                    diffs.slice(start, start + DIFFS_PER_PAGE)));
+                if (pages > 1) {
+                    const pager = el('div', undefined, 'pager');
+                    const prev = el('button', '◀'), next = el('button', '▶');
+                    prev.disabled = page === 0;
+                    next.disabled = page === pages - 1;
+                    prev.addEventListener('click', () => showCase(index, page - 1));
+                    next.addEventListener('click', () => showCase(index, page + 1));
+                    const label = el('span', 'Página ' + (page + 1) + ' de ' + pages);
+                    pager.append(prev, label, next);
+                    nodes.push(pager);
+                }
+            } else {
+                nodes.push(el('p', 'Diferencias en Body: Sin diferencias'));
+            }
+            if (c[9]) {
+                nodes.push(el('p', 'Métricas:'), table(METRICS_HEADERS, c[9]));
+                nodes.push(el('p', c[10], 'info'));
+            }
+            detail.replaceChildren(...nodes);
+        }
+
+        list.addEventListener('scroll', () => requestAnimationFrame(renderRows));
+        for (const value of ['all', 'passed', 'failed']) {
+            document.getElementById('btn-' + value).addEventListener('click', () => {
+                filter = value;
+                applyFilter();
+            });
+        }
+        document.getElementById('case-search').addEventListener('input', event => {
+            query = event.target.value.trim().toLowerCase();
+            applyFilter();
+        });
+        applyFilter();
+    });
+    </script>
+"""
+
+
+class PagedHTMLReportWriter(HTMLReportWriter):
+    """
+    Reporte HTML escalable. Los casos se acumulan en bloques de
+    `chunk_size` que se escriben como JSON (`REPORT.add([...])`), dentro del
+    HTML o en archivos `.js` aparte (`side_files`). El navegador solo crea
+    los elementos de las filas visibles, así el reporte abre con cualquier
+    cantidad de casos. Totales y resúmenes son los de `HTMLReportWriter`.
+    """
+
+    CHUNK_SIZE = 500
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE, side_files: bool = False):
+        """
+        :param side_files: escribe cada bloque en
+            `<reporte>_data/cases-NNNNN.js` (al lado del HTML) en lugar de
+            incluirlo en el HTML.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size debe ser mayor que 0")
+        super().__init__()
+        self._chunk_size = chunk_size
+        self._side_files = side_files
+        self._chunk: list[str] = []
+        self._chunk_count = 0
+        self._data_dir = ""
+
+    def open(self, output_file: str) -> None:
+        self._chunk = []
+        self._chunk_count = 0
+        if self._side_files:
+            self._data_dir = os.path.splitext(output_file)[0] + "_data"
+            os.makedirs(self._data_dir, exist_ok=True)
+        super().open(output_file)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._write(self._flush_chunk())
+        super().close()
+
+    def render_header(self, date: str) -> list[str]:
+        header = super().render_header(date)
+        return [header[0].replace("</head>", PAGED_STYLE + "</head>"), *header[1:]]
+
+    def render_after_totals(self) -> list[str]:
+        return [
+            PAGED_BODY,
+            PAGED_SCRIPT % {"metrics_headers": _to_json(CASE_METRICS_HEADERS)},
+        ]
+
+    def render_case(self, index: int, test_result) -> list[str]:
+        self._chunk.append(_to_json(case_to_record(index, test_result)))
+        if len(self._chunk) >= self._chunk_size:
+            return self._flush_chunk()
+        return []
+
+    def render_footer(self) -> list[str]:
+        return ["</body></html>"]
+
+    def _flush_chunk(self) -> list[str]:
+        if not self._chunk:
+            return []
+        script = "REPORT.add([" + ",".join(self._chunk) + "]);"
+        self._chunk = []
+        self._chunk_count += 1
+        if not self._side_files:
+            return [f"<script>{script}</script>"]
+
+        name = f"cases-{self._chunk_count:05d}.js"
+        with open(os.path.join(self._data_dir, name), "w", encoding="utf-8") as f:
+            f.write(script + "\n")
+        return [f'<script src="{os.path.basename(self._data_dir)}/{name}"></script>']
+
+
+def case_to_record(index: int, test_result) -> list[Any]:
+    """
+    Caso como array compacto: [índice, case_id, es_igual (1/0), método,
+    source URL, new URL, diff de status, regresión de latencia, diffs del body
+    ([tipo, ruta, valor anterior, valor nuevo]), filas de métricas o None,
+    tiempos de decode/diff].
+    """
+    comparation_result = test_result.get_comparation_result()
+    status_code = comparation_result.get_diff_status_code().get("status_code")
+    diff_latency = comparation_result.get_diff_latency()
+    metrics = test_result.get_metrics()
+    return [
+        index,
+        test_result.get_case_id(),
+        1 if comparation_result.is_equal() else 0,
+        test_result.get_source().get_method(),
+        test_result.get_source().get_url(),
+        test_result.get_new().get_url(),
+        (
+            f"{status_code.get('old_value')} -> {status_code.get('new_value')}"
+            if status_code
+            else ""
+        ),
+        format_latency_diff(diff_latency) if diff_latency else "",
+        [
+            [
+                str(diff.get("Tipo", "")),
+                str(diff.get("Ruta", "")),
+                diff.get("Valor anterior", ""),
+                diff.get("Valor nuevo", ""),
+            ]
+            for diff in comparation_result.get_diff_body()
+        ],
+        None if metrics is None else get_case_metrics_rows(metrics),
+        (
+            ""
+            if metrics is None
+            else f"Decode: {format_ms(metrics.get_decode_ms())} "
+            f"| Diff: {format_ms(metrics.get_diff_ms())}"
+        ),
+    ]
+
+
+def create_html_report_writer(
+    mode: str | None = None, side_files: bool = False
+) -> HTMLReportWriter:
+    """
+    :param mode: HTML_MODE_FULL (un bloque por caso, por defecto) o
+        HTML_MODE_PAGED (`PagedHTMLReportWriter`).
+    """
+    if mode is None or mode == HTML_MODE_FULL:
+        return HTMLReportWriter()
+    if mode == HTML_MODE_PAGED:
+        return PagedHTMLReportWriter(side_files=side_files)
+    raise ValueError(f"Modo de reporte HTML desconocido: {mode}")
+
+
+def _to_json(value: Any) -> str:
+    # "</" se escapa para que un valor no cierre el <script> que lo contiene
+    return json.dumps(
+        value, ensure_ascii=False, separators=(",", ":"), default=str
+    ).replace("</", "<\\/")
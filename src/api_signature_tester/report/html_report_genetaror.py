@@ -1,28 +1,17 @@
-from datetime import datetime
+from api_signature_tester.report.incremental_report_writer import (
+    IncrementalReportWriter,
+)
+from api_signature_tester.report.metrics_summary import (
+    CASE_METRICS_HEADERS,
+    format_latency_diff,
+    format_ms,
+    get_case_metrics_rows,
+)
+from api_signature_tester.report.reporter import ReportSummary
 
 """Generador de reportes en formato HTML."""
 
-
-class HTMLReportGenerator:
-    def generate(
-        self, test_results: list, output_file: str = "reports/report.html"
-    ) -> None:
-        """
-        Genera un reporte en formato HTML con resultados colapsables y filtrables.
-        Args:
-            test_results (List): Lista de resultados de las pruebas.
-            output_file (str): Ruta del archivo de salida.
-        Returns:
-            None
-        """
-
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        total = len(test_results)
-        passed = sum(1 for tr in test_results if tr.get_comparation_result().is_equal())
-        failed = total - passed
-
-        html = [
-            """
+HTML_HEAD = """
     <!DOCTYPE html>
     <html lang="es">
     <head>
@@ -133,98 +122,168 @@ class HTMLReportGenerator:
     </head>
     <body>
     """
+
+
+class HTMLReportGenerator:
+    def generate(
+        self, test_results: list, output_file: str = "reports/report.html"
+    ) -> None:
+        """
+        Genera un reporte en formato HTML con resultados colapsables y filtrables.
+        Args:
+            test_results (List): Lista de resultados de las pruebas.
+            output_file (str): Ruta del archivo de salida.
+        Returns:
+            None
+        """
+        writer = HTMLReportWriter()
+        writer.open(output_file)
+        try:
+            for test_result in test_results:
+                writer.append(test_result)
+        finally:
+            writer.close()
+
+
+class HTMLReportWriter(IncrementalReportWriter):
+    """Reporte HTML que se escribe caso a caso (open/append/close)."""
+
+    def render_header(self, date: str) -> list[str]:
+        return [
+            HTML_HEAD,
+            "<h1>Reporte de Comparaciones</h1>",
+            f"<p class='info'>Fecha de ejecución: {date}</p>",
         ]
 
-        html.append("<h1>Reporte de Comparaciones</h1>")
-        html.append(f"<p class='info'>Fecha de ejecución: {now}</p>")
-        html.append(
+    def render_totals(
+        self, total: int, passed: int, failed: int, fast_path: int
+    ) -> list[str]:
+        return [
             f"<p class='info'>Total de casos: {total} | ✅ {passed} exitosos "
-            + f"| ❌ {failed} con diferencias</p>"
-        )
+            + f"| ❌ {failed} con diferencias</p>",
+            f"<p class='info'>⚡ {fast_path} resueltos por fast path</p>",
+        ]
 
+    def render_after_totals(self) -> list[str]:
         # Barra de filtro
-        html.append("""
+        return [
+            """
         <div id="filter-bar">
             <button id="btn-all">🔁 Ver Todos</button>
             <button id="btn-passed">✅ Solo Éxitos</button>
             <button id="btn-failed">❌ Solo Errores</button>
         </div>
-        """)
+        """
+        ]
 
-        # Casos
-        for i, test_result in enumerate(test_results, start=1):
-            comp_result = test_result.get_comparation_result()
-            source = test_result.get_source()
-            new = test_result.get_new()
-            are_equal = comp_result.is_equal()
-            diff_status = comp_result.get_diff_status_code()
-            diff_body = comp_result.get_diff_body()
+    def render_case(self, index: int, test_result) -> list[str]:
+        html: list[str] = []
+        comp_result = test_result.get_comparation_result()
+        source = test_result.get_source()
+        new = test_result.get_new()
+        are_equal = comp_result.is_equal()
+        diff_status = comp_result.get_diff_status_code()
+        diff_body = comp_result.get_diff_body()
 
-            status_class = "success" if are_equal else "fail"
-            symbol = "✅" if are_equal else "❌"
+        status_class = "success" if are_equal else "fail"
+        symbol = "✅" if are_equal else "❌"
 
+        html.append(
+            f"<details class='case {status_class}' id='caso{index}'>"
+            + f"<summary>{symbol} Caso {index}</summary>"
+        )
+        html.append("<div>")
+        html.append(f"<p><strong>Source URL:</strong> {source.get_url()}</p>")
+        html.append(f"<p><strong>New URL:</strong> {new.get_url()}</p>")
+        html.append(f"<p><strong>Método:</strong> {source.get_method()}</p>")
+
+        # Status Code
+        if diff_status:
+            html.append("<p><strong>Diferencias en Status Code:</strong></p>")
+            html.append(f"<pre>{diff_status}</pre>")
+        else:
             html.append(
-                f"<details class='case {status_class}' id='caso{i}'>"
-                + f"<summary>{symbol} Caso {i}</summary>"
+                "<p><strong>Diferencias en Status Code:"
+                + "</strong> Sin diferencias</p>"
+            )
+
+        # Latencia
+        diff_latency = comp_result.get_diff_latency()
+        if diff_latency:
+            html.append(
+                "<p><strong>Regresión de latencia:</strong> "
+                + f"{format_latency_diff(diff_latency)}</p>"
             )
-            html.append("<div>")
-            html.append(f"<p><strong>Source URL:</strong> {source.get_url()}</p>")
-            html.append(f"<p><strong>New URL:</strong> {new.get_url()}</p>")
-            html.append(f"<p><strong>Método:</strong> {source.get_method()}</p>")
-
-            # Status Code
-            if diff_status:
-                html.append("<p><strong>Diferencias en Status Code:</strong></p>")
-                html.append(f"<pre>{diff_status}</pre>")
-            else:
-                html.append(
-                    "<p><strong>Diferencias en Status Code:"
-                    + "</strong> Sin diferencias</p>"
-                )
 
-            # Body
-            if diff_body:
-                html.append("<p><strong>Diferencias en Body:</strong></p>")
+        # Body
+        if diff_body:
+            html.append("<p><strong>Diferencias en Body:</strong></p>")
+            html.append(
+                "<table><tr><th>Tipo</th><th>Ruta</th>"
+                + "<th>Valor Anterior</th><th>Valor Nuevo</th></tr>"
+            )
+            for diff in diff_body:
+                tipo = diff.get("Tipo", "")
+                path = diff.get("Ruta", "")
+                old = diff.get("Valor anterior", "")
+                newv = diff.get("Valor nuevo", "")
                 html.append(
-                    "<table><tr><th>Tipo</th><th>Ruta</th>"
-                    + "<th>Valor Anterior</th><th>Valor Nuevo</th></tr>"
+                    f"<tr><td>{tipo}</td><td>{path}</td><td>{old}</td><td>{newv}</td></tr>"
                 )
-                for diff in diff_body:
-                    tipo = diff.get("Tipo", "")
-                    path = diff.get("Ruta", "")
-                    old = diff.get("Valor anterior", "")
-                    newv = diff.get("Valor nuevo", "")
-                    html.append(
-                        f"<tr><td>{tipo}</td><td>{path}</td><td>{old}</td><td>{newv}</td></tr>"
-                    )
-                html.append("</table>")
-            else:
+            html.append("</table>")
+        else:
+            html.append("<p><strong>Diferencias en Body:</strong> Sin diferencias</p>")
+
+        metrics = test_result.get_metrics()
+        if metrics is not None:
+            html.append("<p><strong>Métricas:</strong></p>")
+            html.append(
+                "<table><tr>"
+                + "".join(f"<th>{header}</th>" for header in CASE_METRICS_HEADERS)
+                + "</tr>"
+            )
+            for row in get_case_metrics_rows(metrics):
                 html.append(
-                    "<p><strong>Diferencias en Body:</strong> Sin diferencias</p>"
+                    "<tr>" + "".join(f"<td>{cell}</td>" for cell in row) + "</tr>"
                 )
+            html.append("</table>")
+            html.append(
+                f"<p class='info'>Decode: {format_ms(metrics.get_decode_ms())} "
+                + f"| Diff: {format_ms(metrics.get_diff_ms())}</p>"
+            )
 
-            html.append("</div></details>")
+        html.append("</div></details>")
 
+        return html
+
+    def render_summary(self, summary: ReportSummary) -> list[str]:
+        html = [f"<h2>{summary.get_title()}</h2>", "<table><tr>"]
+        html.append("".join(f"<th>{header}</th>" for header in summary.get_headers()))
+        html.append("</tr>")
+        for row in summary.get_rows():
+            html.append("<tr>" + "".join(f"<td>{cell}</td>" for cell in row) + "</tr>")
+        html.append("</table>")
+        return html
+
+    def render_footer(self) -> list[str]:
         # Script JS
-        html.append("""
-    <script>
-    document.getElementById('btn-all').addEventListener('click', () => {
-        document.querySelectorAll('.case').forEach(el => el.style.display = '');
-    });
-    document.getElementById('btn-passed').addEventListener('click', () => {
-        document.querySelectorAll('.case').forEach(el => {
-            el.style.display = el.classList.contains('success') ? '' : 'none';
+        return [
+            """
+        <script>
+        document.getElementById('btn-all').addEventListener('click', () => {
+            document.querySelectorAll('.case').forEach(el => el.style.display = '');
         });
-    });
-    document.getElementById('btn-failed').addEventListener('click', () => {
-        document.querySelectorAll('.case').forEach(el => {
-            el.style.display = el.classList.contains('fail') ? '' : 'none';
+        document.getElementById('btn-passed').addEventListener('click', () => {
+            document.querySelectorAll('.case').forEach(el => {
+                el.style.display = el.classList.contains('success') ? '' : 'none';
+            });
         });
-    });
-    </script>
-    """)
-
-        html.append("</body></html>")
-
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write("\n".join(html))
+        document.getElementById('btn-failed').addEventListener('click', () => {
+            document.querySelectorAll('.case').forEach(el => {
+                el.style.display = el.classList.contains('fail') ? '' : 'none';
+            });
+        });
+        </script>
+        """,
+            "</body></html>",
+        ]
@@ -0,0 +1,179 @@
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from datetime import datetime
+from typing import BinaryIO
+
+from api_signature_tester.report.diff_patterns import DiffPatternSummary
+from api_signature_tester.report.metrics_summary import MetricsSummary
+from api_signature_tester.report.reporter import ReportSummary
+
+"""Base para generadores de reportes que escriben caso a caso."""
+
+
+class IncrementalReportWriter(ABC):
+    """
+    Escribe el reporte a medida que llegan los resultados:
+    - `open` escribe la cabecera y reserva un bloque de tamaño fijo para los
+      totales, que todavía no se conocen.
+    - `append` escribe el caso y hace flush, así un corte a mitad de la
+      ejecución conserva los casos ya comparados.
+    - `close` escribe los resúmenes de la ejecución (`create_summaries`), el
+      pie y sobrescribe el bloque reservado con los totales.
+    """
+
+    TOTALS_RESERVED_BYTES = 512
+
+    def __init__(self):
+        self._file: BinaryIO | None = None
+        self._totals_offset = 0
+        self._total = 0
+        self._passed = 0
+        self._fast_path = 0
+        self._summaries: list[ReportSummary] = []
+        self._fed_summaries: list[ReportSummary] = []
+        self._extra_summaries: list[ReportSummary] = []
+        self._shared_summaries: list[ReportSummary] | None = None
+        self._feeds_shared_summaries = True
+
+    def open(self, output_file: str) -> None:
+        directory = os.path.dirname(output_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._total = 0
+        self._passed = 0
+        self._fast_path = 0
+        summaries = (
+            self.create_summaries()
+            if self._shared_summaries is None
+            else self._shared_summaries
+        )
+        self._summaries = [*summaries, *self._extra_summaries]
+        self._fed_summaries = (
+            self._summaries
+            if self._feeds_shared_summaries
+            else list(self._extra_summaries)
+        )
+        self._file = open(output_file, "wb")  # noqa: SIM115
+        self._write(self.render_header(datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+        self._totals_offset = self._file.tell()
+        self._file.write(self._reserve(b""))
+        self._write(self.render_after_totals())
+        self._file.flush()
+
+    def append(self, test_result) -> None:
+        if self._file is None:
+            raise RuntimeError("El reporte no fue abierto")
+
+        comparation_result = test_result.get_comparation_result()
+        self._total += 1
+        if comparation_result.is_equal():
+            self._passed += 1
+        if comparation_result.get_fast_path() is not None:
+            self._fast_path += 1
+        for summary in self._fed_summaries:
+            summary.append(test_result)
+
+        self._write(self.render_case(self._total, test_result))
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+
+        for summary in self._summaries:
+            if summary.get_rows():
+                self._write(self.render_summary(summary))
+        self._write(self.render_footer())
+        self._file.seek(self._totals_offset)
+        totals = "\n".join(
+            self.render_totals(
+                self._total,
+                self._passed,
+                self._total - self._passed,
+                self._fast_path,
+            )
+        )
+        self._file.write(self._reserve(totals.encode("utf-8")))
+        self._file.close()
+        self._file = None
+
+    def _write(self, lines: list[str]) -> None:
+        if lines and self._file is not None:
+            self._file.write(("\n".join(lines) + "\n").encode("utf-8"))
+
+    def _reserve(self, content: bytes) -> bytes:
+        """
+        Completa `content` con un comentario HTML hasta ocupar exactamente
+        TOTALS_RESERVED_BYTES, para poder reescribirlo en el mismo lugar.
+        """
+        padding = self.TOTALS_RESERVED_BYTES - len(content) - len(b"<!---->\n")
+        if padding < 0:
+            raise ValueError("Los totales no entran en el bloque reservado")
+        return content + b"<!--" + b" " * padding + b"-->\n"
+
+    @abstractmethod
+    def render_header(self, date: str) -> list[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def render_totals(
+        self, total: int, passed: int, failed: int, fast_path: int
+    ) -> list[str]:
+        """
+        :param fast_path: casos cuyo body se resolvió sin diff completo
+            (bytes idénticos o mismo hash canónico).
+        """
+        raise NotImplementedError
+
+    def render_after_totals(self) -> list[str]:
+        return []
+
+    def create_summaries(self) -> list[ReportSummary]:
+        """Resúmenes que se calculan mientras se escriben los casos."""
+        return [MetricsSummary(), DiffPatternSummary()]
+
+    def add_summary(self, summary: ReportSummary) -> None:
+        """
+        Agrega un resumen a los de `create_summaries`, como el de muestreo.
+        Cada writer necesita su propia instancia: el resumen recibe los casos
+        que escribe el writer.
+        """
+        self._extra_summaries.append(summary)
+
+    def share_summaries(self, summaries: list[ReportSummary], feed: bool) -> None:
+        """
+        Usa `summaries` en lugar de los de `create_summaries`. Los writers de
+        una misma ejecución comparten las instancias (`share_default_summaries`)
+        para calcularlas una sola vez: solo el writer con `feed` les envía los
+        casos y los demás las muestran al cerrar.
+        """
+        self._shared_summaries = summaries
+        self._feeds_shared_summaries = feed
+
+    @abstractmethod
+    def render_summary(self, summary: ReportSummary) -> list[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def render_case(self, index: int, test_result) -> list[str]:
+        raise NotImplementedError
+
+    def render_footer(self) -> list[str]:
+        return []
+
+
+def share_default_summaries(writers: Iterable[object]) -> None:
+    """
+    Comparte los resúmenes de `create_summaries` (métricas y patrones de
+    diferencias) entre los writers incrementales de `writers`, que reciben
+    los mismos resultados. El primero les envía los casos, por lo que tiene
+    que recibirlos todos antes de que se cierren los demás.
+    """
+    incremental = [w for w in writers if isinstance(w, IncrementalReportWriter)]
+    if not incremental:
+        return
+    summaries = incremental[0].create_summaries()
+    for index, writer in enumerate(incremental):
+        writer.share_summaries(summaries, feed=index == 0)
@@ -0,0 +1,153 @@
+import json
+import os
+from collections.abc import Iterator
+from typing import Any, TextIO
+
+from api_signature_tester.validator.validator_model import (
+    CaseMetrics,
+    ComparationResult,
+    EndpointData,
+    RequestMetrics,
+    TestResult,
+)
+
+"""
+Resultados en formato JSON Lines: un caso por línea. Es el formato de los
+archivos parciales de cada shard, que luego se combinan en los reportes
+Markdown/HTML.
+"""
+
+
+class JsonlReportWriter:
+    """
+    Escribe cada resultado como una línea JSON (open/append/close). Los
+    headers de las requests no se guardan: pueden tener credenciales y los
+    reportes no los usan.
+    """
+
+    def __init__(self):
+        self._file: TextIO | None = None
+
+    def open(self, output_file: str) -> None:
+        directory = os.path.dirname(output_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(output_file, "w", encoding="utf-8")  # noqa: SIM115
+
+    def append(self, test_result) -> None:
+        if self._file is None:
+            raise RuntimeError("El reporte no fue abierto")
+        self._file.write(
+            json.dumps(result_to_dict(test_result), default=str, ensure_ascii=False)
+            + "\n"
+        )
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+
+
+def read_jsonl_results(path: str) -> Iterator[TestResult]:
+    """
+    Lee los resultados de un archivo JSON Lines en el orden en que se
+    escribieron. Una última línea sin salto de línea (ejecución cortada a
+    mitad de una escritura) se ignora.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                return  # Última línea incompleta: la escritura se cortó
+            if line.strip():
+                yield result_from_dict(json.loads(line))
+
+
+def result_to_dict(test_result: TestResult) -> dict[str, Any]:
+    comparation_result = test_result.get_comparation_result()
+    metrics = test_result.get_metrics()
+    return {
+        "case_id": test_result.get_case_id(),
+        "source": _endpoint_to_dict(test_result.get_source()),
+        "new": _endpoint_to_dict(test_result.get_new()),
+        "are_equal": comparation_result.is_equal(),
+        "diff_status_code": comparation_result.get_diff_status_code(),
+        "diff_body": [dict(diff) for diff in comparation_result.get_diff_body()],
+        "fast_path": comparation_result.get_fast_path(),
+        "diff_latency": comparation_result.get_diff_latency(),
+        "metrics": None if metrics is None else _metrics_to_dict(metrics),
+    }
+
+
+def result_from_dict(data: dict[str, Any]) -> TestResult:
+    metrics = data.get("metrics")
+    return TestResult(
+        _endpoint_from_dict(data["source"]),
+        _endpoint_from_dict(data["new"]),
+        ComparationResult(
+            data["are_equal"],
+            data["diff_status_code"],
+            data["diff_body"],
+            data.get("fast_path"),
+            data.get("diff_latency"),
+        ),
+        None if metrics is None else _metrics_from_dict(metrics),
+        data.get("case_id"),
+    )
+
+
+def _endpoint_to_dict(endpoint: EndpointData) -> dict[str, Any]:
+    return {
+        "url": endpoint.get_url(),
+        "method": endpoint.get_method(),
+        "params": endpoint.get_params(),
+    }
+
+
+def _endpoint_from_dict(data: dict[str, Any]) -> EndpointData:
+    return EndpointData(data["url"], data["method"], data.get("params") or {}, {})
+
+
+def _metrics_to_dict(metrics: CaseMetrics) -> dict[str, Any]:
+    return {
+        "source": _request_metrics_to_dict(metrics.get_source()),
+        "new": _request_metrics_to_dict(metrics.get_new()),
+        "decode_ms": metrics.get_decode_ms(),
+        "diff_ms": metrics.get_diff_ms(),
+        "json_decoder": metrics.get_json_decoder(),
+    }
+
+
+def _metrics_from_dict(data: dict[str, Any]) -> CaseMetrics:
+    return CaseMetrics(
+        _request_metrics_from_dict(data["source"]),
+        _request_metrics_from_dict(data["new"]),
+        data.get("decode_ms"),
+        data.get("diff_ms"),
+        data.get("json_decoder"),
+    )
+
+
+def _request_metrics_to_dict(metrics: RequestMetrics) -> dict[str, Any]:
+    return {
+        "latency_ms": metrics.get_latency_ms(),
+        "ttfb_ms": metrics.get_ttfb_ms(),
+        "response_bytes": metrics.get_response_bytes(),
+        "latency_samples_ms": metrics.get_latency_samples_ms(),
+        "retries": metrics.get_retries(),
+        "timeouts": metrics.get_timeouts(),
+        "hedged": metrics.is_hedged(),
+    }
+
+
+def _request_metrics_from_dict(data: dict[str, Any]) -> RequestMetrics:
+    return RequestMetrics(
+        data.get("latency_ms"),
+        data.get("ttfb_ms"),
+        data.get("response_bytes"),
+        data.get("latency_samples_ms"),
+        data.get("retries", 0),
+        data.get("timeouts", 0),
+        data.get("hedged", False),
+    )
@@ -1,4 +1,13 @@
-from datetime import datetime
+from api_signature_tester.report.incremental_report_writer import (
+    IncrementalReportWriter,
+)
+from api_signature_tester.report.metrics_summary import (
+    CASE_METRICS_HEADERS,
+    format_latency_diff,
+    format_ms,
+    get_case_metrics_rows,
+)
+from api_signature_tester.report.reporter import ReportSummary
 
 """Generador de reportes en formato Markdown."""
 
@@ -14,60 +23,102 @@ class MarkdownReportGenerator:
             output_file (str): Ruta del archivo de salida.
         Returns:
             None"""
-        total = len(test_results)
-        passed = sum(1 for r in test_results if r.get_comparation_result().is_equal())
-        failed = total - passed
-        date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        writer = MarkdownReportWriter()
+        writer.open(output_file)
+        try:
+            for test in test_results:
+                writer.append(test)
+        finally:
+            writer.close()
 
-        md = [
+
+class MarkdownReportWriter(IncrementalReportWriter):
+    """Reporte Markdown que se escribe caso a caso (open/append/close)."""
+
+    def render_header(self, date: str) -> list[str]:
+        return [
             "# 🧾 Reporte de Comparaciones",
             f"**Fecha de ejecución:** {date}",
+        ]
+
+    def render_totals(
+        self, total: int, passed: int, failed: int, fast_path: int
+    ) -> list[str]:
+        return [
             f"**Total de pruebas:** {total}",
             f"✅ **Exitosas:** {passed}",
             f"❌ **Con diferencias:** {failed}",
-            "\n---\n",
+            f"⚡ **Resueltas por fast path:** {fast_path}",
         ]
 
-        # Crear cada bloque colapsable
-        for idx, test in enumerate(test_results, 1):
-            comp = test.get_comparation_result()
-            source = test.get_source()
-            new = test.get_new()
+    def render_after_totals(self) -> list[str]:
+        return ["\n---\n"]
+
+    def render_case(self, index: int, test_result) -> list[str]:
+        comp = test_result.get_comparation_result()
+        source = test_result.get_source()
+        new = test_result.get_new()
+
+        is_equal = comp.is_equal()
+        icon = "✅" if is_equal else "❌"
+        color_class = "success" if is_equal else "fail"
+
+        md = [f"<details id='comparacion-{index}' class='{color_class}'>"]
+        md.append(
+            f"<summary><strong>🧩 Comparación #{index} {icon}</strong></summary>\n"
+        )
 
-            is_equal = comp.is_equal()
-            icon = "✅" if is_equal else "❌"
-            color_class = "success" if is_equal else "fail"
+        md.append(f"**Source URL:** `{source.get_url()}`  ")
+        md.append(f"**New URL:** `{new.get_url()}`  ")
+        md.append(f"**Método:** `{source.get_method()}`  ")
 
-            md.append(f"<details id='comparacion-{idx}' class='{color_class}'>")
+        diff_status = comp.get_diff_status_code()
+        if diff_status:
+            md.append(f"**Status Code Diff:** `{diff_status}`  ")
+        else:
+            md.append("**Status Code Diff:** `Sin diferencias`  ")
+
+        diff_latency = comp.get_diff_latency()
+        if diff_latency:
+            md.append(
+                f"**Regresión de latencia:** `{format_latency_diff(diff_latency)}`  "
+            )
+
+        diff_body = comp.get_diff_body()
+        if diff_body:
+            md.append("\n**Diferencias en Body:**\n")
+            md.append("| Tipo | Ruta | Valor Anterior | Valor Nuevo |")
+            md.append("|--------|--------|----------------|--------------|")
+            for diff in diff_body:
+                tipo = diff.get("Tipo", "")
+                path = diff.get("Ruta", "")
+                old = diff.get("Valor anterior", "")
+                newv = diff.get("Valor nuevo", "")
+                md.append(f"| {tipo} | {path} | {old} | {newv} |")
+        else:
+            md.append("\n**Diferencias en Body:** `Sin diferencias`\n")
+
+        metrics = test_result.get_metrics()
+        if metrics is not None:
+            md.append("\n**Métricas:**\n")
+            md.append("| " + " | ".join(CASE_METRICS_HEADERS) + " |")
+            md.append("|" + "|".join("--------" for _ in CASE_METRICS_HEADERS) + "|")
+            for row in get_case_metrics_rows(metrics):
+                md.append("| " + " | ".join(row) + " |")
             md.append(
-                f"<summary><strong>🧩 Comparación #{idx} {icon}</strong></summary>\n"
+                f"\nDecode: `{format_ms(metrics.get_decode_ms())}` · "
+                f"Diff: `{format_ms(metrics.get_diff_ms())}`\n"
             )
 
-            md.append(f"**Source URL:** `{source.get_url()}`  ")
-            md.append(f"**New URL:** `{new.get_url()}`  ")
-            md.append(f"**Método:** `{source.get_method()}`  ")
-
-            diff_status = comp.get_diff_status_code()
-            if diff_status:
-                md.append(f"**Status Code Diff:** `{diff_status}`  ")
-            else:
-                md.append("**Status Code Diff:** `Sin diferencias`  ")
-
-            diff_body = comp.get_diff_body()
-            if diff_body:
-                md.append("\n**Diferencias en Body:**\n")
-                md.append("| Tipo | Ruta | Valor Anterior | Valor Nuevo |")
-                md.append("|--------|--------|----------------|--------------|")
-                for diff in diff_body:
-                    tipo = diff.get("Tipo", "")
-                    path = diff.get("Ruta", "")
-                    old = diff.get("Valor anterior", "")
-                    newv = diff.get("Valor nuevo", "")
-                    md.append(f"| {tipo} | {path} | {old} | {newv} |")
-            else:
-                md.append("\n**Diferencias en Body:** `Sin diferencias`\n")
-
-            md.append("</details>\n")
-
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write("\n".join(md))
+        md.append("</details>\n")
+        return md
+
+    def render_summary(self, summary: ReportSummary) -> list[str]:
+        headers = summary.get_headers()
+        md = [f"\n## {summary.get_title()}\n"]
+        md.append("| " + " | ".join(headers) + " |")
+        md.append("|" + "|".join("--------" for _ in headers) + "|")
+        for row in summary.get_rows():
+            md.append("| " + " | ".join(row) + " |")
+        md.append("")
+        return md
@@ -0,0 +1,183 @@
+import math
+
+from api_signature_tester.validator.validator_model import CaseMetrics
+
+"""Resumen de percentiles de tiempos y tamaños de toda la ejecución."""
+
+
+class MetricHistogram:
+    """
+    Histograma de buckets logarítmicos: memoria constante sin importar la
+    cantidad de casos, con un error relativo máximo de `PRECISION` en los
+    percentiles.
+    """
+
+    PRECISION = 0.01
+
+    def __init__(self):
+        self._log_base = math.log1p(self.PRECISION)
+        self._buckets: dict[int, int] = {}
+        self._zero_count = 0
+        self._count = 0
+        self._max = 0.0
+
+    def add(self, value: float) -> None:
+        if value < 0:
+            raise ValueError("Histogram values must be 0 or greater")
+        self._count += 1
+        self._max = max(self._max, value)
+        if value == 0:
+            self._zero_count += 1
+            return
+        index = math.ceil(math.log(value) / self._log_base)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+    def get_count(self) -> int:
+        return self._count
+
+    def get_max(self) -> float:
+        return self._max
+
+    def get_percentile(self, percentile: float) -> float:
+        """Percentil por rango más cercano (0 < percentile <= 100)."""
+        if self._count == 0:
+            return 0.0
+        rank = max(1, math.ceil(percentile / 100 * self._count))
+        if rank <= self._zero_count:
+            return 0.0
+
+        seen = self._zero_count
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return min(math.exp(index * self._log_base), self._max)
+        return self._max
+
+
+class MetricsSummary:
+    """
+    Percentiles de latencia, TTFB, bytes y tiempos de decode/diff. El decode
+    se separa por backend JSON, para poder comparar backends al combinar
+    resultados de distintas ejecuciones.
+    """
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self):
+        self._histograms: dict[str, MetricHistogram] = {
+            label: MetricHistogram()
+            for label in (
+                "Latencia source (ms)",
+                "Latencia new (ms)",
+                "TTFB source (ms)",
+                "TTFB new (ms)",
+                "Bytes source",
+                "Bytes new",
+            )
+        }
+        self._decode_histograms: dict[str, MetricHistogram] = {}
+        self._diff_histogram = MetricHistogram()
+
+    def append(self, test_result) -> None:
+        metrics: CaseMetrics | None = test_result.get_metrics()
+        if metrics is None:
+            return
+
+        values = (
+            metrics.get_source().get_latency_ms(),
+            metrics.get_new().get_latency_ms(),
+            metrics.get_source().get_ttfb_ms(),
+            metrics.get_new().get_ttfb_ms(),
+            metrics.get_source().get_response_bytes(),
+            metrics.get_new().get_response_bytes(),
+        )
+        for histogram, value in zip(self._histograms.values(), values, strict=True):
+            if value is not None:
+                histogram.add(value)
+
+        decode_ms = metrics.get_decode_ms()
+        if decode_ms is not None:
+            decoder = metrics.get_json_decoder()
+            label = "Decode (ms)" if decoder is None else f"Decode {decoder} (ms)"
+            self._decode_histograms.setdefault(label, MetricHistogram()).add(decode_ms)
+        diff_ms = metrics.get_diff_ms()
+        if diff_ms is not None:
+            self._diff_histogram.add(diff_ms)
+
+    def get_title(self) -> str:
+        return "Métricas de la ejecución"
+
+    def get_headers(self) -> list[str]:
+        return ["Métrica", "Casos"] + [f"p{p}" for p in self.PERCENTILES] + ["Máx."]
+
+    def get_rows(self) -> list[list[str]]:
+        return [
+            [label, str(histogram.get_count())]
+            + [_format(histogram.get_percentile(p)) for p in self.PERCENTILES]
+            + [_format(histogram.get_max())]
+            for label, histogram in (
+                *self._histograms.items(),
+                *sorted(self._decode_histograms.items()),
+                ("Diff (ms)", self._diff_histogram),
+            )
+            if histogram.get_count() > 0
+        ]
+
+
+CASE_METRICS_HEADERS = [
+    "Lado",
+    "Latencia (ms)",
+    "TTFB (ms)",
+    "Bytes",
+    "Reintentos",
+    "Timeouts",
+    "Hedge",
+]
+
+
+def get_case_metrics_rows(metrics: CaseMetrics) -> list[list[str]]:
+    """
+    Filas (lado, latencia, TTFB, bytes, reintentos, timeouts, hedge) con las
+    métricas de un caso.
+    """
+    return [
+        [
+            side,
+            _format_optional(request_metrics.get_latency_ms()),
+            _format_optional(request_metrics.get_ttfb_ms()),
+            _format_optional(request_metrics.get_response_bytes()),
+            str(request_metrics.get_retries()),
+            str(request_metrics.get_timeouts()),
+            "Sí" if request_metrics.is_hedged() else "No",
+        ]
+        for side, request_metrics in (
+            ("Source", metrics.get_source()),
+            ("New", metrics.get_new()),
+        )
+    ]
+
+
+def format_latency_diff(diff_latency: dict) -> str:
+    """Describe una regresión de latencia de `ComparationResult`."""
+    ratio = diff_latency.get("ratio")
+    ratio_text = f" (x{ratio:.2f})" if ratio is not None else ""
+    return (
+        f"source {_format(diff_latency['old_value'])} ms → "
+        f"new {_format(diff_latency['new_value'])} ms{ratio_text}, "
+        f"{diff_latency['samples']} muestras por lado"
+    )
+
+
+def format_ms(value: float | None) -> str:
+    """Duración en milisegundos de `CaseMetrics` (decode, diff) o `-`."""
+    return "-" if value is None else f"{value:.1f} ms"
+
+
+def _format_optional(value: float | None) -> str:
+    return "-" if value is None else _format(value)
+
+
+def _format(value: float) -> str:
+    if value >= 1000 or float(value).is_integer():
+        return f"{value:.0f}"
+    return f"{value:.1f}"
@@ -15,3 +15,28 @@ class ReportGenerator(Protocol):
             None
         """
         ...
+
+
+class ReportWriter(Protocol):
+    """Generador de reportes incremental: escribe cada resultado al recibirlo."""
+
+    def open(self, output_file: str) -> None: ...
+
+    def append(self, test_result) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class ReportSummary(Protocol):
+    """
+    Sección que se agrega al final del reporte con datos de toda la
+    ejecución. Recibe cada resultado y se representa como una tabla.
+    """
+
+    def append(self, test_result) -> None: ...
+
+    def get_title(self) -> str: ...
+
+    def get_headers(self) -> list[str]: ...
+
+    def get_rows(self) -> list[list[str]]: ...
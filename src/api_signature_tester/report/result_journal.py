@@ -0,0 +1,65 @@
+import os
+import re
+
+from api_signature_tester.report.jsonl_report_writer import JsonlReportWriter
+
+"""Journal de resultados: permite retomar una ejecución interrumpida."""
+
+_CASE_ID_PREFIX = re.compile(r'^\{"case_id": (\d+)')
+
+
+class ResultJournal(JsonlReportWriter):
+    """
+    Archivo JSON Lines de solo agregado con un resultado por caso. Cada línea
+    se escribe y se hace flush al compararse el caso, así una ejecución
+    cortada conserva todo lo ya comparado.
+
+    Con `resume` el archivo existente se conserva: se descarta una última
+    línea incompleta (escritura cortada) y los nuevos resultados se agregan
+    al final. Los casos ya registrados se obtienen con `read_case_ids`.
+    """
+
+    def __init__(self, resume: bool = False):
+        super().__init__()
+        self._resume = resume
+
+    def open(self, output_file: str) -> None:
+        if not self._resume or not os.path.exists(output_file):
+            super().open(output_file)
+            return
+        _truncate_incomplete_line(output_file)
+        self._file = open(output_file, "a", encoding="utf-8")  # noqa: SIM115
+
+    @staticmethod
+    def read_case_ids(path: str) -> set[int]:
+        """Casos con resultado en el journal; vacío si el archivo no existe."""
+        case_ids: set[int] = set()
+        if not os.path.exists(path):
+            return case_ids
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break  # Escritura cortada: el caso se vuelve a ejecutar
+                match = _CASE_ID_PREFIX.match(line)
+                if match is not None:
+                    case_ids.add(int(match.group(1)))
+        return case_ids
+
+
+def _truncate_incomplete_line(path: str, chunk_size: int = 64 * 1024) -> None:
+    """Recorta el archivo después de su último salto de línea."""
+    with open(path, "rb+") as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - chunk_size)
+            f.seek(start)
+            chunk = f.read(position - start)
+            newline = chunk.rfind(b"\n")
+            if newline != -1:
+                keep = start + newline + 1
+                if keep != end:
+                    f.truncate(keep)
+                return
+            position = start
+        f.truncate(0)
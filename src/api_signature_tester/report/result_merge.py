@@ -0,0 +1,80 @@
+import heapq
+from collections.abc import Iterator
+
+from api_signature_tester.report.html_report_genetaror import HTMLReportWriter
+from api_signature_tester.report.incremental_report_writer import (
+    share_default_summaries,
+)
+from api_signature_tester.report.jsonl_report_writer import read_jsonl_results
+from api_signature_tester.report.markdown_report_generator import (
+    MarkdownReportWriter,
+)
+from api_signature_tester.report.reporter import ReportWriter
+from api_signature_tester.validator.validator_model import TestResult
+
+"""Combina los resultados parciales de los shards en un único reporte."""
+
+
+def merge_results(partial_paths: list[str]) -> Iterator[TestResult]:
+    """
+    Intercala los archivos parciales por `case_id`. Cada shard escribe sus
+    casos en orden de carga, así que basta un merge de k vías: la memoria no
+    depende de la cantidad de casos. Si un caso aparece en más de un archivo
+    (un shard que se ejecutó dos veces) se conserva la primera aparición.
+    """
+    merged = heapq.merge(
+        *(read_jsonl_results(path) for path in partial_paths),
+        key=_get_sort_key,
+    )
+    last_case_id: int | None = None
+    for result in merged:
+        case_id = result.get_case_id()
+        if case_id is not None and case_id == last_case_id:
+            continue
+        last_case_id = case_id
+        yield result
+
+
+def merge_partial_reports(
+    partial_paths: list[str],
+    md_report_path: str,
+    html_report_path: str,
+    html_writer: ReportWriter | None = None,
+    extra_writers: list[tuple[ReportWriter, str]] | None = None,
+    md_writer: ReportWriter | None = None,
+) -> int:
+    """
+    Escribe los reportes Markdown y HTML a partir de los archivos parciales.
+    Devuelve la cantidad de casos combinados.
+
+    :param html_writer: writer del reporte HTML; por defecto HTMLReportWriter.
+    :param extra_writers: otros reportes (writer, archivo de salida) que
+        reciben los mismos resultados, como la base SQLite.
+    :param md_writer: writer del reporte Markdown; por defecto
+        MarkdownReportWriter.
+    """
+    outputs: list[tuple[ReportWriter, str]] = [
+        (md_writer or MarkdownReportWriter(), md_report_path),
+        (html_writer or HTMLReportWriter(), html_report_path),
+        *(extra_writers or []),
+    ]
+    share_default_summaries(writer for writer, _ in outputs)
+    writers: list[ReportWriter] = []
+    total = 0
+    try:
+        for writer, output_file in outputs:
+            writer.open(output_file)
+            writers.append(writer)
+        for result in merge_results(partial_paths):
+            total += 1
+            for writer in writers:
+                writer.append(result)
+    finally:
+        for writer in writers:
+            writer.close()
+    return total
+
+
+def _get_sort_key(result: TestResult) -> int:
+    case_id = result.get_case_id()
+    return -1 if case_id is None else case_id
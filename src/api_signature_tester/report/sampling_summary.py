@@ -0,0 +1,154 @@
+import math
+from statistics import NormalDist
+
+from api_signature_tester.etl.sampling import SamplingPlan, Stratum, get_stratum
+
+"""Tasa de fallos observada en una ejecución por muestreo estratificado."""
+
+
+def wilson_interval(
+    failures: float, sample_size: int, confidence: float = 0.95
+) -> tuple[float, float]:
+    """
+    Intervalo de Wilson para una proporción. A diferencia del intervalo
+    normal, no colapsa a [0, 0] cuando no hay fallos en la muestra.
+    """
+    if sample_size <= 0:
+        raise ValueError("sample_size debe ser mayor que 0")
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    rate = failures / sample_size
+    z2 = z * z / sample_size
+    center = (rate + z2 / 2) / (1 + z2)
+    margin = (
+        z
+        * math.sqrt(rate * (1 - rate) / sample_size + z2 / (4 * sample_size))
+        / (1 + z2)
+    )
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+class StratumFailures:
+    """Casos ejecutados y fallidos de un estrato."""
+
+    def __init__(self):
+        self._cases = 0
+        self._failures = 0
+
+    def add(self, failed: bool) -> None:
+        self._cases += 1
+        if failed:
+            self._failures += 1
+
+    def get_cases(self) -> int:
+        return self._cases
+
+    def get_failures(self) -> int:
+        return self._failures
+
+
+class SamplingSummary:
+    """
+    Tasa de fallos por estrato de una ejecución por muestreo
+    (`ReportSummary`), con el intervalo de confianza de Wilson. La fila de
+    total es la tasa estimada para toda la entrada: el promedio de las tasas
+    de cada estrato ponderado por su tamaño, con un intervalo de Wilson sobre
+    la muestra completa (aproximado).
+    """
+
+    def __init__(self, plan: SamplingPlan, confidence: float = 0.95):
+        if not 0 < confidence < 1:
+            raise ValueError("confidence debe estar entre 0 y 1")
+        self._plan = plan
+        self._confidence = confidence
+        self._strata: dict[Stratum, StratumFailures] = {}
+
+    def append(self, test_result) -> None:
+        stratum = get_stratum(test_result.get_source())
+        failures = self._strata.get(stratum)
+        if failures is None:
+            failures = self._strata[stratum] = StratumFailures()
+        failures.add(not test_result.get_comparation_result().is_equal())
+
+    def get_stratum_failures(self, stratum: Stratum) -> StratumFailures:
+        return self._strata.get(stratum) or StratumFailures()
+
+    def get_failure_rate(self) -> tuple[float, float, float] | None:
+        """
+        Tasa de fallos estimada para toda la entrada y su intervalo
+        (tasa, mínimo, máximo), o None si todavía no hay casos.
+        """
+        observed = [
+            (self._plan.get_population(stratum) or failures.get_cases(), failures)
+            for stratum, failures in self._strata.items()
+            if failures.get_cases()
+        ]
+        if not observed:
+            return None
+        population = sum(size for size, _ in observed)
+        rate = sum(
+            size / population * failures.get_failures() / failures.get_cases()
+            for size, failures in observed
+        )
+        sample_size = sum(failures.get_cases() for _, failures in observed)
+        low, high = wilson_interval(rate * sample_size, sample_size, self._confidence)
+        return rate, low, high
+
+    def get_title(self) -> str:
+        return "Muestreo estratificado: tasa de fallos por estrato"
+
+    def get_headers(self) -> list[str]:
+        return [
+            "Método",
+            "Ruta",
+            "Casos",
+            "Muestra",
+            "Fallos",
+            "Tasa de fallos",
+            f"IC {self._confidence:.0%}",
+        ]
+
+    def get_rows(self) -> list[list[str]]:
+        if not self._strata:
+            return []
+        rows = []
+        for stratum in sorted(set(self._plan.get_strata()) | set(self._strata)):
+            failures = self.get_stratum_failures(stratum)
+            cases = failures.get_cases()
+            rate, interval = "-", "-"
+            if cases:
+                low, high = wilson_interval(
+                    failures.get_failures(), cases, self._confidence
+                )
+                rate = _format_rate(failures.get_failures() / cases)
+                interval = f"{_format_rate(low)} - {_format_rate(high)}"
+            rows.append(
+                [
+                    stratum[0],
+                    stratum[1],
+                    str(self._plan.get_population(stratum)),
+                    str(cases),
+                    str(failures.get_failures()),
+                    rate,
+                    interval,
+                ]
+            )
+
+        estimate = self.get_failure_rate()
+        if estimate is not None:
+            rate_value, low, high = estimate
+            rows.append(
+                [
+                    "",
+                    "(total estimado)",
+                    str(self._plan.get_total_population()),
+                    str(sum(f.get_cases() for f in self._strata.values())),
+                    str(sum(f.get_failures() for f in self._strata.values())),
+                    _format_rate(rate_value),
+                    f"{_format_rate(low)} - {_format_rate(high)}",
+                ]
+            )
+        return rows
+
+
+def _format_rate(value: float) -> str:
+    return f"{value:.1%}"
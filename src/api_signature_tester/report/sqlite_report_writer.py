@@ -0,0 +1,352 @@
+import json
+import os
+import sqlite3
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+from api_signature_tester.validator.array_rules import path_pattern
+from api_signature_tester.validator.validator_model import RequestMetrics, TestResult
+
+"""
+Resultados en una base SQLite local, acumulando ejecuciones (`run_id`) para
+consultar su historial.
+"""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    total INTEGER NOT NULL DEFAULT 0,
+    passed INTEGER NOT NULL DEFAULT 0,
+    fast_path INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS cases (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL REFERENCES runs (run_id),
+    case_id INTEGER,
+    method TEXT NOT NULL,
+    source_url TEXT NOT NULL,
+    new_url TEXT NOT NULL,
+    is_equal INTEGER NOT NULL,
+    status_old INTEGER,
+    status_new INTEGER,
+    fast_path TEXT,
+    latency_regression TEXT,
+    decode_ms REAL,
+    diff_ms REAL,
+    json_decoder TEXT
+);
+CREATE TABLE IF NOT EXISTS case_metrics (
+    case_row INTEGER NOT NULL REFERENCES cases (id),
+    side TEXT NOT NULL,
+    latency_ms REAL,
+    ttfb_ms REAL,
+    response_bytes INTEGER,
+    retries INTEGER NOT NULL,
+    timeouts INTEGER NOT NULL,
+    hedged INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS diffs (
+    case_row INTEGER NOT NULL REFERENCES cases (id),
+    run_id TEXT NOT NULL,
+    diff_type TEXT NOT NULL,
+    path TEXT NOT NULL,
+    path_pattern TEXT NOT NULL,
+    old_value TEXT,
+    new_value TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_started_at ON runs (started_at);
+CREATE INDEX IF NOT EXISTS idx_cases_run ON cases (run_id, is_equal);
+CREATE INDEX IF NOT EXISTS idx_cases_url ON cases (source_url, method);
+CREATE INDEX IF NOT EXISTS idx_cases_method ON cases (method);
+CREATE INDEX IF NOT EXISTS idx_cases_status ON cases (run_id, status_old)
+    WHERE status_old IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_case_metrics_case ON case_metrics (case_row);
+CREATE INDEX IF NOT EXISTS idx_diffs_case ON diffs (case_row);
+CREATE INDEX IF NOT EXISTS idx_diffs_type ON diffs (diff_type, run_id);
+CREATE INDEX IF NOT EXISTS idx_diffs_run ON diffs (run_id, path_pattern);
+"""
+
+
+class SqliteReportGenerator:
+    def __init__(self, run_id: str | None = None):
+        self._run_id = run_id
+
+    def generate(
+        self, test_results: list, output_file: str = "reports/results.sqlite"
+    ) -> None:
+        """
+        Agrega los resultados a la base SQLite como una nueva ejecución.
+        Args:
+            test_results (List): Lista de resultados de las pruebas.
+            output_file (str): Ruta de la base de datos.
+        Returns:
+            None
+        """
+        writer = SqliteReportWriter(self._run_id)
+        writer.open(output_file)
+        try:
+            for test_result in test_results:
+                writer.append(test_result)
+        finally:
+            writer.close()
+
+
+class SqliteReportWriter:
+    """
+    Guarda cada resultado en una base SQLite (`ReportWriter`). Las filas se
+    acumulan y se insertan con `executemany` en una transacción cada
+    `batch_size` casos; una ejecución cortada conserva los bloques ya
+    insertados. Cada `open` registra una ejecución nueva en `runs`, así la
+    misma base guarda el historial de todas.
+
+    Los ids de `cases` se asignan en memoria a partir del máximo existente,
+    por lo que no debe haber dos writers escribiendo la misma base a la vez.
+    """
+
+    BATCH_SIZE = 1000
+
+    def __init__(self, run_id: str | None = None, batch_size: int = BATCH_SIZE):
+        """
+        :param run_id: identificador de la ejecución; por defecto la fecha y
+            un sufijo aleatorio.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size debe ser mayor que 0")
+        self._run_id = run_id
+        self._batch_size = batch_size
+        self._connection: sqlite3.Connection | None = None
+        self._next_case_row = 0
+        self._cases: list[tuple] = []
+        self._metrics: list[tuple] = []
+        self._diffs: list[tuple] = []
+        self._total = 0
+        self._passed = 0
+        self._fast_path = 0
+
+    def get_run_id(self) -> str | None:
+        return self._run_id
+
+    def open(self, output_file: str) -> None:
+        directory = os.path.dirname(output_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        now = datetime.now(UTC)
+        if self._run_id is None:
+            self._run_id = f"{now:%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+        self._connection = connect(output_file)
+        self._total = self._passed = self._fast_path = 0
+        with self._connection:
+            self._connection.execute(
+                "INSERT INTO runs (run_id, started_at) VALUES (?, ?)",
+                (self._run_id, now.isoformat()),
+            )
+        (max_row,) = self._connection.execute("SELECT MAX(id) FROM cases").fetchone()
+        self._next_case_row = (max_row or 0) + 1
+
+    def append(self, test_result: TestResult) -> None:
+        if self._connection is None:
+            raise RuntimeError("El reporte no fue abierto")
+
+        case_row = self._next_case_row
+        self._next_case_row += 1
+        comparation_result = test_result.get_comparation_result()
+        self._total += 1
+        if comparation_result.is_equal():
+            self._passed += 1
+        if comparation_result.get_fast_path() is not None:
+            self._fast_path += 1
+
+        status_code = comparation_result.get_diff_status_code().get("status_code") or {}
+        metrics = test_result.get_metrics()
+        self._cases.append(
+            (
+                case_row,
+                self._run_id,
+                test_result.get_case_id(),
+                test_result.get_source().get_method(),
+                test_result.get_source().get_url(),
+                test_result.get_new().get_url(),
+                int(comparation_result.is_equal()),
+                status_code.get("old_value"),
+                status_code.get("new_value"),
+                comparation_result.get_fast_path(),
+                _to_json(comparation_result.get_diff_latency() or None),
+                None if metrics is None else metrics.get_decode_ms(),
+                None if metrics is None else metrics.get_diff_ms(),
+                None if metrics is None else metrics.get_json_decoder(),
+            )
+        )
+        if metrics is not None:
+            self._metrics.append(_metrics_row(case_row, "source", metrics.get_source()))
+            self._metrics.append(_metrics_row(case_row, "new", metrics.get_new()))
+        for diff in comparation_result.get_diff_body():
+            path = str(diff.get("Ruta", ""))
+            self._diffs.append(
+                (
+                    case_row,
+                    self._run_id,
+                    str(diff.get("Tipo", "")),
+                    path,
+                    path_pattern(path),
+                    _to_json(diff.get("Valor anterior")),
+                    _to_json(diff.get("Valor nuevo")),
+                )
+            )
+
+        if len(self._cases) >= self._batch_size:
+            self._flush()
+
+    def close(self) -> None:
+        if self._connection is None:
+            return
+        try:
+            self._flush()
+            with self._connection:
+                self._connection.execute(
+                    "UPDATE runs SET finished_at = ?, total = ?, passed = ?,"
+                    " fast_path = ? WHERE run_id = ?",
+                    (
+                        datetime.now(UTC).isoformat(),
+                        self._total,
+                        self._passed,
+                        self._fast_path,
+                        self._run_id,
+                    ),
+                )
+        finally:
+            self._connection.close()
+            self._connection = None
+
+    def _flush(self) -> None:
+        if not self._cases or self._connection is None:
+            return
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO cases VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                self._cases,
+            )
+            self._connection.executemany(
+                "INSERT INTO case_metrics VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                self._metrics,
+            )
+            self._connection.executemany(
+                "INSERT INTO diffs VALUES (?, ?, ?, ?, ?, ?, ?)", self._diffs
+            )
+        self._cases = []
+        self._metrics = []
+        self._diffs = []
+
+
+class SqliteResultsStore:
+    """
+    Consultas sobre el historial de ejecuciones de una base escrita por
+    `SqliteReportWriter`. Las fechas son ISO 8601 en UTC
+    (`2025-01-31T00:00:00`); los filtros usan los índices de la base.
+    """
+
+    def __init__(self, path: str):
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        self._connection = connect(path)
+        self._connection.row_factory = sqlite3.Row
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "SqliteResultsStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def get_runs(self, since: str | None = None) -> list[dict[str, Any]]:
+        """Ejecuciones desde `since` (o todas), de la más reciente a la más vieja."""
+        return self._query(
+            "SELECT run_id, started_at, finished_at, total, passed,"
+            " total - passed AS failed, fast_path FROM runs"
+            " WHERE started_at >= ? ORDER BY started_at DESC",
+            (since or "",),
+        )
+
+    def get_status_code_regressions(
+        self, since: str | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Endpoints (método y URL de source) cuyo status code cambió en las
+        ejecuciones desde `since`, con la cantidad de casos, de ejecuciones y
+        el último cambio visto.
+        """
+        return self._query(
+            "SELECT c.method, c.source_url, COUNT(*) AS cases,"
+            " COUNT(DISTINCT c.run_id) AS runs, MAX(r.started_at) AS last_seen,"
+            " c.status_old, c.status_new"
+            " FROM runs r JOIN cases c ON c.run_id = r.run_id"
+            " AND c.status_old IS NOT NULL"
+            " WHERE r.started_at >= ?"
+            " GROUP BY c.method, c.source_url, c.status_old, c.status_new"
+            " ORDER BY cases DESC, c.source_url",
+            (since or "",),
+        )
+
+    def get_endpoint_history(
+        self, source_url: str, method: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Resultados de un endpoint en cada ejecución, de la más reciente."""
+        return self._query(
+            "SELECT r.run_id, r.started_at, c.method, COUNT(*) AS cases,"
+            " SUM(1 - c.is_equal) AS failed,"
+            " SUM(c.status_old IS NOT NULL) AS status_changes"
+            " FROM cases c JOIN runs r ON r.run_id = c.run_id"
+            " WHERE c.source_url = ? AND (? IS NULL OR c.method = ?)"
+            " GROUP BY r.run_id, c.method ORDER BY r.started_at DESC",
+            (source_url, method, method),
+        )
+
+    def get_diff_type_history(
+        self, diff_type: str, since: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Diferencias de un tipo por ejecución y patrón de ruta."""
+        return self._query(
+            "SELECT r.run_id, r.started_at, d.path_pattern, COUNT(*) AS occurrences,"
+            " COUNT(DISTINCT d.case_row) AS cases"
+            " FROM runs r JOIN diffs d ON d.run_id = r.run_id AND d.diff_type = ?"
+            " WHERE r.started_at >= ?"
+            " GROUP BY r.run_id, d.path_pattern"
+            " ORDER BY r.started_at DESC, occurrences DESC",
+            (diff_type, since or ""),
+        )
+
+    def _query(self, sql: str, parameters: tuple) -> list[dict[str, Any]]:
+        return [dict(row) for row in self._connection.execute(sql, parameters)]
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Abre la base y crea las tablas e índices que falten."""
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.execute("PRAGMA synchronous = NORMAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def _metrics_row(case_row: int, side: str, metrics: RequestMetrics) -> tuple:
+    return (
+        case_row,
+        side,
+        metrics.get_latency_ms(),
+        metrics.get_ttfb_ms(),
+        metrics.get_response_bytes(),
+        metrics.get_retries(),
+        metrics.get_timeouts(),
+        int(metrics.is_hedged()),
+    )
+
+
+def _to_json(value: Any) -> str | None:
+    if value is None:
+        return None
+    return json.dumps(value, ensure_ascii=False, default=str)
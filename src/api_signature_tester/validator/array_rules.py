@@ -0,0 +1,98 @@
+import re
+from typing import Any
+
+"""Reglas de comparación de arrays por ruta del documento."""
+
+ARRAY_UNORDERED = "unordered"
+ARRAY_ORDERED = "ordered"
+ARRAY_KEYED = "keyed"
+
+# Comodín de índice en las rutas de las reglas: root['items'][*]['lines']
+ANY_INDEX = "[*]"
+
+# Un segmento de ruta: clave entre comillas (puede contener corchetes) o índice
+_PATH_SEGMENT = re.compile(r"""\[('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|[^\]]*)\]""")
+
+
+def path_pattern(path: str) -> str:
+    """
+    Reemplaza los índices de array de una ruta de diff por `[*]`:
+    `root['data'][3]['field']` -> `root['data'][*]['field']`.
+    """
+    return _PATH_SEGMENT.sub(
+        lambda match: ANY_INDEX if match.group(1).isdigit() else match.group(0),
+        path,
+    )
+
+
+class ArrayRule:
+    """
+    Cómo se comparan los elementos de un array:
+    - `unordered`: como conjunto, emparejando elementos parecidos (DeepDiff
+      con `ignore_order=True`, el comportamiento por defecto);
+    - `ordered`: posición por posición;
+    - `keyed`: por el valor de los campos `keys` de cada elemento (por
+      ejemplo `id`); solo se comparan los pares con la misma clave.
+    """
+
+    def __init__(self, mode: str, keys: list[str] | None = None):
+        if mode not in (ARRAY_UNORDERED, ARRAY_ORDERED, ARRAY_KEYED):
+            raise ValueError(f"Modo de array desconocido: {mode}")
+        if mode == ARRAY_KEYED and not keys:
+            raise ValueError("El modo keyed requiere al menos un campo en keys")
+        self._mode = mode
+        self._keys = tuple(keys or ())
+
+    def get_mode(self) -> str:
+        return self._mode
+
+    def get_keys(self) -> tuple[str, ...]:
+        return self._keys
+
+    def item_key(self, item: Any) -> tuple | None:
+        """Valores de `keys` del elemento; None si no es un objeto con todos."""
+        if not isinstance(item, dict):
+            return None
+        try:
+            return tuple(item[key] for key in self._keys)
+        except KeyError:
+            return None
+
+    @classmethod
+    def parse(cls, value: Any) -> "ArrayRule":
+        """
+        :param value: el modo (`"ordered"`) o un objeto
+            `{"mode": "keyed", "keys": ["id"]}`.
+        """
+        if isinstance(value, str):
+            return cls(value)
+        if isinstance(value, dict):
+            keys = value.get("keys")
+            if isinstance(keys, str):
+                keys = [keys]
+            return cls(value.get("mode", ARRAY_KEYED if keys else ""), keys)
+        raise ValueError(f"Regla de array inválida: {value!r}")
+
+
+class ArrayRules:
+    """
+    Reglas por ruta. Las rutas usan el formato de los reportes
+    (`root['items']`) con `[*]` en lugar de los índices de arrays
+    intermedios: `root['orders'][*]['lines']`. Los arrays sin regla se
+    comparan sin orden.
+    """
+
+    def __init__(self, rules: dict[str, Any] | None = None):
+        self._rules = {
+            path: ArrayRule.parse(rule) for path, rule in (rules or {}).items()
+        }
+
+    def is_empty(self) -> bool:
+        return not self._rules
+
+    def get(self, pattern: str) -> ArrayRule | None:
+        return self._rules.get(pattern)
+
+    def get_mode(self, pattern: str | None) -> str:
+        rule = None if pattern is None else self._rules.get(pattern)
+        return ARRAY_UNORDERED if rule is None else rule.get_mode()
@@ -0,0 +1,293 @@
+import threading
+import time
+from collections.abc import Callable
+
+from requests.models import Response
+
+from api_signature_tester.validator.http_session_pool import get_host_key
+
+# Respuestas que indican que el servicio está saturado
+BACKOFF_STATUS_CODES = frozenset({429, 503})
+
+
+class HostStats:
+    def __init__(
+        self,
+        host: str,
+        rate: float | None,
+        concurrency_limit: int,
+        requests_sent: int,
+        backoffs: int,
+        wait_seconds: float,
+    ):
+        self._host = host
+        self._rate = rate
+        self._concurrency_limit = concurrency_limit
+        self._requests_sent = requests_sent
+        self._backoffs = backoffs
+        self._wait_seconds = wait_seconds
+
+    def get_host(self) -> str:
+        return self._host
+
+    def get_rate(self) -> float | None:
+        """Requests por segundo permitidas actualmente (None = sin límite)."""
+        return self._rate
+
+    def get_concurrency_limit(self) -> int:
+        return self._concurrency_limit
+
+    def get_requests_sent(self) -> int:
+        return self._requests_sent
+
+    def get_backoffs(self) -> int:
+        return self._backoffs
+
+    def get_wait_seconds(self) -> float:
+        return self._wait_seconds
+
+    def __str__(self) -> str:
+        rate = "unlimited" if self._rate is None else f"{self._rate:.1f}/s"
+        return (
+            f"{self._host} rate={rate} in_flight_limit={self._concurrency_limit} "
+            f"requests={self._requests_sent} backoffs={self._backoffs} "
+            f"wait={self._wait_seconds:.1f}s"
+        )
+
+
+class HostLimiter:
+    """
+    Token bucket y límite de requests en vuelo de un host, ajustados con AIMD:
+    - cada respuesta correcta suma `increase_rps / rate` al rate (≈ +increase_rps
+      por segundo) y `1 / limit` al límite en vuelo (≈ +1 por ventana);
+    - un 429/503, un error de conexión o una latencia sobre el umbral
+      multiplican ambos por `backoff_factor`, como máximo una vez por
+      `BACKOFF_COOLDOWN_SECONDS` para que las respuestas de una misma ráfaga no
+      encadenen reducciones.
+    Un `Retry-After` en segundos pausa el host hasta que se cumpla.
+    """
+
+    BACKOFF_COOLDOWN_SECONDS = 1.0
+
+    def __init__(
+        self,
+        host: str,
+        max_rps: float | None,
+        min_rps: float,
+        max_in_flight: int,
+        increase_rps: float,
+        backoff_factor: float,
+        latency_threshold_ms: float | None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._host = host
+        self._max_rps = max_rps
+        self._min_rps = min_rps
+        self._max_in_flight = max_in_flight
+        self._increase_rps = increase_rps
+        self._backoff_factor = backoff_factor
+        self._latency_threshold_ms = latency_threshold_ms
+        self._clock = clock
+
+        self._rate = max_rps
+        self._tokens = 1.0
+        self._created_at = clock()
+        self._refilled_at = self._created_at
+        self._limit = float(max_in_flight)
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._last_backoff = float("-inf")
+        self._requests_sent = 0
+        self._backoffs = 0
+        self._wait_seconds = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        """Bloquea hasta que haya un token y un lugar libre en vuelo."""
+        started = self._clock()
+        with self._condition:
+            while True:
+                now = self._clock()
+                self._refill(now)
+                if now < self._paused_until:
+                    timeout: float | None = self._paused_until - now
+                elif self._in_flight >= int(self._limit):
+                    timeout = None  # espera a que termine una request
+                elif self._rate is not None and self._tokens < 1:
+                    timeout = (1 - self._tokens) / self._rate
+                else:
+                    if self._rate is not None:
+                        self._tokens -= 1
+                    self._in_flight += 1
+                    self._requests_sent += 1
+                    self._wait_seconds += now - started
+                    return
+                self._condition.wait(timeout)
+
+    def release(
+        self,
+        status_code: int | None,
+        latency_ms: float | None,
+        retry_after_seconds: float | None = None,
+    ) -> None:
+        """
+        :param status_code: status de la respuesta o None si la request falló.
+        """
+        with self._condition:
+            self._in_flight -= 1
+            now = self._clock()
+            congested = (
+                status_code is None
+                or status_code in BACKOFF_STATUS_CODES
+                or (
+                    self._latency_threshold_ms is not None
+                    and latency_ms is not None
+                    and latency_ms > self._latency_threshold_ms
+                )
+            )
+            if retry_after_seconds is not None and retry_after_seconds > 0:
+                self._paused_until = max(self._paused_until, now + retry_after_seconds)
+
+            if congested:
+                self._backoff(now)
+            else:
+                self._increase()
+            self._condition.notify_all()
+
+    def get_stats(self) -> HostStats:
+        with self._condition:
+            return HostStats(
+                self._host,
+                self._rate,
+                int(self._limit),
+                self._requests_sent,
+                self._backoffs,
+                self._wait_seconds,
+            )
+
+    def _refill(self, now: float) -> None:
+        if self._rate is not None:
+            # La capacidad del bucket es un segundo de requests
+            burst = max(1.0, self._rate)
+            elapsed = now - self._refilled_at
+            self._tokens = min(burst, self._tokens + elapsed * self._rate)
+        self._refilled_at = now
+
+    def _backoff(self, now: float) -> None:
+        if now - self._last_backoff < self.BACKOFF_COOLDOWN_SECONDS:
+            return
+        self._last_backoff = now
+        self._backoffs += 1
+        self._limit = max(1.0, self._limit * self._backoff_factor)
+        if self._rate is None:
+            # Sin rate configurado, el primer backoff parte del observado
+            elapsed = max(now - self._created_at, 1e-3)
+            self._rate = max(self._min_rps, self._requests_sent / elapsed)
+            self._tokens = 0.0
+        self._rate = max(self._min_rps, self._rate * self._backoff_factor)
+
+    def _increase(self) -> None:
+        self._limit = min(float(self._max_in_flight), self._limit + 1 / self._limit)
+        if self._rate is None:
+            return
+        rate = self._rate + self._increase_rps / max(self._rate, 1.0)
+        # Tras un backoff sin rate configurado, el rate crece sin tope.
+        self._rate = rate if self._max_rps is None else min(self._max_rps, rate)
+
+
+class HostScheduler:
+    """
+    Limita por scheme+host las requests que envía el pipeline: rate
+    (token bucket) y requests en vuelo, con backoff AIMD ante 429/503,
+    errores de conexión o latencias altas.
+    """
+
+    def __init__(
+        self,
+        max_rps: float | None = None,
+        min_rps: float = 1.0,
+        max_in_flight: int = 8,
+        increase_rps: float = 1.0,
+        backoff_factor: float = 0.5,
+        latency_threshold_ms: float | None = None,
+    ):
+        """
+        :param max_rps: requests por segundo máximas por host; None no limita
+            el rate hasta el primer backoff.
+        :param min_rps: piso del rate tras sucesivos backoffs.
+        :param max_in_flight: requests simultáneas máximas por host.
+        :param increase_rps: cuánto crece el rate por segundo sin errores.
+        :param backoff_factor: factor (0-1) aplicado al rate y al límite en
+            vuelo en cada backoff.
+        :param latency_threshold_ms: latencia a partir de la cual una
+            respuesta cuenta como señal de saturación.
+        """
+        if max_rps is not None and max_rps <= 0:
+            raise ValueError("max_rps must be greater than 0")
+        if min_rps <= 0:
+            raise ValueError("min_rps must be greater than 0")
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be greater than 0")
+        if not 0 < backoff_factor < 1:
+            raise ValueError("backoff_factor must be between 0 and 1")
+        self._max_rps = max_rps
+        self._min_rps = min(min_rps, max_rps) if max_rps is not None else min_rps
+        self._max_in_flight = max_in_flight
+        self._increase_rps = increase_rps
+        self._backoff_factor = backoff_factor
+        self._latency_threshold_ms = latency_threshold_ms
+        self._limiters: dict[str, HostLimiter] = {}
+        self._lock = threading.Lock()
+
+    def get_limiter(self, url: str) -> HostLimiter:
+        key = get_host_key(url)
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limiter = HostLimiter(
+                    key,
+                    self._max_rps,
+                    self._min_rps,
+                    self._max_in_flight,
+                    self._increase_rps,
+                    self._backoff_factor,
+                    self._latency_threshold_ms,
+                )
+                self._limiters[key] = limiter
+            return limiter
+
+    def send(self, url: str, request: Callable[[], Response]) -> Response:
+        """Ejecuta `request` cuando el host lo permite y registra el resultado."""
+        limiter = self.get_limiter(url)
+        limiter.acquire()
+        started = time.perf_counter()
+        try:
+            response = request()
+        except Exception:
+            limiter.release(None, None)
+            raise
+        limiter.release(
+            response.status_code,
+            (time.perf_counter() - started) * 1000,
+            self._get_retry_after(response),
+        )
+        return response
+
+    def get_stats(self) -> list[HostStats]:
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return [limiter.get_stats() for limiter in limiters]
+
+    def __str__(self) -> str:
+        return "; ".join(str(stats) for stats in self.get_stats())
+
+    @staticmethod
+    def _get_retry_after(response: Response) -> float | None:
+        headers = getattr(response, "headers", None) or {}
+        value = headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            return None  # Formato fecha HTTP: se ignora
@@ -0,0 +1,144 @@
+from threading import Lock
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def get_host_key(url: str) -> str:
+    """Clave scheme+host de una URL, usada para agrupar recursos por host."""
+    parts = urlsplit(url)
+    if not parts.scheme or not parts.netloc:
+        raise ValueError(f"URL inválida, falta scheme o host: {url}")
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+class PoolStats:
+    def __init__(
+        self,
+        hosts: int,
+        requests_sent: int,
+        new_connections: int,
+        open_connections: int,
+    ):
+        self._hosts = hosts
+        self._requests_sent = requests_sent
+        self._new_connections = new_connections
+        self._open_connections = open_connections
+
+    def get_hosts(self) -> int:
+        return self._hosts
+
+    def get_requests_sent(self) -> int:
+        return self._requests_sent
+
+    def get_new_connections(self) -> int:
+        return self._new_connections
+
+    def get_open_connections(self) -> int:
+        return self._open_connections
+
+    def get_reuse_ratio(self) -> float:
+        """Proporción de requests que reutilizaron una conexión abierta."""
+        if self._requests_sent == 0:
+            return 0.0
+        reused = max(self._requests_sent - self._new_connections, 0)
+        return reused / self._requests_sent
+
+    def __str__(self) -> str:
+        return (
+            f"hosts={self._hosts} requests={self._requests_sent} "
+            f"new_connections={self._new_connections} "
+            f"open_connections={self._open_connections} "
+            f"reuse_ratio={self.get_reuse_ratio():.2%}"
+        )
+
+
+class HttpSessionPool:
+    """
+    Mantiene una `requests.Session` por scheme+host para que las conexiones
+    TCP/TLS se reutilicen entre casos en lugar de abrirse en cada request.
+    """
+
+    def __init__(self, pool_size: int = 10, keep_alive: bool = True):
+        """
+        :param pool_size: cantidad máxima de conexiones abiertas por host.
+        :param keep_alive: si es False se envía `Connection: close` y cada
+            request abre su propia conexión.
+        """
+        if pool_size < 1:
+            raise ValueError("pool_size must be greater than 0")
+        self._pool_size = pool_size
+        self._keep_alive = keep_alive
+        self._sessions: dict[str, requests.Session] = {}
+        self._lock = Lock()
+
+    def get_session(self, url: str) -> requests.Session:
+        key = get_host_key(url)
+        session = self._sessions.get(key)
+        if session is not None:
+            return session
+
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._create_session(key)
+                self._sessions[key] = session
+            return session
+
+    def get_stats(self) -> PoolStats:
+        requests_sent = 0
+        new_connections = 0
+        open_connections = 0
+
+        with self._lock:
+            sessions = list(self._sessions.values())
+
+        for session in sessions:
+            for adapter in session.adapters.values():
+                for pool in self._get_connection_pools(adapter):
+                    requests_sent += getattr(pool, "num_requests", 0)
+                    new_connections += getattr(pool, "num_connections", 0)
+                    open_connections += self._count_open_connections(pool)
+
+        if not self._keep_alive:
+            # urllib3 reabre el socket de la misma conexión tras el
+            # `Connection: close`, sin contarla como nueva.
+            new_connections = requests_sent
+
+        return PoolStats(
+            len(sessions), requests_sent, new_connections, open_connections
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    def _create_session(self, key: str) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._pool_size)
+        session.mount(f"{key}/", adapter)
+        if not self._keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    @staticmethod
+    def _get_connection_pools(adapter) -> list:
+        pool_manager = getattr(adapter, "poolmanager", None)
+        if pool_manager is None:
+            return []
+        pools = pool_manager.pools
+        return [pools[key] for key in list(pools.keys())]
+
+    @staticmethod
+    def _count_open_connections(pool) -> int:
+        # urllib3 guarda las conexiones libres en una LifoQueue; los None son
+        # huecos de capacidad sin conexión asociada.
+        idle = getattr(getattr(pool, "pool", None), "queue", [])
+        return sum(
+            1
+            for conn in list(idle)
+            if conn is not None and getattr(conn, "sock", None) is not None
+        )
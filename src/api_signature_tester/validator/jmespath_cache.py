@@ -0,0 +1,18 @@
+from functools import lru_cache
+from typing import Any
+
+import jmespath
+
+# Expresiones distintas que se mantienen compiladas. Una suite suele usar
+# pocas expresiones repetidas en miles de casos.
+JMESPATH_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=JMESPATH_CACHE_SIZE)
+def compile_expression(expression: str) -> Any:
+    """Compila la expresión JMESPath una sola vez por proceso (LRU acotado)."""
+    return jmespath.compile(expression)
+
+
+def search(expression: str, data: Any) -> Any:
+    return compile_expression(expression).search(data)
@@ -0,0 +1,32 @@
+import hashlib
+import json
+from typing import Any
+
+
+def canonicalize(value: Any) -> Any:
+    """
+    Normaliza un JSON decodificado para que dos documentos equivalentes tengan
+    la misma serialización: los floats con valor entero pasan a int (1.0 → 1).
+    El orden de las claves se normaliza al serializar con `sort_keys`.
+    """
+    if isinstance(value, dict):
+        return {k: canonicalize(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [canonicalize(v) for v in value]
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def canonical_dumps(value: Any) -> bytes:
+    return json.dumps(
+        canonicalize(value),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def canonical_hash(value: Any) -> str:
+    """Hash sha256 de la forma canónica del JSON."""
+    return hashlib.sha256(canonical_dumps(value)).hexdigest()
@@ -0,0 +1,74 @@
+import json
+from typing import Any, Protocol
+
+try:
+    import orjson
+except ImportError:  # Dependencia opcional
+    orjson = None
+
+JSON_DECODER_AUTO = "auto"
+JSON_DECODER_STDLIB = "stdlib"
+JSON_DECODER_ORJSON = "orjson"
+
+
+class JsonDecoder(Protocol):
+    """
+    Decodifica el body de una respuesta directamente desde los bytes
+    recibidos, sin pasar por `Response.text` (evita la copia a str y la
+    detección de encoding de requests). Un body inválido lanza ValueError.
+    """
+
+    def get_name(self) -> str: ...
+
+    def decode(self, content: bytes) -> Any: ...
+
+
+class StdlibJsonDecoder:
+    def get_name(self) -> str:
+        return JSON_DECODER_STDLIB
+
+    def decode(self, content: bytes) -> Any:
+        # json.loads acepta bytes y detecta UTF-8/16/32 (con o sin BOM)
+        return json.loads(content)
+
+
+class OrjsonJsonDecoder:
+    """
+    Decoder basado en orjson. Los documentos que orjson rechaza pero la
+    stdlib acepta (NaN, enteros de más de 64 bits, BOM) se decodifican con la
+    stdlib, así el resultado no depende del backend instalado.
+    """
+
+    def __init__(self):
+        if orjson is None:
+            raise ValueError("El decoder orjson requiere instalar orjson")
+        self._fallback = StdlibJsonDecoder()
+
+    def get_name(self) -> str:
+        return JSON_DECODER_ORJSON
+
+    def decode(self, content: bytes) -> Any:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return self._fallback.decode(content)
+
+
+def get_json_decoder(name: str | None = JSON_DECODER_AUTO) -> JsonDecoder:
+    """
+    :param name: `auto` (orjson si está instalado, si no la stdlib),
+        `stdlib` u `orjson`.
+    """
+    name = (name or JSON_DECODER_AUTO).lower()
+    if name == JSON_DECODER_AUTO:
+        return OrjsonJsonDecoder() if orjson is not None else StdlibJsonDecoder()
+    if name == JSON_DECODER_STDLIB:
+        return StdlibJsonDecoder()
+    if name == JSON_DECODER_ORJSON:
+        return OrjsonJsonDecoder()
+    raise ValueError(f"Decoder JSON desconocido: {name}")
+
+
+def get_available_decoders() -> list[str]:
+    """Backends que se pueden usar en este entorno."""
+    return [JSON_DECODER_STDLIB] + ([JSON_DECODER_ORJSON] if orjson else [])
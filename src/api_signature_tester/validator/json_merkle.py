@@ -0,0 +1,306 @@
+import hashlib
+from typing import Any
+
+from api_signature_tester.validator.array_rules import (
+    ANY_INDEX,
+    ARRAY_KEYED,
+    ARRAY_ORDERED,
+    ARRAY_UNORDERED,
+    ArrayRule,
+    ArrayRules,
+)
+from api_signature_tester.validator.stream_diff import child_path
+
+"""
+Hash de cada subárbol de un JSON decodificado (árbol de Merkle) para
+descartar las partes iguales de dos documentos antes del diff detallado.
+"""
+
+# Tipos de fragmento
+FRAGMENT_DIFF = "diff"
+FRAGMENT_KEYS = "keys"
+FRAGMENT_ITEMS = "items"
+
+_DIGEST_SIZE = 16
+# Marcador (string) de un elemento de array que tiene igual en el otro lado
+_EQUAL_MARKER = "\x00merkle:"
+# Prefijo de los hashes de objetos y arrays; ningún escalar empieza así
+_CONTAINER = b"#"
+# Valor de DeepDiff: con menos claves en común el objeto se reporta entero
+THRESHOLD_TO_DIFF_DEEPER = 0.33
+
+
+class SubtreeHasher:
+    """
+    Calcula el hash de un valor JSON a partir de los hashes de sus hijos. Los
+    hashes de objetos y arrays se guardan por `id()`, así cada subárbol se
+    recorre una sola vez aunque se consulten todos sus nodos.
+
+    Dos subárboles con el mismo hash no producen diferencias en `compare_body`:
+    - el orden de las claves no importa;
+    - los arrays sin regla se comparan como conjuntos (sin orden ni
+      repeticiones, como DeepDiff con `ignore_order=True`), los `ordered`
+      como secuencia y los `keyed` sin orden pero con repeticiones;
+    - los floats con valor entero equivalen al int (igual que
+      `canonicalize`), pero `true` no equivale a `1`.
+
+    El hasher solo es válido mientras los documentos no se modifiquen.
+    """
+
+    def __init__(self, array_rules: ArrayRules | None = None):
+        # Se guarda también el valor: mientras viva su id() no se reutiliza
+        self._digests: dict[int, tuple[Any, bytes]] = {}
+        self._array_rules = (
+            None if array_rules is None or array_rules.is_empty() else array_rules
+        )
+
+    def digest(self, value: Any, pattern: str | None = None) -> bytes:
+        """
+        :param pattern: ruta del valor con `[*]` en los índices; solo se usa
+            para buscar las reglas de arrays.
+        """
+        if not isinstance(value, (dict, list)):
+            # Los escalares se comparan por su representación, sin hash
+            return _scalar_bytes(value)
+
+        cached = self._digests.get(id(value))
+        if cached is not None:
+            return cached[1]
+        if self._array_rules is None:
+            pattern = None
+        if isinstance(value, dict):
+            digest = self._dict_digest(value, pattern)
+        else:
+            digest = self._list_digest(value, pattern)
+        self._digests[id(value)] = (value, digest)
+        return digest
+
+    def get_array_rule(self, pattern: str) -> ArrayRule | None:
+        return None if self._array_rules is None else self._array_rules.get(pattern)
+
+    def _dict_digest(self, value: dict, pattern: str | None) -> bytes:
+        h = hashlib.blake2b(b"{", digest_size=_DIGEST_SIZE)
+        for key in sorted(value):
+            _update(h, str(key).encode("utf-8", "surrogatepass"))
+            child_pattern = None if pattern is None else child_path(pattern, key)
+            _update(h, self.digest(value[key], child_pattern))
+        return _CONTAINER + h.digest()
+
+    def _list_digest(self, value: list, pattern: str | None) -> bytes:
+        item_pattern = None if pattern is None else pattern + ANY_INDEX
+        digests = [self.digest(item, item_pattern) for item in value]
+        rule = None if pattern is None else self.get_array_rule(pattern)
+        mode = ARRAY_UNORDERED if rule is None else rule.get_mode()
+        if mode == ARRAY_UNORDERED:
+            digests = sorted(set(digests))
+        elif mode == ARRAY_KEYED:
+            digests.sort()
+        h = hashlib.blake2b(mode.encode(), digest_size=_DIGEST_SIZE)
+        for digest in digests:
+            _update(h, digest)
+        return _CONTAINER + h.digest()
+
+
+class ChangedFragment:
+    """
+    Par de fragmentos (source, new) con diferencias, ubicado en `path` del
+    documento. Según `kind`:
+    - FRAGMENT_DIFF: los valores a comparar con DeepDiff;
+    - FRAGMENT_KEYS: las claves del objeto presentes en un solo lado
+      (`source` las eliminadas, `new` las añadidas);
+    - FRAGMENT_ITEMS: elementos de un array sin par en el otro lado, por
+      índice (`source` los eliminados, `new` los añadidos).
+    """
+
+    def __init__(self, path: str, source: Any, new: Any, kind: str = FRAGMENT_DIFF):
+        self._path = path
+        self._source = source
+        self._new = new
+        self._kind = kind
+
+    def get_path(self) -> str:
+        return self._path
+
+    def get_source(self) -> Any:
+        return self._source
+
+    def get_new(self) -> Any:
+        return self._new
+
+    def get_kind(self) -> str:
+        return self._kind
+
+    def resolve_path(self, diff_path: str) -> str:
+        """
+        Traduce una ruta de DeepDiff sobre el fragmento (`root[...]`) a la
+        ruta en el documento completo.
+        """
+        return self._path + diff_path[len("root") :]
+
+
+def find_changed_fragments(
+    source: Any, new: Any, array_rules: ArrayRules | None = None
+) -> list[ChangedFragment]:
+    """
+    Desciende en paralelo por los dos documentos solo en los subárboles cuyo
+    hash difiere y devuelve los fragmentos que quedan por comparar:
+    - objetos: las claves presentes en un solo lado, juntas en un fragmento;
+      las claves comunes con hash distinto se siguen recorriendo. Si tienen
+      pocas claves en común, DeepDiff reporta el objeto entero como cambio
+      de valor (`THRESHOLD_TO_DIFF_DEEPER`) y se devuelve el par completo;
+    - arrays sin regla: el par completo, con los elementos iguales en ambos
+      lados reemplazados por un marcador (ver `_array_fragment`). Las reglas
+      de los arrays anidados dentro de sus elementos no se aplican;
+    - arrays `ordered`: se desciende posición por posición;
+    - arrays `keyed`: se desciende en los pares con la misma clave;
+    - escalares o tipos distintos: el par completo.
+    """
+    hasher = SubtreeHasher(array_rules)
+    fragments: list[ChangedFragment] = []
+    pending = [("root", "root", source, new)]
+    while pending:
+        path, pattern, source_value, new_value = pending.pop()
+        if hasher.digest(source_value, pattern) == hasher.digest(new_value, pattern):
+            continue
+
+        if isinstance(source_value, dict) and isinstance(new_value, dict):
+            common = source_value.keys() & new_value.keys()
+            union = len(source_value) + len(new_value) - len(common)
+            if union > 1 and len(common) / union < THRESHOLD_TO_DIFF_DEEPER:
+                fragments.append(ChangedFragment(path, source_value, new_value))
+                continue
+            removed = {k: v for k, v in source_value.items() if k not in new_value}
+            added = {k: v for k, v in new_value.items() if k not in source_value}
+            if removed or added:
+                fragments.append(ChangedFragment(path, removed, added, FRAGMENT_KEYS))
+            pending.extend(
+                (child_path(path, key), child_path(pattern, key), value, new_value[key])
+                for key, value in reversed(source_value.items())
+                if key in new_value
+            )
+        elif isinstance(source_value, list) and isinstance(new_value, list):
+            rule = hasher.get_array_rule(pattern)
+            if rule is None or rule.get_mode() == ARRAY_UNORDERED:
+                fragments.append(
+                    _array_fragment(hasher, path, pattern, source_value, new_value)
+                )
+                continue
+            if rule.get_mode() == ARRAY_ORDERED:
+                pairs, removed_items, added_items = _ordered_pairs(
+                    source_value, new_value
+                )
+            else:
+                pairs, removed_items, added_items = _keyed_pairs(
+                    hasher, rule, pattern, source_value, new_value
+                )
+            if removed_items or added_items:
+                fragments.append(
+                    ChangedFragment(path, removed_items, added_items, FRAGMENT_ITEMS)
+                )
+            pending.extend(
+                (
+                    child_path(path, source_index),
+                    pattern + ANY_INDEX,
+                    source_value[source_index],
+                    new_value[new_index],
+                )
+                for source_index, new_index in reversed(pairs)
+            )
+        else:
+            fragments.append(ChangedFragment(path, source_value, new_value))
+    return fragments
+
+
+def _array_fragment(
+    hasher: SubtreeHasher, path: str, pattern: str, source: list, new: list
+) -> ChangedFragment:
+    """
+    Fragmento de dos arrays donde cada elemento con igual en el otro lado se
+    reemplaza por un marcador de su hash: DeepDiff no vuelve a recorrerlo,
+    pero los índices y la cantidad de elementos comunes no cambian. De ellos
+    dependen las rutas, la decisión de emparejar elementos distintos
+    (`cutoff_intersection_for_pairs`) y la unión de un elemento eliminado y
+    otro añadido en la misma posición como cambio de valor.
+    """
+    item_pattern = pattern + ANY_INDEX
+    source_digests = [hasher.digest(item, item_pattern) for item in source]
+    new_digests = [hasher.digest(item, item_pattern) for item in new]
+    markers = {
+        digest: _EQUAL_MARKER + digest.hex()
+        for digest in set(source_digests) & set(new_digests)
+    }
+    return ChangedFragment(
+        path,
+        [markers.get(d, item) for d, item in zip(source_digests, source, strict=True)],
+        [markers.get(d, item) for d, item in zip(new_digests, new, strict=True)],
+    )
+
+
+def _ordered_pairs(
+    source: list, new: list
+) -> tuple[list[tuple[int, int]], dict[int, Any], dict[int, Any]]:
+    """Empareja por posición; lo que sobra en un lado es eliminado/añadido."""
+    common = min(len(source), len(new))
+    return (
+        [(index, index) for index in range(common)],
+        {index: source[index] for index in range(common, len(source))},
+        {index: new[index] for index in range(common, len(new))},
+    )
+
+
+def _keyed_pairs(
+    hasher: SubtreeHasher, rule: ArrayRule, pattern: str, source: list, new: list
+) -> tuple[list[tuple[int, int]], dict[int, Any], dict[int, Any]]:
+    """
+    Empareja los elementos por clave con un índice hash (tiempo lineal). Las
+    claves repetidas se emparejan en orden de aparición; los elementos sin
+    los campos de la clave solo se emparejan con uno idéntico.
+
+    :return: pares (índice en source, índice en new), eliminados y añadidos.
+    """
+    item_pattern = pattern + ANY_INDEX
+
+    def index_key(item: Any) -> tuple:
+        key = rule.item_key(item)
+        if key is None:
+            return (_CONTAINER, hasher.digest(item, item_pattern))
+        return tuple(hasher.digest(value) for value in key)
+
+    # Índices de new por clave, en orden inverso para sacarlos con pop()
+    new_by_key: dict[tuple, list[int]] = {}
+    for new_index in range(len(new) - 1, -1, -1):
+        new_by_key.setdefault(index_key(new[new_index]), []).append(new_index)
+
+    pairs: list[tuple[int, int]] = []
+    removed: dict[int, Any] = {}
+    for source_index, item in enumerate(source):
+        candidates = new_by_key.get(index_key(item))
+        if candidates:
+            pairs.append((source_index, candidates.pop()))
+        else:
+            removed[source_index] = item
+    added = {
+        new_index: new[new_index]
+        for indexes in new_by_key.values()
+        for new_index in indexes
+    }
+    return pairs, removed, dict(sorted(added.items()))
+
+
+def _update(h: Any, data: bytes) -> None:
+    h.update(len(data).to_bytes(8, "big"))
+    h.update(data)
+
+
+def _scalar_bytes(value: Any) -> bytes:
+    if value is None:
+        return b"n"
+    if isinstance(value, bool):
+        return b"b1" if value else b"b0"
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if isinstance(value, int):
+        return b"i" + str(value).encode()
+    if isinstance(value, float):
+        return b"f" + repr(value).encode()
+    return b"s" + str(value).encode("utf-8", "surrogatepass")
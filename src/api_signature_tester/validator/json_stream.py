@@ -0,0 +1,248 @@
+import codecs
+import json
+import math
+import re
+from collections.abc import Iterable, Iterator
+from json.decoder import scanstring  # type: ignore[attr-defined]
+from typing import Any, NoReturn
+
+"""
+Lectura incremental de JSON: convierte un body en una secuencia de eventos
+(inicio/fin de objeto o array, clave, valor escalar) sin construir el
+documento. La memoria depende del tamaño del chunk y de la profundidad de
+anidamiento, no del tamaño del documento.
+"""
+
+START_MAP = "start_map"
+END_MAP = "end_map"
+START_ARRAY = "start_array"
+END_ARRAY = "end_array"
+MAP_KEY = "map_key"
+SCALAR = "scalar"
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(\.\d+)?([eE][-+]?\d+)?")
+# Literales aceptados por json.loads (NaN e Infinity no son JSON estándar)
+_LITERALS: dict[str, Any] = {
+    "true": True,
+    "false": False,
+    "null": None,
+    "NaN": math.nan,
+    "Infinity": math.inf,
+    "-Infinity": -math.inf,
+}
+_MAX_LITERAL = max(len(literal) for literal in _LITERALS)
+
+_EOF = "eof"
+_STRING = "string"
+_PUNCTUATION = frozenset("{}[]:,")
+
+# Estados del parser
+_VALUE = 0
+_ARRAY_FIRST = 1
+_MAP_FIRST_KEY = 2
+_MAP_KEY = 3
+_AFTER_VALUE = 4
+
+
+class JsonStreamError(ValueError):
+    pass
+
+
+def iter_chunks(content: bytes, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator:
+    """Recorre `content` en chunks sin copiarlo (memoryview)."""
+    view = memoryview(content)
+    for start in range(0, len(view), chunk_size):
+        yield view[start : start + chunk_size]
+
+
+class JsonEventReader:
+    """
+    Tokenizador incremental de JSON en UTF-8. `iter_events` devuelve tuplas
+    (evento, valor):
+    - (START_MAP, None), (MAP_KEY, clave), (END_MAP, None)
+    - (START_ARRAY, None), (END_ARRAY, None)
+    - (SCALAR, valor) para strings, números, booleanos y null
+
+    Un documento inválido lanza JsonStreamError al llegar al error; los
+    eventos anteriores ya se entregaron.
+    """
+
+    def __init__(self, chunks: Iterable):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._consumed = 0
+
+    def iter_events(self) -> Iterator[tuple[str, Any]]:
+        stack: list[str] = []
+        state = _VALUE
+        while True:
+            kind, value = self._next_token()
+            if state in (_VALUE, _ARRAY_FIRST):
+                if kind == "]" and state == _ARRAY_FIRST:
+                    stack.pop()
+                    yield END_ARRAY, None
+                    state = _AFTER_VALUE
+                elif kind == "{":
+                    stack.append(START_MAP)
+                    yield START_MAP, None
+                    state = _MAP_FIRST_KEY
+                elif kind == "[":
+                    stack.append(START_ARRAY)
+                    yield START_ARRAY, None
+                    state = _ARRAY_FIRST
+                elif kind in (_STRING, SCALAR):
+                    yield SCALAR, value
+                    state = _AFTER_VALUE
+                else:
+                    self._fail("Expecting value")
+            elif state in (_MAP_FIRST_KEY, _MAP_KEY):
+                if kind == "}" and state == _MAP_FIRST_KEY:
+                    stack.pop()
+                    yield END_MAP, None
+                    state = _AFTER_VALUE
+                elif kind == _STRING:
+                    if self._next_token()[0] != ":":
+                        self._fail("Expecting ':' delimiter")
+                    yield MAP_KEY, value
+                    state = _VALUE
+                else:
+                    self._fail("Expecting property name enclosed in double quotes")
+            elif not stack:
+                if kind != _EOF:
+                    self._fail("Extra data")
+                return
+            elif kind == ",":
+                state = _MAP_KEY if stack[-1] == START_MAP else _VALUE
+            elif kind == "}" and stack[-1] == START_MAP:
+                stack.pop()
+                yield END_MAP, None
+            elif kind == "]" and stack[-1] == START_ARRAY:
+                stack.pop()
+                yield END_ARRAY, None
+            else:
+                self._fail("Expecting ',' delimiter")
+
+    def _next_token(self) -> tuple[str, Any]:
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+            if self._pos < len(self._buffer):
+                break
+            if not self._fill():
+                return _EOF, None
+
+        char = self._buffer[self._pos]
+        if char in _PUNCTUATION:
+            self._pos += 1
+            return char, None
+        if char == '"':
+            return _STRING, self._read_string()
+        return SCALAR, self._read_scalar()
+
+    def _read_string(self) -> str:
+        while True:
+            try:
+                value, end = scanstring(self._buffer, self._pos + 1)
+            except json.JSONDecodeError as e:
+                # El string puede continuar en el próximo chunk
+                if self._fill(grow=True):
+                    continue
+                raise JsonStreamError(
+                    f"{e.msg}: char {self._consumed + e.pos}"
+                ) from None
+            self._pos = end
+            return value
+
+    def _read_scalar(self) -> Any:
+        # Un número o literal al final del buffer puede estar incompleto
+        while not self._eof and len(self._buffer) - self._pos <= _MAX_LITERAL + 1:
+            self._fill()
+        for literal, value in _LITERALS.items():
+            if self._buffer.startswith(literal, self._pos):
+                self._pos += len(literal)
+                return value
+
+        while True:
+            match = _NUMBER.match(self._buffer, self._pos)
+            if match is None:
+                self._fail("Expecting value")
+            if match.end() == len(self._buffer) and self._fill(grow=True):
+                continue
+            break
+        self._pos = match.end()
+        text = match.group()
+        return float(text) if match.group(1) or match.group(2) else int(text)
+
+    def _fill(self, grow: bool = False) -> bool:
+        """
+        Agrega datos al buffer y descarta lo ya consumido. Con `grow` lee
+        hasta duplicar lo pendiente, así un token que ocupa muchos chunks no
+        se vuelve a escanear desde el principio por cada chunk.
+        """
+        if self._eof:
+            return False
+        pending = self._buffer[self._pos :]
+        self._consumed += self._pos
+        target = max(len(pending) * 2, 1) if grow else 1
+        parts = [pending]
+        read = 0
+        while read < target:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                parts.append(self._decoder.decode(b"", final=True))
+                self._eof = True
+                break
+            text = self._decoder.decode(chunk)
+            parts.append(text)
+            read += len(text)
+        self._buffer = "".join(parts)
+        self._pos = 0
+        return True
+
+    def _fail(self, message: str) -> NoReturn:
+        raise JsonStreamError(f"{message}: char {self._consumed + self._pos}")
+
+
+def build_value(events: Iterator[tuple[str, Any]], first: tuple[str, Any]) -> Any:
+    """
+    Construye el valor que empieza con el evento `first`, consumiendo de
+    `events` hasta su cierre.
+    """
+    kind, value = first
+    if kind == SCALAR:
+        return value
+    if kind not in (START_MAP, START_ARRAY):
+        raise JsonStreamError(f"Evento inesperado: {kind}")
+
+    root: Any = {} if kind == START_MAP else []
+    stack: list[Any] = [root]
+    key: Any = None
+    for kind, value in events:
+        container = stack[-1]
+        if kind == MAP_KEY:
+            key = value
+            continue
+        if kind in (END_MAP, END_ARRAY):
+            stack.pop()
+            if not stack:
+                return root
+            continue
+        child = {} if kind == START_MAP else [] if kind == START_ARRAY else value
+        if isinstance(container, dict):
+            container[key] = child
+        else:
+            container.append(child)
+        if kind in (START_MAP, START_ARRAY):
+            stack.append(child)
+    raise JsonStreamError("Documento JSON incompleto")
+
+
+def iter_json_events(
+    content: bytes, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[tuple[str, Any]]:
+    return JsonEventReader(iter_chunks(content, chunk_size)).iter_events()
@@ -0,0 +1,40 @@
+import math
+from collections import deque
+from threading import Lock
+
+from api_signature_tester.validator.http_session_pool import get_host_key
+
+
+class LatencyTracker:
+    """
+    Latencias recientes por scheme+host, usadas para decidir cuándo una
+    request tarda lo suficiente como para enviar un duplicado (hedging).
+    """
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        """
+        :param window: latencias más recientes que se conservan por host.
+        :param min_samples: muestras necesarias antes de estimar percentiles.
+        """
+        self._window = window
+        self._min_samples = min_samples
+        self._samples: dict[str, deque[float]] = {}
+        self._lock = Lock()
+
+    def add(self, url: str, latency_ms: float) -> None:
+        key = get_host_key(url)
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = deque(maxlen=self._window)
+                self._samples[key] = samples
+            samples.append(latency_ms)
+
+    def get_percentile(self, url: str, percentile: float) -> float | None:
+        """Percentil por rango más cercano o None si hay pocas muestras."""
+        with self._lock:
+            samples = sorted(self._samples.get(get_host_key(url), ()))
+        if len(samples) < self._min_samples:
+            return None
+        rank = max(1, math.ceil(percentile / 100 * len(samples)))
+        return samples[rank - 1]
@@ -1,54 +1,397 @@
+import random
+import statistics
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from datetime import timedelta
+from threading import Lock
 from typing import Any
 
 import requests
 from requests.models import Response
 
+from api_signature_tester.validator.host_scheduler import HostScheduler
+from api_signature_tester.validator.http_session_pool import (
+    HttpSessionPool,
+    PoolStats,
+)
+from api_signature_tester.validator.json_canonical import canonical_hash
+from api_signature_tester.validator.json_decoder import JsonDecoder, get_json_decoder
+from api_signature_tester.validator.latency_tracker import LatencyTracker
+from api_signature_tester.validator.response_cache import ResponseCache
 from api_signature_tester.validator.validator_model import (
+    FAST_PATH_BYTES,
+    FAST_PATH_CANONICAL,
+    BodyDiff,
+    CaseMetrics,
     ComparationResult,
+    DecodedCase,
+    DiffType,
     EndpointData,
+    LatencyPolicy,
+    RequestMetrics,
+    RetryPolicy,
     TestResult,
 )
 
+# Atributo que `_send_request` agrega a la respuesta con el tiempo total de la
+# request. `elapsed` de requests solo mide hasta recibir los headers.
+TOTAL_ELAPSED_ATTR = "total_elapsed"
+# Latencias (ms) de las muestras extra tomadas para comparar tiempos.
+LATENCY_SAMPLES_ATTR = "latency_samples_ms"
+# Reintentos, timeouts y hedging de la request que produjo la respuesta.
+RETRIES_ATTR = "retries"
+TIMEOUTS_ATTR = "timeouts"
+HEDGED_ATTR = "hedged"
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+# Errores que son una respuesta estable del API y se pueden grabar en el cache
+CACHEABLE_ERROR_STATUS_CODES = frozenset({404, 410})
+
+
+class RequestError(Exception):
+    """
+    Request que no obtuvo respuesta: se agotaron los reintentos ante errores
+    de conexión o timeouts, o en replay no hay respuesta grabada. El caso se
+    reporta como fallido (DiffType.REQUEST_ERROR) en lugar de cortar la
+    ejecución, con los reintentos, timeouts y hedging de la request.
+    """
+
+    def __init__(
+        self, message: str, retries: int = 0, timeouts: int = 0, hedged: bool = False
+    ):
+        super().__init__(message)
+        self._retries = retries
+        self._timeouts = timeouts
+        self._hedged = hedged
+
+    def get_retries(self) -> int:
+        return self._retries
+
+    def get_timeouts(self) -> int:
+        return self._timeouts
+
+    def is_hedged(self) -> bool:
+        return self._hedged
+
+
+# Respuesta de un lado del caso o el error si no la hubo
+RequestOutcome = Response | RequestError
+
 
 class PipelineApiValidaror(ABC):
-    def execute(self, source: EndpointData, new: EndpointData) -> TestResult:
+    DEFAULT_PARALLEL_WORKERS = 16
+
+    def __init__(
+        self,
+        parallel_requests: bool = False,
+        parallel_workers: int | None = None,
+        session_pool: HttpSessionPool | None = None,
+        response_cache: ResponseCache | None = None,
+        latency_policy: LatencyPolicy | None = None,
+        scheduler: HostScheduler | None = None,
+        retry_policy: RetryPolicy | None = None,
+        json_decoder: JsonDecoder | None = None,
+    ):
+        """
+        :param parallel_requests: si es True, las requests a source y new de un
+            mismo caso se envían al mismo tiempo.
+        :param parallel_workers: tamaño del pool de threads usado en modo
+            paralelo. Debe cubrir la cantidad de casos en vuelo del motor.
+        :param session_pool: pool de sesiones keep-alive por host. Si es None
+            se usan las funciones de módulo de `requests`.
+        :param response_cache: cache en disco de respuestas (record/replay).
+            Con cache, las respuestas de source se reutilizan entre ejecuciones.
+        :param latency_policy: si está definida, un caso también falla cuando
+            new es más lento que source más allá de los límites de la política.
+        :param scheduler: limita el rate y las requests en vuelo por host. Se
+            comparte entre todos los casos en vuelo del motor.
+        :param retry_policy: timeouts, reintentos y hedging de las requests. Si
+            es None las requests no tienen timeout ni se reintentan.
+        :param json_decoder: backend con el que se decodifican los bodies; por
+            defecto orjson si está instalado y si no la stdlib.
+        """
+        self._parallel_requests = parallel_requests
+        self._parallel_workers = (
+            parallel_workers
+            if parallel_workers is not None
+            else self.DEFAULT_PARALLEL_WORKERS
+        )
+        self._request_executor: ThreadPoolExecutor | None = None
+        self._request_executor_lock = Lock()
+        self._session_pool = session_pool
+        self._response_cache = response_cache
+        self._latency_policy = latency_policy
+        self._scheduler = scheduler
+        self._retry_policy = retry_policy
+        self._json_decoder = (
+            json_decoder if json_decoder is not None else get_json_decoder()
+        )
+        self._hedge_executor: ThreadPoolExecutor | None = None
+        self._latency_tracker = LatencyTracker(
+            min_samples=RetryPolicy.HEDGE_MIN_SAMPLES
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Los recursos de red y threads no se copian a otros procesos: allí
+        # solo se ejecuta la etapa de comparación.
+        state = self.__dict__.copy()
+        state["_request_executor"] = None
+        state["_request_executor_lock"] = None
+        state["_session_pool"] = None
+        state["_response_cache"] = None
+        state["_scheduler"] = None
+        state["_hedge_executor"] = None
+        state["_latency_tracker"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._request_executor_lock = Lock()
+
+    def close(self) -> None:
+        """Libera los recursos compartidos entre casos (threads y sesiones)."""
+        with self._request_executor_lock:
+            if self._request_executor is not None:
+                self._request_executor.shutdown(wait=True)
+                self._request_executor = None
+            if self._hedge_executor is not None:
+                self._hedge_executor.shutdown(wait=True)
+                self._hedge_executor = None
+        if self._session_pool is not None:
+            self._session_pool.close()
+
+    def get_pool_stats(self) -> PoolStats | None:
+        """Estadísticas del pool de conexiones o None si no se usa pool."""
+        if self._session_pool is None:
+            return None
+        return self._session_pool.get_stats()
+
+    def get_scheduler(self) -> HostScheduler | None:
+        return self._scheduler
+
+    def get_json_decoder(self) -> JsonDecoder:
+        return self._json_decoder
+
+    def execute(
+        self,
+        source: EndpointData,
+        new: EndpointData,
+        test_path_json: str | None = None,
+        case_id: int | None = None,
+    ) -> TestResult:
         """
         Test the given endpoint function by making a request to the specified URL
         :param source: EndpointData object containing URL, method, params, headers
         :param new: EndpointData object containing URL, method, params, headers
+        :param test_path_json: JMESPath expression of the case; when present it
+            overrides the pipeline default and only that part of the body is
+            compared
+        :param case_id: position of the case in the input, copied to the result
         """
         response_source, response_new = self._exetute_requests(source, new)
+        decoded_case = self.decode_case(
+            source, new, response_source, response_new, test_path_json, case_id
+        )
+        return self.compare_decoded_case(decoded_case)
+
+    def decode_case(
+        self,
+        source: EndpointData,
+        new: EndpointData,
+        response_source: RequestOutcome,
+        response_new: RequestOutcome,
+        test_path_json: str | None = None,
+        case_id: int | None = None,
+    ) -> DecodedCase:
+        """
+        Etapa de decodificación: extrae de las respuestas todo lo que necesita
+        la comparación. El DecodedCase resultante no tiene referencias a las
+        respuestas HTTP, por lo que puede enviarse a otro proceso.
+
+        Si alguna request falló (RequestError) el caso no tiene bodies: solo
+        lleva el error y las métricas de ambos lados.
+        """
+        started = time.perf_counter()
+        if isinstance(response_source, RequestError) or isinstance(
+            response_new, RequestError
+        ):
+            return DecodedCase(
+                source,
+                new,
+                {},
+                None,
+                None,
+                metrics=CaseMetrics(
+                    self.get_request_metrics(response_source),
+                    self.get_request_metrics(response_new),
+                    decode_ms=(time.perf_counter() - started) * 1000,
+                    json_decoder=self._json_decoder.get_name(),
+                ),
+                case_id=case_id,
+                request_errors=self.create_request_error_diff(
+                    response_source, response_new
+                ),
+            )
 
         compare_status_code_result = self.compare_status_code(
             response_source, response_new
         )
+        diff_status_code = compare_status_code_result.get("status_code", {})
+
+        # Fast path: bodies idénticos byte a byte no necesitan decodificarse
+        content_source = getattr(response_source, "content", None)
+        streaming = False
+        if content_source is not None and content_source == getattr(
+            response_new, "content", None
+        ):
+            j1, j2 = None, None
+            fast_path: str | None = FAST_PATH_BYTES
+        else:
+            fast_path = None
+            if not test_path_json and self.use_streaming_diff(
+                response_source, response_new
+            ):
+                # Sin decodificar: el diff lee los bytes de forma incremental
+                j1, j2 = content_source, response_new.content
+                streaming = True
+            elif test_path_json:
+                j1, j2 = self.get_body_response_for_path(
+                    response_source, response_new, test_path_json
+                )
+            else:
+                j1, j2 = self.get_body_response(response_source, response_new)
+
+        metrics = CaseMetrics(
+            self.get_request_metrics(response_source),
+            self.get_request_metrics(response_new),
+            decode_ms=(time.perf_counter() - started) * 1000,
+            json_decoder=self._json_decoder.get_name(),
+        )
+        return DecodedCase(
+            source,
+            new,
+            diff_status_code,
+            j1,
+            j2,
+            fast_path,
+            metrics,
+            case_id,
+            streaming,
+        )
+
+    def get_request_metrics(self, response: RequestOutcome) -> RequestMetrics:
+        """
+        Métricas de la respuesta. Las respuestas que no salieron de
+        `_send_request` (cache, dobles de test) no tienen latencia; una
+        request fallida solo tiene reintentos, timeouts y hedging.
+        """
+        if isinstance(response, RequestError):
+            return RequestMetrics(
+                None,
+                None,
+                None,
+                retries=response.get_retries(),
+                timeouts=response.get_timeouts(),
+                hedged=response.is_hedged(),
+            )
+        total_elapsed = getattr(response, TOTAL_ELAPSED_ATTR, None)
+        elapsed = getattr(response, "elapsed", None)
+        content = getattr(response, "content", None)
+        latency_samples = getattr(response, LATENCY_SAMPLES_ATTR, None)
+        return RequestMetrics(
+            latency_ms=(
+                total_elapsed.total_seconds() * 1000
+                if isinstance(total_elapsed, timedelta)
+                else None
+            ),
+            ttfb_ms=(
+                elapsed.total_seconds() * 1000
+                if isinstance(total_elapsed, timedelta)
+                and isinstance(elapsed, timedelta)
+                else None
+            ),
+            response_bytes=len(content) if isinstance(content, bytes) else None,
+            latency_samples_ms=(
+                latency_samples if isinstance(latency_samples, list) else None
+            ),
+            retries=_get_int_attr(response, RETRIES_ATTR),
+            timeouts=_get_int_attr(response, TIMEOUTS_ATTR),
+            hedged=getattr(response, HEDGED_ATTR, False) is True,
+        )
+
+    def compare_decoded_case(self, decoded_case: DecodedCase) -> TestResult:
+        """Etapa de comparación: diff de los bodies ya decodificados."""
+        started = time.perf_counter()
+        if decoded_case.get_request_errors():
+            return self._create_test_result(
+                decoded_case, decoded_case.get_request_errors(), None, started
+            )
+        if decoded_case.get_fast_path() == FAST_PATH_BYTES:
+            return self._create_test_result(decoded_case, [], FAST_PATH_BYTES, started)
+
+        j1 = decoded_case.get_body_source()
+        j2 = decoded_case.get_body_new()
+        if decoded_case.is_streaming():
+            return self._create_test_result(
+                decoded_case, self.compare_body_stream(j1, j2), None, started
+            )
 
         body_all_diffs = []
-        j1, j2 = self.get_body_response(response_source, response_new)
+        fast_path = None
         compare_format_result = self.compare_format_body(j1, j2)
         body_all_diffs.extend(compare_format_result)
 
         if len(compare_format_result) == 0:
-            compare_body_result = self.compare_body(j1, j2)
-            body_all_diffs.extend(compare_body_result)
+            # Fast path: mismo JSON canónico (claves ordenadas, números
+            # normalizados), no hace falta el diff completo
+            if canonical_hash(j1) == canonical_hash(j2):
+                fast_path = FAST_PATH_CANONICAL
+            else:
+                compare_body_result = self.compare_body(j1, j2)
+                body_all_diffs.extend(compare_body_result)
 
-        respoinse_comparation_equals = True
-
-        if compare_format_result is None or len(body_all_diffs) > 0:
-            respoinse_comparation_equals = False
+        return self._create_test_result(
+            decoded_case, body_all_diffs, fast_path, started
+        )
 
+    def _create_test_result(
+        self,
+        decoded_case: DecodedCase,
+        body_all_diffs: list[BodyDiff],
+        fast_path: str | None,
+        started: float,
+    ) -> TestResult:
+        metrics = decoded_case.get_metrics()
+        diff_latency = self.compare_latency(metrics).get("latency", {})
         result = ComparationResult(
-            respoinse_comparation_equals,
-            compare_status_code_result.get("status_code", {}),
+            len(body_all_diffs) == 0 and not diff_latency,
+            decoded_case.get_diff_status_code(),
             body_all_diffs,
+            fast_path,
+            diff_latency,
+        )
+        if metrics is not None:
+            metrics = CaseMetrics(
+                metrics.get_source(),
+                metrics.get_new(),
+                metrics.get_decode_ms(),
+                (time.perf_counter() - started) * 1000,
+                metrics.get_json_decoder(),
+            )
+        return TestResult(
+            decoded_case.get_source(),
+            decoded_case.get_new(),
+            result,
+            metrics,
+            decoded_case.get_case_id(),
         )
-
-        return TestResult(source, new, result)
 
     def _exetute_requests(
         self, source: EndpointData, new: EndpointData
-    ) -> tuple[requests.Response, requests.Response]:
+    ) -> tuple[RequestOutcome, RequestOutcome]:
         """
         Docstring para _exetute_requests
         :param source: Descripción
@@ -56,24 +399,263 @@ class PipelineApiValidaror(ABC):
         :param new: Descripción
         :type new: EndpointData
         :return: Descripción
-        :rtype: tuple[Response, Response]
+        :rtype: tuple[Response | RequestError, Response | RequestError]
         """
-        response_source = self._get_rest_function(source.get_method())(
-            url=source.get_url(),
-            params=source.get_params(),
-            headers=source.get_headers(),
+        if self._parallel_requests:
+            response_source, response_new = self._exetute_requests_parallel(source, new)
+        else:
+            response_source = self._send_or_fail(self._send_source_request, source)
+            response_new = self._send_or_fail(self._send_new_request, new)
+
+        self._sample_latencies(source, new, response_source, response_new)
+        return response_source, response_new
+
+    def _sample_latencies(
+        self,
+        source: EndpointData,
+        new: EndpointData,
+        response_source: RequestOutcome,
+        response_new: RequestOutcome,
+    ) -> None:
+        """
+        Repite las requests hasta juntar `samples` latencias por lado y las
+        guarda en las respuestas. Source y new se alternan para que una
+        variación de la red afecte a ambos por igual. Si alguna respuesta
+        salió del cache o falló no se muestrea: su latencia no es comparable.
+        Si falla una muestra se conservan las tomadas hasta ese momento.
+
+        Los métodos no idempotentes (POST) no se repiten, porque cada request
+        crearía recursos en ambos sistemas: se compara la única muestra.
+        """
+        policy = self._latency_policy
+        if policy is None or policy.get_samples() < 2:
+            return
+        if any(
+            endpoint.get_method().upper() not in IDEMPOTENT_METHODS
+            for endpoint in (source, new)
+        ):
+            return
+        first_source = getattr(response_source, TOTAL_ELAPSED_ATTR, None)
+        first_new = getattr(response_new, TOTAL_ELAPSED_ATTR, None)
+        if first_source is None or first_new is None:
+            return
+
+        source_samples = [first_source.total_seconds() * 1000]
+        new_samples = [first_new.total_seconds() * 1000]
+        try:
+            for _ in range(policy.get_samples() - 1):
+                for endpoint, samples in (
+                    (source, source_samples),
+                    (new, new_samples),
+                ):
+                    sample = self._send_request(endpoint)
+                    samples.append(
+                        getattr(sample, TOTAL_ELAPSED_ATTR).total_seconds() * 1000
+                    )
+        except RequestError:
+            pass
+        setattr(response_source, LATENCY_SAMPLES_ATTR, source_samples)
+        setattr(response_new, LATENCY_SAMPLES_ATTR, new_samples)
+
+    def _exetute_requests_parallel(
+        self, source: EndpointData, new: EndpointData
+    ) -> tuple[RequestOutcome, RequestOutcome]:
+        """
+        Envía la request a source en el pool de threads y la de new en el
+        thread actual, por lo que la latencia del caso es el máximo de ambas
+        en lugar de la suma.
+        """
+        future_source = self._get_request_executor().submit(
+            self._send_or_fail, self._send_source_request, source
         )
-        response_new = self._get_rest_function(new.get_method())(
-            url=new.get_url(), params=new.get_params(), headers=new.get_headers()
+        response_new = self._send_or_fail(self._send_new_request, new)
+        return future_source.result(), response_new
+
+    @staticmethod
+    def _send_or_fail(
+        send: Callable[[EndpointData], requests.Response], endpoint: EndpointData
+    ) -> RequestOutcome:
+        """Devuelve el RequestError en lugar de propagarlo, para reportar el caso."""
+        try:
+            return send(endpoint)
+        except RequestError as e:
+            return e
+
+    def _get_request_executor(self) -> ThreadPoolExecutor:
+        with self._request_executor_lock:
+            if self._request_executor is None:
+                self._request_executor = ThreadPoolExecutor(
+                    max_workers=self._parallel_workers,
+                    thread_name_prefix="api-signature-request",
+                )
+            return self._request_executor
+
+    def _send_source_request(self, endpoint: EndpointData) -> requests.Response:
+        """
+        Request al endpoint source (la versión ya liberada). Con cache se
+        reutiliza la respuesta grabada si sigue vigente.
+        """
+        return self._send_cached_request(endpoint, read_cache=True)
+
+    def _send_new_request(self, endpoint: EndpointData) -> requests.Response:
+        """Request al endpoint new; solo se lee del cache en modo replay."""
+        return self._send_cached_request(endpoint, read_cache=False)
+
+    def _send_cached_request(
+        self, endpoint: EndpointData, read_cache: bool
+    ) -> requests.Response:
+        cache = self._response_cache
+        if cache is None:
+            return self._send_request(endpoint)
+
+        if read_cache or cache.is_replay():
+            cached_response = cache.get(endpoint)
+            if cached_response is not None:
+                return cached_response
+            if cache.is_replay():
+                # Grabación parcial (filas nuevas en el CSV): falla solo el caso
+                raise RequestError(
+                    "No hay respuesta grabada para "
+                    f"{endpoint.get_method()} {endpoint.get_url()}"
+                )
+
+        response = self._send_request(endpoint)
+        # Los errores suelen ser transitorios (5xx, 429, credenciales
+        # vencidas): solo se graban las respuestas correctas y 404/410
+        if (
+            response.status_code < 400
+            or response.status_code in CACHEABLE_ERROR_STATUS_CODES
+        ):
+            cache.put(endpoint, response)
+        return response
+
+    def _send_request(self, endpoint: EndpointData) -> requests.Response:
+        """
+        Envía la request aplicando la política de reintentos: los métodos
+        idempotentes se reintentan ante errores de conexión, timeouts o
+        status 429/502/503/504, con backoff exponencial y jitter. Si se agotan
+        los reintentos se devuelve la última respuesta o, si no hubo respuesta,
+        se lanza RequestError con los reintentos y timeouts.
+        """
+        policy = self._retry_policy
+        if policy is None:
+            try:
+                return self._send_once(endpoint)
+            except requests.RequestException as e:
+                raise RequestError(_describe_error(e)) from e
+
+        idempotent = endpoint.get_method().upper() in IDEMPOTENT_METHODS
+        max_retries = policy.get_retries() if idempotent else 0
+        retries = 0
+        timeouts = 0
+        hedged = False
+        while True:
+            try:
+                response, attempt_hedged = self._send_attempt(endpoint, idempotent)
+            except requests.RequestException as e:
+                if isinstance(e, requests.Timeout):
+                    timeouts += 1
+                if retries >= max_retries or not isinstance(
+                    e, (requests.ConnectionError, requests.Timeout)
+                ):
+                    raise RequestError(
+                        _describe_error(e), retries, timeouts, hedged
+                    ) from e
+            else:
+                hedged = hedged or attempt_hedged
+                if (
+                    retries >= max_retries
+                    or response.status_code not in RETRY_STATUS_CODES
+                ):
+                    setattr(response, RETRIES_ATTR, retries)
+                    setattr(response, TIMEOUTS_ATTR, timeouts)
+                    setattr(response, HEDGED_ATTR, hedged)
+                    return response
+
+            # Jitter para que los casos que fallaron juntos no reintenten juntos
+            backoff = policy.get_backoff_seconds(retries)
+            time.sleep(random.uniform(backoff / 2, backoff))  # noqa: S311
+            retries += 1
+
+    def _send_attempt(
+        self, endpoint: EndpointData, idempotent: bool
+    ) -> tuple[requests.Response, bool]:
+        """
+        Un intento de la request. Con hedging, si la request no respondió al
+        llegar al p95 de latencia de su host se envía un duplicado y se usa la
+        primera respuesta correcta. Devuelve la respuesta y si hubo duplicado.
+        """
+        policy = self._retry_policy
+        hedge_after_ms = None
+        if policy is not None and policy.is_hedging() and idempotent:
+            hedge_after_ms = self._latency_tracker.get_percentile(
+                endpoint.get_url(), 95
+            )
+        if hedge_after_ms is None:
+            return self._send_once(endpoint), False
+
+        executor = self._get_hedge_executor()
+        first = executor.submit(self._send_once, endpoint)
+        done, _ = wait([first], timeout=hedge_after_ms / 1000)
+        if done:
+            return first.result(), False
+
+        futures: list[Future] = [first, executor.submit(self._send_once, endpoint)]
+        error: BaseException | None = None
+        for future in as_completed(futures):
+            error = future.exception()
+            if error is None:
+                # La request que pierde sigue en el executor y se descarta
+                return future.result(), True
+        raise error if error is not None else AssertionError("unreachable")
+
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        with self._request_executor_lock:
+            if self._hedge_executor is None:
+                # Separado del executor de requests paralelas: un thread de
+                # ese pool puede estar esperando la request con hedging.
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=self._parallel_workers * 2,
+                    thread_name_prefix="api-signature-hedge",
+                )
+            return self._hedge_executor
+
+    def _send_once(self, endpoint: EndpointData) -> requests.Response:
+        rest_function = self._get_rest_function(
+            endpoint.get_method(), endpoint.get_url()
         )
-        return response_source, response_new
+        kwargs: dict[str, Any] = {
+            "url": endpoint.get_url(),
+            "params": endpoint.get_params(),
+            "headers": endpoint.get_headers(),
+        }
+        timeout = self._retry_policy.get_timeout() if self._retry_policy else None
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+        def send() -> requests.Response:
+            started = time.perf_counter()
+            response = rest_function(**kwargs)
+            elapsed = time.perf_counter() - started
+            setattr(response, TOTAL_ELAPSED_ATTR, timedelta(seconds=elapsed))
+            if self._latency_tracker is not None:
+                self._latency_tracker.add(endpoint.get_url(), elapsed * 1000)
+            return response
+
+        if self._scheduler is None:
+            return send()
+        # La espera del scheduler no se cuenta en la latencia de la request
+        return self._scheduler.send(endpoint.get_url(), send)
 
-    def _get_rest_function(self, method: str):
+    def _get_rest_function(self, method: str, url: str | None = None):
         """
         Docstring para _get_rest_function
 
         :param method: Descripción
         :type method: str
+        :param url: URL destino; si hay pool de sesiones se usa la sesión de
+            su host.
+        :type url: str | None
         """
         result = {
             "get": requests.get,
@@ -85,6 +667,9 @@ class PipelineApiValidaror(ABC):
         if result is None:
             raise TypeError(f"Unknown HTTP method for new: {method}")
 
+        if self._session_pool is not None and url is not None:
+            return getattr(self._session_pool.get_session(url), method.lower())
+
         return result
 
     def compare_status_code(self, r1: Response, r2: Response) -> dict[str, Any]:
@@ -102,34 +687,106 @@ class PipelineApiValidaror(ABC):
 
         return {}
 
+    def compare_latency(self, metrics: CaseMetrics | None) -> dict[str, Any]:
+        """
+        Devuelve un dict con la regresión de latencia (medianas de source y new)
+        o un dict vacío si no hay política, no hay muestras o new está dentro
+        de los límites.
+        """
+        policy = self._latency_policy
+        if policy is None or metrics is None:
+            return {}
+        source_samples = metrics.get_source().get_latency_samples_ms()
+        new_samples = metrics.get_new().get_latency_samples_ms()
+        if not source_samples or not new_samples:
+            return {}
+
+        source_ms = statistics.median(source_samples)
+        new_ms = statistics.median(new_samples)
+        max_ratio = policy.get_max_ratio()
+        budget_ms = policy.get_budget_ms()
+        exceeds_ratio = max_ratio is not None and new_ms > source_ms * max_ratio
+        exceeds_budget = budget_ms is not None and new_ms - source_ms > budget_ms
+        if not exceeds_ratio and not exceeds_budget:
+            return {}
+
+        return {
+            "latency": {
+                "old_value": round(source_ms, 3),
+                "new_value": round(new_ms, 3),
+                "ratio": round(new_ms / source_ms, 3) if source_ms > 0 else None,
+                "samples": min(len(source_samples), len(new_samples)),
+            }
+        }
+
     @abstractmethod
     def get_body_response(self, r1: Response, r2: Response) -> tuple[Any, Any]:
         raise NotImplementedError
 
+    def get_body_response_for_path(
+        self, r1: Response, r2: Response, path: str
+    ) -> tuple[Any, Any]:
+        raise NotImplementedError(
+            f"{type(self).__name__} no soporta rutas de validación por caso"
+        )
+
     @abstractmethod
-    def compare_body(self, j1, j2) -> list[dict[str, Any]]:
+    def compare_body(self, j1, j2) -> list[BodyDiff]:
         raise NotImplementedError
 
-    def compare_format_body(self, j1, j2) -> list[dict[str, Any]]:
+    def use_streaming_diff(self, r1: Response, r2: Response) -> bool:
+        """Si el caso se compara con el diff incremental en lugar de `compare_body`."""
+        return False
+
+    def compare_body_stream(
+        self, content_source: bytes, content_new: bytes
+    ) -> list[BodyDiff]:
+        raise NotImplementedError(f"{type(self).__name__} no soporta diff incremental")
+
+    def compare_format_body(self, j1, j2) -> list[BodyDiff]:
         # Si alguna respuesta no es JSON, registramos el error y devolvemos
         # un ComparationResult
         if j1 is None or j2 is None:
-            return [
-                self.create_body_diff(
-                    "format_error",
-                    ".",
-                    f"source_is_json {j1 is not None}",
-                    f"new_is_json {j2 is not None}",
-                )
-            ]
+            return self.create_format_diff(j1 is not None, j2 is not None)
         return []
 
+    def create_format_diff(
+        self, source_is_json: bool, new_is_json: bool
+    ) -> list[BodyDiff]:
+        return [
+            self.create_body_diff(
+                DiffType.FORMAT_ERROR,
+                ".",
+                f"source_is_json {source_is_json}",
+                f"new_is_json {new_is_json}",
+            )
+        ]
+
+    def create_request_error_diff(
+        self, response_source: RequestOutcome, response_new: RequestOutcome
+    ) -> list[BodyDiff]:
+        """Diff con el error de cada lado cuya request no obtuvo respuesta."""
+        return [
+            self.create_body_diff(
+                DiffType.REQUEST_ERROR,
+                ".",
+                str(response_source)
+                if isinstance(response_source, RequestError)
+                else "",
+                str(response_new) if isinstance(response_new, RequestError) else "",
+            )
+        ]
+
     def create_body_diff(
-        self, type: str, path: str, old_value: str, new_value: str
-    ) -> dict:
-        return {
-            "Tipo": type,
-            "Ruta": path,
-            "Valor anterior": old_value,
-            "Valor nuevo": new_value,
-        }
+        self, type: DiffType | str, path: str, old_value: Any, new_value: Any
+    ) -> BodyDiff:
+        return BodyDiff(type, path, old_value, new_value)
+
+
+def _describe_error(error: BaseException) -> str:
+    return f"{type(error).__name__}: {error}"
+
+
+def _get_int_attr(response: Response, name: str) -> int:
+    value = getattr(response, name, 0)
+    return value if isinstance(value, int) else 0
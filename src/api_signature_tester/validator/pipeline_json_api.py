@@ -1,55 +1,220 @@
-import json
+import codecs
 from typing import Any
 
-import jmespath
 from deepdiff import DeepDiff
 from deepdiff.helper import SetOrdered
 from requests.models import Response
 
+from api_signature_tester.validator import jmespath_cache
+from api_signature_tester.validator.array_rules import ArrayRules
+from api_signature_tester.validator.json_merkle import (
+    FRAGMENT_ITEMS,
+    FRAGMENT_KEYS,
+    THRESHOLD_TO_DIFF_DEEPER,
+    ChangedFragment,
+    find_changed_fragments,
+)
+from api_signature_tester.validator.json_stream import (
+    JsonStreamError,
+    iter_json_events,
+)
 from api_signature_tester.validator.pipeline_api_validaror import PipelineApiValidaror
+from api_signature_tester.validator.stream_diff import StreamingJsonDiff, child_path
+from api_signature_tester.validator.validator_model import BodyDiff, DiffType
+
+# Orden de los tipos de diff en el resultado de `compare_body`
+_BODY_DIFF_TYPES = (
+    DiffType.VALUE_CHANGED,
+    DiffType.ITEM_ADDED,
+    DiffType.ITEM_REMOVED,
+    DiffType.KEY_ADDED,
+    DiffType.KEY_REMOVED,
+)
 
 
 class PipelineFullJsonApiValidator(PipelineApiValidaror):
-    def __init__(self):
-        pass
+    def __init__(
+        self,
+        streaming_diff_min_bytes: int | None = None,
+        array_rules: ArrayRules | None = None,
+        **kwargs: Any,
+    ):
+        """
+        :param streaming_diff_min_bytes: a partir de este tamaño de body (en
+            cualquiera de los dos lados) los bodies no se decodifican y se
+            comparan con `compare_body_stream`. None desactiva el modo.
+        :param array_rules: cómo se comparan los arrays de cada ruta
+            (ordenados, sin orden o por clave). Sin regla, sin orden.
+        """
+        super().__init__(**kwargs)
+        self._streaming_diff_min_bytes = streaming_diff_min_bytes
+        self._array_rules = array_rules if array_rules is not None else ArrayRules()
 
     def get_body_response(self, r1: Response, r2: Response) -> tuple[Any, Any]:
-        j1 = None
-        j2 = None
+        return self.decode_bodies(r1, r2)
+
+    def get_body_response_for_path(
+        self, r1: Response, r2: Response, path: str
+    ) -> tuple[Any, Any]:
+        """Decodifica ambos bodies y aplica la expresión JMESPath del caso."""
+        j1, j2 = self.decode_bodies(r1, r2)
+        return self.search_path(path, j1), self.search_path(path, j2)
+
+    def search_path(self, path: str, body: Any) -> Any:
+        if body is None:
+            return None
+        return jmespath_cache.search(path, body)
+
+    def decode_bodies(self, r1: Response, r2: Response) -> tuple[Any, Any]:
+        return self.decode_body(r1), self.decode_body(r2)
+
+    def decode_body(self, response: Response) -> Any:
+        """
+        Decodifica el body con el `JsonDecoder` del pipeline a partir de los
+        bytes crudos. Si la respuesta declara un charset que no es UTF-8
+        (`application/json; charset=latin-1`), el texto se obtiene con
+        `Response.text`, que respeta ese charset. Las respuestas sin bytes
+        (dobles de test) usan `Response.json()`. Devuelve None si el body no
+        es JSON.
+        """
+        content = getattr(response, "content", None)
         try:
-            j1 = r1.json()
-        except json.JSONDecodeError:
-            j1 = None
+            if isinstance(content, bytes):
+                if _has_non_utf8_encoding(response):
+                    content = response.text.encode("utf-8")
+                return self._json_decoder.decode(content)
+            return response.json()
+        except ValueError:  # JSONDecodeError y UnicodeDecodeError
+            return None
+
+    def use_streaming_diff(self, r1: Response, r2: Response) -> bool:
+        if self._streaming_diff_min_bytes is None:
+            return False
+        content_source = getattr(r1, "content", None)
+        content_new = getattr(r2, "content", None)
+        if not isinstance(content_source, bytes) or not isinstance(content_new, bytes):
+            return False
+        if _has_non_utf8_encoding(r1) or _has_non_utf8_encoding(r2):
+            return False  # El tokenizer incremental solo lee UTF-8
+        return (
+            max(len(content_source), len(content_new)) >= self._streaming_diff_min_bytes
+        )
 
+    def compare_body_stream(
+        self, content_source: bytes, content_new: bytes
+    ) -> list[BodyDiff]:
+        """
+        Diff incremental de bodies muy grandes: tokeniza ambos bodies a la
+        par sin construir los documentos (`StreamingJsonDiff`). Los arrays se
+        comparan por posición. Si algún body no es JSON se devuelve el mismo
+        error de formato que `compare_format_body`.
+        """
         try:
-            j2 = r2.json()
-        except json.JSONDecodeError:
-            j2 = None
+            return StreamingJsonDiff(self.create_body_diff).compare(
+                iter_json_events(content_source), iter_json_events(content_new)
+            )
+        except JsonStreamError:
+            return self.create_format_diff(
+                _is_json_stream(content_source), _is_json_stream(content_new)
+            )
+
+    def compare_body(self, j1, j2) -> list[BodyDiff]:
+        """
+        Diff detallado con DeepDiff (`ignore_order=True`) solo sobre los
+        fragmentos cuyo hash de subárbol difiere (`find_changed_fragments`),
+        así el costo depende del tamaño del cambio y no del documento. Las
+        rutas se traducen al documento completo. Los arrays con regla
+        `ordered` o `keyed` se emparejan antes y solo se comparan los pares.
+        """
+        diffs_by_type: dict[DiffType, list[BodyDiff]] = {
+            diff_type: [] for diff_type in _BODY_DIFF_TYPES
+        }
+        for fragment in find_changed_fragments(j1, j2, self._array_rules):
+            if fragment.get_kind() == FRAGMENT_KEYS:
+                self._collect_key_diffs(fragment, diffs_by_type)
+                continue
+            if fragment.get_kind() == FRAGMENT_ITEMS:
+                self._collect_item_diffs(fragment, diffs_by_type)
+                continue
+            deep_diff_body = DeepDiff(
+                fragment.get_source(),
+                fragment.get_new(),
+                ignore_order=True,
+                threshold_to_diff_deeper=THRESHOLD_TO_DIFF_DEEPER,
+            )
+            self._collect_body_diffs(deep_diff_body, fragment, diffs_by_type)
+        return [diff for diffs in diffs_by_type.values() for diff in diffs]
 
-        return j1, j2
+    def _collect_key_diffs(
+        self,
+        fragment: ChangedFragment,
+        diffs_by_type: dict[DiffType, list[BodyDiff]],
+    ) -> None:
+        path = fragment.get_path()
+        for key in fragment.get_new():
+            diffs_by_type[DiffType.KEY_ADDED].append(
+                self.create_body_diff(DiffType.KEY_ADDED, child_path(path, key), "", "")
+            )
+        for key in fragment.get_source():
+            diffs_by_type[DiffType.KEY_REMOVED].append(
+                self.create_body_diff(
+                    DiffType.KEY_REMOVED, child_path(path, key), "", ""
+                )
+            )
 
-    def compare_body(self, j1, j2) -> list[dict[str, Any]]:
-        deep_diff_body = DeepDiff(j1, j2, ignore_order=True)
-        diffs_body = []
+    def _collect_item_diffs(
+        self,
+        fragment: ChangedFragment,
+        diffs_by_type: dict[DiffType, list[BodyDiff]],
+    ) -> None:
+        path = fragment.get_path()
+        for index, value in fragment.get_new().items():
+            diffs_by_type[DiffType.ITEM_ADDED].append(
+                self.create_body_diff(
+                    DiffType.ITEM_ADDED, child_path(path, index), "", value
+                )
+            )
+        for index, value in fragment.get_source().items():
+            diffs_by_type[DiffType.ITEM_REMOVED].append(
+                self.create_body_diff(
+                    DiffType.ITEM_REMOVED, child_path(path, index), value, ""
+                )
+            )
 
+    def _collect_body_diffs(
+        self,
+        deep_diff_body: DeepDiff,
+        fragment: ChangedFragment,
+        diffs_by_type: dict[DiffType, list[BodyDiff]],
+    ) -> None:
         # Valores cambiados
         for path, change in deep_diff_body.get("values_changed", {}).items():
-            diffs_body.append(
+            diffs_by_type[DiffType.VALUE_CHANGED].append(
                 self.create_body_diff(
-                    "Cambio de valor", path, change["old_value"], change["new_value"]
+                    DiffType.VALUE_CHANGED,
+                    fragment.resolve_path(path),
+                    change["old_value"],
+                    change["new_value"],
                 )
             )
 
         # Elementos añadidos
         for path, value in deep_diff_body.get("iterable_item_added", {}).items():
-            diffs_body.append(
-                self.create_body_diff("Elemento añadido", path, "", value)
+            diffs_by_type[DiffType.ITEM_ADDED].append(
+                self.create_body_diff(
+                    DiffType.ITEM_ADDED,
+                    fragment.resolve_path(path),
+                    "",
+                    value,
+                )
             )
 
         # Elementos eliminados
         for path, value in deep_diff_body.get("iterable_item_removed", {}).items():
-            diffs_body.append(
-                self.create_body_diff("Elemento eliminado", path, value, "")
+            diffs_by_type[DiffType.ITEM_REMOVED].append(
+                self.create_body_diff(
+                    DiffType.ITEM_REMOVED, fragment.resolve_path(path), value, ""
+                )
             )
 
         # Nuevas claves añadidas
@@ -59,8 +224,10 @@ class PipelineFullJsonApiValidator(PipelineApiValidaror):
             # usamos "" como value por defecto.
             iterator = ((path, "") for path in added)
             for path, value in iterator:
-                diffs_body.append(
-                    self.create_body_diff("Clave añadida", path, "", value)
+                diffs_by_type[DiffType.KEY_ADDED].append(
+                    self.create_body_diff(
+                        DiffType.KEY_ADDED, fragment.resolve_path(path), "", value
+                    )
                 )
 
         # Claves eliminadas
@@ -70,21 +237,40 @@ class PipelineFullJsonApiValidator(PipelineApiValidaror):
             # usamos "" como value por defecto.
             iterator = ((path, "") for path in removed)
             for path, value in iterator:
-                diffs_body.append(
-                    self.create_body_diff("Clave eliminada", path, "", value)
+                diffs_by_type[DiffType.KEY_REMOVED].append(
+                    self.create_body_diff(
+                        DiffType.KEY_REMOVED, fragment.resolve_path(path), "", value
+                    )
                 )
 
-        return diffs_body
+
+def _has_non_utf8_encoding(response: Response) -> bool:
+    """Si la respuesta declara un charset válido distinto de UTF-8."""
+    encoding = getattr(response, "encoding", None)
+    if not isinstance(encoding, str) or not encoding:
+        return False
+    try:
+        return codecs.lookup(encoding).name != "utf-8"
+    except LookupError:
+        return False
+
+
+def _is_json_stream(content: bytes) -> bool:
+    try:
+        for _ in iter_json_events(content):
+            pass
+    except JsonStreamError:
+        return False
+    return True
 
 
 class PipelineJsonApiParcialValidator(PipelineFullJsonApiValidator):
-    def __init__(self, path_to_validate: str):
+    def __init__(self, path_to_validate: str, **kwargs: Any):
+        super().__init__(**kwargs)
         self._path_to_validate = path_to_validate
 
     def get_body_response(self, r1, r2):
-        j1, j2 = super().get_body_response(r1, r2)
-        if j1 is not None:
-            j1 = jmespath.search(self._path_to_validate, j1)
-        if j2 is not None:
-            j2 = jmespath.search(self._path_to_validate, j2)
-        return j1, j2
+        return self.get_body_response_for_path(r1, r2, self._path_to_validate)
+
+    def use_streaming_diff(self, r1: Response, r2: Response) -> bool:
+        return False  # JMESPath necesita el documento decodificado
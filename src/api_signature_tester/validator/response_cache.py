@@ -0,0 +1,175 @@
+import contextlib
+import hashlib
+import json
+import os
+import time
+from datetime import timedelta
+from pathlib import Path
+from threading import Lock
+
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+from api_signature_tester.validator.validator_model import EndpointData
+
+CACHE_MODE_RECORD = "record"
+CACHE_MODE_REPLAY = "replay"
+
+
+class ResponseCache:
+    """
+    Cache en disco de respuestas HTTP, indexada por la request normalizada
+    (método, URL, params ordenados y los headers seleccionados).
+
+    - `record`: las respuestas de source se leen del cache si están vigentes y
+      si no se piden y se graban. Las de new se piden siempre y también se
+      graban, para poder reproducir la ejecución completa más tarde.
+    - `replay`: no hay red; source y new salen del cache.
+
+    Cada entrada son dos archivos: `<key>.json` (metadatos) y `<key>.body`.
+    El tamaño de cada entrada se guarda en memoria en orden de escritura (se
+    arma al abrir el cache), así desalojar no recorre el directorio.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        mode: str = CACHE_MODE_RECORD,
+        ttl_seconds: float | None = None,
+        max_bytes: int | None = None,
+        header_keys: list[str] | None = None,
+    ):
+        """
+        :param ttl_seconds: antigüedad máxima de una entrada; None no expira.
+        :param max_bytes: tamaño máximo del cache; al superarlo se eliminan
+            las entradas más antiguas.
+        :param header_keys: headers que forman parte de la clave (por ejemplo
+            `Accept` o `Authorization`); el resto se ignora.
+        """
+        if mode not in (CACHE_MODE_RECORD, CACHE_MODE_REPLAY):
+            raise ValueError(f"Modo de cache desconocido: {mode}")
+        self._cache_dir = Path(cache_dir)
+        self._mode = mode
+        self._ttl_seconds = ttl_seconds
+        self._max_bytes = max_bytes
+        self._header_keys = {key.lower() for key in header_keys or []}
+        self._lock = Lock()
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        # Clave -> bytes de la entrada, de la más antigua a la más reciente
+        self._entries = self._load_entries()
+        self._size_bytes = sum(self._entries.values())
+
+    def is_replay(self) -> bool:
+        return self._mode == CACHE_MODE_REPLAY
+
+    def get_size_bytes(self) -> int:
+        return self._size_bytes
+
+    def build_key(self, endpoint: EndpointData) -> str:
+        headers = sorted(
+            (k.lower(), v)
+            for k, v in endpoint.get_headers().items()
+            if k.lower() in self._header_keys
+        )
+        normalized = json.dumps(
+            [
+                endpoint.get_method().upper(),
+                endpoint.get_url(),
+                sorted(endpoint.get_params().items()),
+                headers,
+            ],
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def get(self, endpoint: EndpointData) -> Response | None:
+        key = self.build_key(endpoint)
+        meta_path, body_path = self._get_paths(key)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            body = body_path.read_bytes()
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        if (
+            self._ttl_seconds is not None
+            and time.time() - meta["stored_at"] > self._ttl_seconds
+        ):
+            self._remove(key)
+            return None
+
+        response = Response()
+        response.status_code = meta["status_code"]
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response.url = meta["url"]
+        response.encoding = meta.get("encoding")
+        response.elapsed = timedelta(0)
+        response._content = body
+        return response
+
+    def put(self, endpoint: EndpointData, response: Response) -> None:
+        key = self.build_key(endpoint)
+        meta_path, body_path = self._get_paths(key)
+        body = response.content or b""
+        meta = json.dumps(
+            {
+                "status_code": response.status_code,
+                "headers": dict(response.headers),
+                "url": response.url,
+                "encoding": response.encoding,
+                "stored_at": time.time(),
+            }
+        ).encode("utf-8")
+
+        with self._lock:
+            self._size_bytes -= self._entries.pop(key, 0)
+            # El body se escribe antes que los metadatos: una entrada sin
+            # metadatos se considera inexistente.
+            self._write_atomic(body_path, body)
+            self._write_atomic(meta_path, meta)
+            self._entries[key] = len(body) + len(meta)
+            self._size_bytes += self._entries[key]
+            self._evict()
+
+    def _load_entries(self) -> dict[str, int]:
+        """Entradas existentes ordenadas por fecha de escritura de los metadatos."""
+        written = []
+        for meta_path in self._cache_dir.glob("*.json"):
+            with contextlib.suppress(FileNotFoundError):
+                written.append((meta_path.stat().st_mtime, meta_path.stem))
+        return {key: self._get_entry_size(key) for _, key in sorted(written)}
+
+    def _evict(self) -> None:
+        if self._max_bytes is None:
+            return
+        # Las más antiguas primero
+        while self._size_bytes > self._max_bytes and self._entries:
+            key = next(iter(self._entries))
+            self._size_bytes -= self._entries.pop(key)
+            self._delete_files(key)
+
+    def _remove(self, key: str) -> None:
+        with self._lock:
+            self._size_bytes -= self._entries.pop(key, 0)
+            self._delete_files(key)
+
+    def _delete_files(self, key: str) -> None:
+        for path in self._get_paths(key):
+            path.unlink(missing_ok=True)
+
+    def _get_entry_size(self, key: str) -> int:
+        size = 0
+        for path in self._get_paths(key):
+            with contextlib.suppress(FileNotFoundError):
+                size += path.stat().st_size
+        return size
+
+    def _get_paths(self, key: str) -> tuple[Path, Path]:
+        return self._cache_dir / f"{key}.json", self._cache_dir / f"{key}.body"
+
+    @staticmethod
+    def _write_atomic(path: Path, content: bytes) -> None:
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
@@ -0,0 +1,206 @@
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from api_signature_tester.validator.json_stream import (
+    END_ARRAY,
+    END_MAP,
+    MAP_KEY,
+    START_ARRAY,
+    START_MAP,
+    JsonStreamError,
+    build_value,
+)
+from api_signature_tester.validator.validator_model import BodyDiff, DiffType
+
+"""
+Diff estructural de dos JSON a partir de sus eventos (`json_stream`), sin
+materializar los documentos.
+"""
+
+Event = tuple[str, Any]
+CreateBodyDiff = Callable[[DiffType, str, Any, Any], BodyDiff]
+
+
+class StreamingJsonDiff:
+    """
+    Recorre los eventos de source y new en paralelo. Mientras ambos lados
+    tienen la misma estructura solo se mantiene la ruta actual, así la
+    memoria es proporcional a la profundidad y no al tamaño del documento.
+
+    - Los arrays se comparan por posición; los elementos que sobran en un
+      lado se reportan como añadidos o eliminados.
+    - Los objetos se comparan clave a clave mientras las claves llegan en el
+      mismo orden. Si un lado trae una clave que el otro todavía no trajo, se
+      construye en memoria solo el valor de esa clave hasta que aparece del
+      otro lado (o se reporta como eliminada/añadida al cerrar el objeto);
+      las claves que vuelven a coincidir se siguen comparando a la par.
+    - Un escalar contra un contenedor, o dos escalares distintos, se reportan
+      como cambio de valor.
+
+    Las rutas (`root['a'][0]`) y los tipos de diff (DiffType) son los de
+    `compare_body`.
+    """
+
+    def __init__(self, create_body_diff: CreateBodyDiff):
+        self._create_body_diff = create_body_diff
+        self._diffs: list[BodyDiff] = []
+
+    def compare(
+        self, source_events: Iterator[Event], new_events: Iterator[Event]
+    ) -> list[BodyDiff]:
+        self._diffs = []
+        self._source = source_events
+        self._new = new_events
+        self._compare_value("root", self._next(source_events), self._next(new_events))
+        return self._diffs
+
+    def _compare_value(self, path: str, source: Event, new: Event) -> None:
+        if source[0] == START_MAP and new[0] == START_MAP:
+            self._compare_maps(path)
+        elif source[0] == START_ARRAY and new[0] == START_ARRAY:
+            self._compare_arrays(path)
+        else:
+            source_value = build_value(self._source, source)
+            new_value = build_value(self._new, new)
+            diff_values(path, source_value, new_value, self._add_diff)
+
+    def _compare_maps(self, path: str) -> None:
+        source = self._next(self._source)
+        new = self._next(self._new)
+        # Valores de las claves que todavía no aparecieron en el otro lado
+        source_pending: dict = {}
+        new_pending: dict = {}
+        # Ante dos claves distintas se guarda un lado por vez, alternando, así
+        # una clave movida o insertada no obliga a guardar el resto del objeto
+        buffer_source = True
+        while source[0] != END_MAP or new[0] != END_MAP:
+            if source[0] == MAP_KEY and new[0] == MAP_KEY and source[1] == new[1]:
+                self._compare_value(
+                    child_path(path, source[1]),
+                    self._next(self._source),
+                    self._next(self._new),
+                )
+                source = self._next(self._source)
+                new = self._next(self._new)
+            elif source[0] == MAP_KEY and source[1] in new_pending:
+                diff_values(
+                    child_path(path, source[1]),
+                    build_value(self._source, self._next(self._source)),
+                    new_pending.pop(source[1]),
+                    self._add_diff,
+                )
+                source = self._next(self._source)
+            elif new[0] == MAP_KEY and new[1] in source_pending:
+                diff_values(
+                    child_path(path, new[1]),
+                    source_pending.pop(new[1]),
+                    build_value(self._new, self._next(self._new)),
+                    self._add_diff,
+                )
+                new = self._next(self._new)
+            elif new[0] == END_MAP or (source[0] == MAP_KEY and buffer_source):
+                source_pending[source[1]] = build_value(
+                    self._source, self._next(self._source)
+                )
+                source = self._next(self._source)
+                buffer_source = False
+            else:
+                new_pending[new[1]] = build_value(self._new, self._next(self._new))
+                new = self._next(self._new)
+                buffer_source = True
+
+        for key in source_pending:
+            self._add_diff(DiffType.KEY_REMOVED, child_path(path, key), "", "")
+        for key in new_pending:
+            self._add_diff(DiffType.KEY_ADDED, child_path(path, key), "", "")
+
+    def _compare_arrays(self, path: str) -> None:
+        index = 0
+        while True:
+            source = self._next(self._source)
+            new = self._next(self._new)
+            if source[0] == END_ARRAY and new[0] == END_ARRAY:
+                return
+            if source[0] == END_ARRAY:
+                self._drain_items(path, index, self._new, new, DiffType.ITEM_ADDED)
+                return
+            if new[0] == END_ARRAY:
+                self._drain_items(
+                    path, index, self._source, source, DiffType.ITEM_REMOVED
+                )
+                return
+            self._compare_value(child_path(path, index), source, new)
+            index += 1
+
+    def _drain_items(
+        self,
+        path: str,
+        index: int,
+        events: Iterator[Event],
+        first: Event,
+        diff_type: DiffType,
+    ) -> None:
+        event = first
+        while event[0] != END_ARRAY:
+            value = build_value(events, event)
+            item_path = child_path(path, index)
+            if diff_type == DiffType.ITEM_ADDED:
+                self._add_diff(diff_type, item_path, "", value)
+            else:
+                self._add_diff(diff_type, item_path, value, "")
+            index += 1
+            event = self._next(events)
+
+    def _add_diff(
+        self, type: DiffType, path: str, old_value: Any, new_value: Any
+    ) -> None:
+        self._diffs.append(self._create_body_diff(type, path, old_value, new_value))
+
+    @staticmethod
+    def _next(events: Iterator[Event]) -> Event:
+        event = next(events, None)
+        if event is None:
+            raise JsonStreamError("Documento JSON incompleto")
+        return event
+
+
+def diff_values(
+    path: str,
+    source: Any,
+    new: Any,
+    add_diff: Callable[[DiffType, str, Any, Any], None],
+) -> None:
+    """Diff en memoria con la misma semántica que `StreamingJsonDiff`."""
+    if isinstance(source, dict) and isinstance(new, dict):
+        for key in source:
+            if key not in new:
+                add_diff(DiffType.KEY_REMOVED, child_path(path, key), "", "")
+        for key in new:
+            if key not in source:
+                add_diff(DiffType.KEY_ADDED, child_path(path, key), "", "")
+        for key, value in source.items():
+            if key in new:
+                diff_values(child_path(path, key), value, new[key], add_diff)
+    elif isinstance(source, list) and isinstance(new, list):
+        for index, (source_item, new_item) in enumerate(zip(source, new, strict=False)):
+            diff_values(child_path(path, index), source_item, new_item, add_diff)
+        for index in range(len(new), len(source)):
+            add_diff(DiffType.ITEM_REMOVED, child_path(path, index), source[index], "")
+        for index in range(len(source), len(new)):
+            add_diff(DiffType.ITEM_ADDED, child_path(path, index), "", new[index])
+    elif not scalars_equal(source, new):
+        add_diff(DiffType.VALUE_CHANGED, path, source, new)
+
+
+def scalars_equal(source: Any, new: Any) -> bool:
+    # True == 1 en Python, pero en JSON son valores distintos
+    if isinstance(source, bool) or isinstance(new, bool):
+        return type(source) is type(new) and source == new
+    if isinstance(source, (dict, list)) or isinstance(new, (dict, list)):
+        return False
+    return source == new
+
+
+def child_path(path: str, key: Any) -> str:
+    """Ruta con el formato de DeepDiff: root['clave'][0]."""
+    return f"{path}[{key!r}]"
@@ -1,7 +1,125 @@
+import sys
+from collections.abc import Iterable, Iterator, Mapping
+from enum import StrEnum
 from typing import Any
 
+FAST_PATH_BYTES = "bytes"
+FAST_PATH_CANONICAL = "canonical"
+
+# Claves de un diff del body en los reportes y en los resultados JSON Lines
+DIFF_TYPE_KEY = "Tipo"
+DIFF_PATH_KEY = "Ruta"
+DIFF_OLD_VALUE_KEY = "Valor anterior"
+DIFF_NEW_VALUE_KEY = "Valor nuevo"
+
+
+class DiffType(StrEnum):
+    """Tipos de diferencia en el body. Cada valor es el texto de los reportes."""
+
+    VALUE_CHANGED = "Cambio de valor"
+    ITEM_ADDED = "Elemento añadido"
+    ITEM_REMOVED = "Elemento eliminado"
+    KEY_ADDED = "Clave añadida"
+    KEY_REMOVED = "Clave eliminada"
+    FORMAT_ERROR = "format_error"
+    REQUEST_ERROR = "request_error"
+
+
+class BodyDiff(Mapping[str, Any]):
+    """
+    Una diferencia en el body. Ocupa cuatro slots y el tipo es un miembro
+    de DiffType (o un texto internado) compartido por todas las instancias,
+    en lugar de un dict con sus claves por diff.
+
+    Se lee también como el dict de solo lectura que usaban los reportes
+    (`diff["Tipo"]`, `diff.get("Ruta")`) y es igual al dict equivalente.
+    """
+
+    __slots__ = ("_type", "_path", "_old_value", "_new_value")
+
+    _KEYS = (DIFF_TYPE_KEY, DIFF_PATH_KEY, DIFF_OLD_VALUE_KEY, DIFF_NEW_VALUE_KEY)
+
+    def __init__(self, type: DiffType | str, path: str, old_value: Any, new_value: Any):
+        """
+        :param type: un DiffType o su texto. Los tipos propios de otros
+            pipelines se guardan como texto internado.
+        """
+        self._type = _intern_diff_type(type)
+        self._path = path
+        self._old_value = old_value
+        self._new_value = new_value
+
+    def get_type(self) -> DiffType | str:
+        return self._type
+
+    def get_path(self) -> str:
+        return self._path
+
+    def get_old_value(self) -> Any:
+        return self._old_value
+
+    def get_new_value(self) -> Any:
+        return self._new_value
+
+    def to_dict(self) -> dict[str, Any]:
+        """Formato dict de los reportes; el tipo queda como texto."""
+        return dict(zip(self._KEYS, self._values(), strict=True))
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "BodyDiff":
+        return cls(
+            data[DIFF_TYPE_KEY],
+            data[DIFF_PATH_KEY],
+            data[DIFF_OLD_VALUE_KEY],
+            data[DIFF_NEW_VALUE_KEY],
+        )
+
+    def _values(self) -> tuple[str, str, Any, Any]:
+        return str(self._type), self._path, self._old_value, self._new_value
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values()[self._KEYS.index(key)]
+        except ValueError:
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BodyDiff):
+            return self._values() == other._values()
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"BodyDiff({self.to_dict()!r})"
+
+
+def _intern_diff_type(type: DiffType | str) -> DiffType | str:
+    try:
+        return DiffType(type)
+    except ValueError:
+        return sys.intern(type)
+
+
+def as_body_diff(diff: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Convierte un dict en el formato de los reportes a BodyDiff. Un dict al
+    que le falta alguna de las cuatro claves se devuelve sin cambios.
+    """
+    if isinstance(diff, BodyDiff) or not all(key in diff for key in BodyDiff._KEYS):
+        return diff
+    return BodyDiff.from_dict(diff)
+
 
 class EndpointData:
+    __slots__ = ("_url", "_method", "_params", "_headers")
+
     def __init__(
         self, url: str, method: str, params: dict[str, str], headers: dict[str, str]
     ):
@@ -24,12 +142,23 @@ class EndpointData:
 
 
 class TestEndpointModel:
+    __slots__ = ("_source", "_new", "_test_path_json", "_case_id")
+
     def __init__(
-        self, source: EndpointData, new: EndpointData, test_path_json: str | None = None
+        self,
+        source: EndpointData,
+        new: EndpointData,
+        test_path_json: str | None = None,
+        case_id: int | None = None,
     ):
+        """
+        :param case_id: posición del caso en la entrada (0 = primera fila de
+            datos). Identifica el caso entre shards y ejecuciones.
+        """
         self._source = source
         self._new = new
         self._test_path_json = test_path_json
+        self._case_id = case_id
 
     def get_source(self) -> EndpointData:
         return self._source
@@ -40,46 +169,355 @@ class TestEndpointModel:
     def get_test_path_json(self) -> str | None:
         return self._test_path_json
 
+    def get_case_id(self) -> int | None:
+        return self._case_id
+
+
+class RequestMetrics:
+    """Métricas de una request. Los valores desconocidos quedan en None."""
+
+    __slots__ = (
+        "_latency_ms",
+        "_ttfb_ms",
+        "_response_bytes",
+        "_latency_samples_ms",
+        "_retries",
+        "_timeouts",
+        "_hedged",
+    )
+
+    def __init__(
+        self,
+        latency_ms: float | None,
+        ttfb_ms: float | None,
+        response_bytes: int | None,
+        latency_samples_ms: list[float] | None = None,
+        retries: int = 0,
+        timeouts: int = 0,
+        hedged: bool = False,
+    ):
+        """
+        :param latency_ms: tiempo total de la request, incluida la descarga
+            del body.
+        :param ttfb_ms: tiempo hasta recibir los headers de la respuesta.
+        :param response_bytes: tamaño del body recibido.
+        :param latency_samples_ms: latencias de las muestras tomadas para
+            comparar tiempos; la primera es la de la request del caso.
+        :param retries: reintentos hasta obtener la respuesta.
+        :param timeouts: intentos que terminaron por timeout.
+        :param hedged: si se envió una request duplicada (hedging).
+        """
+        self._latency_ms = latency_ms
+        self._ttfb_ms = ttfb_ms
+        self._response_bytes = response_bytes
+        self._latency_samples_ms = latency_samples_ms
+        self._retries = retries
+        self._timeouts = timeouts
+        self._hedged = hedged
+
+    def get_latency_ms(self) -> float | None:
+        return self._latency_ms
+
+    def get_ttfb_ms(self) -> float | None:
+        return self._ttfb_ms
+
+    def get_response_bytes(self) -> int | None:
+        return self._response_bytes
+
+    def get_latency_samples_ms(self) -> list[float]:
+        if self._latency_samples_ms is not None:
+            return self._latency_samples_ms
+        return [] if self._latency_ms is None else [self._latency_ms]
+
+    def get_retries(self) -> int:
+        return self._retries
+
+    def get_timeouts(self) -> int:
+        return self._timeouts
+
+    def is_hedged(self) -> bool:
+        return self._hedged
+
+
+class LatencyPolicy:
+    """
+    Límites de latencia de new respecto de source. Un caso falla si la
+    mediana de new supera a la de source por más de `max_ratio` veces o por
+    más de `budget_ms` milisegundos (si ambos están definidos, alcanza con
+    superar uno).
+    """
+
+    def __init__(
+        self,
+        max_ratio: float | None = None,
+        budget_ms: float | None = None,
+        samples: int = 1,
+    ):
+        """
+        :param samples: requests por lado usadas para calcular la mediana,
+            incluida la del caso.
+        """
+        if max_ratio is None and budget_ms is None:
+            raise ValueError("LatencyPolicy requires max_ratio or budget_ms")
+        if max_ratio is not None and max_ratio <= 0:
+            raise ValueError("max_ratio must be greater than 0")
+        if budget_ms is not None and budget_ms < 0:
+            raise ValueError("budget_ms must be 0 or greater")
+        if samples < 1:
+            raise ValueError("samples must be greater than 0")
+        self._max_ratio = max_ratio
+        self._budget_ms = budget_ms
+        self._samples = samples
+
+    def get_max_ratio(self) -> float | None:
+        return self._max_ratio
+
+    def get_budget_ms(self) -> float | None:
+        return self._budget_ms
+
+    def get_samples(self) -> int:
+        return self._samples
+
+
+class RetryPolicy:
+    """Timeouts, reintentos y hedging de las requests a source y new."""
+
+    # Muestras de latencia necesarias antes de estimar el p95 para hedging
+    HEDGE_MIN_SAMPLES = 20
+
+    def __init__(
+        self,
+        connect_timeout_seconds: float | None = None,
+        read_timeout_seconds: float | None = None,
+        retries: int = 0,
+        backoff_seconds: float = 0.5,
+        max_backoff_seconds: float = 8.0,
+        hedging: bool = False,
+    ):
+        """
+        :param retries: reintentos de métodos idempotentes ante errores de
+            conexión, timeouts o status 429/502/503/504.
+        :param backoff_seconds: espera base; se duplica en cada reintento y se
+            le aplica jitter.
+        :param hedging: si una request idempotente supera el p95 de latencia
+            de su host, se envía un duplicado y se usa la primera respuesta.
+        """
+        if retries < 0:
+            raise ValueError("retries must be 0 or greater")
+        if backoff_seconds < 0 or max_backoff_seconds < 0:
+            raise ValueError("backoff seconds must be 0 or greater")
+        self._connect_timeout_seconds = connect_timeout_seconds
+        self._read_timeout_seconds = read_timeout_seconds
+        self._retries = retries
+        self._backoff_seconds = backoff_seconds
+        self._max_backoff_seconds = max_backoff_seconds
+        self._hedging = hedging
+
+    def get_timeout(self) -> tuple[float | None, float | None] | None:
+        """Timeout en el formato de requests: (connect, read) o None."""
+        if self._connect_timeout_seconds is None and self._read_timeout_seconds is None:
+            return None
+        return self._connect_timeout_seconds, self._read_timeout_seconds
+
+    def get_retries(self) -> int:
+        return self._retries
+
+    def get_backoff_seconds(self, attempt: int) -> float:
+        """Espera antes del reintento `attempt` (0 = primer reintento), sin jitter."""
+        return min(self._max_backoff_seconds, self._backoff_seconds * 2**attempt)
+
+    def is_hedging(self) -> bool:
+        return self._hedging
+
+
+class CaseMetrics:
+    __slots__ = ("_source", "_new", "_decode_ms", "_diff_ms", "_json_decoder")
+
+    def __init__(
+        self,
+        source: RequestMetrics,
+        new: RequestMetrics,
+        decode_ms: float | None = None,
+        diff_ms: float | None = None,
+        json_decoder: str | None = None,
+    ):
+        """
+        :param json_decoder: backend JSON con el que se midió `decode_ms`.
+        """
+        self._source = source
+        self._new = new
+        self._decode_ms = decode_ms
+        self._diff_ms = diff_ms
+        self._json_decoder = json_decoder
+
+    def get_source(self) -> RequestMetrics:
+        return self._source
+
+    def get_new(self) -> RequestMetrics:
+        return self._new
+
+    def get_decode_ms(self) -> float | None:
+        return self._decode_ms
+
+    def get_diff_ms(self) -> float | None:
+        return self._diff_ms
+
+    def get_json_decoder(self) -> str | None:
+        return self._json_decoder
+
+
+class DecodedCase:
+    """
+    Caso con las respuestas ya decodificadas, listo para la etapa de
+    comparación. Solo contiene datos serializables (pickle).
+    """
+
+    __slots__ = (
+        "_source",
+        "_new",
+        "_diff_status_code",
+        "_body_source",
+        "_body_new",
+        "_fast_path",
+        "_metrics",
+        "_case_id",
+        "_streaming",
+        "_request_errors",
+    )
+
+    def __init__(
+        self,
+        source: EndpointData,
+        new: EndpointData,
+        diff_status_code: dict[str, Any],
+        body_source: Any,
+        body_new: Any,
+        fast_path: str | None = None,
+        metrics: CaseMetrics | None = None,
+        case_id: int | None = None,
+        streaming: bool = False,
+        request_errors: list[BodyDiff] | None = None,
+    ):
+        """
+        :param streaming: los bodies son los bytes crudos de las respuestas y
+            se comparan con el diff incremental (`compare_body_stream`).
+        :param request_errors: diffs DiffType.REQUEST_ERROR si alguna request
+            no obtuvo respuesta; el caso no tiene bodies que comparar.
+        """
+        self._source = source
+        self._new = new
+        self._diff_status_code = diff_status_code
+        self._body_source = body_source
+        self._body_new = body_new
+        self._fast_path = fast_path
+        self._metrics = metrics
+        self._case_id = case_id
+        self._streaming = streaming
+        self._request_errors = request_errors or []
+
+    def get_source(self) -> EndpointData:
+        return self._source
+
+    def get_new(self) -> EndpointData:
+        return self._new
+
+    def get_diff_status_code(self) -> dict[str, Any]:
+        return self._diff_status_code
+
+    def get_body_source(self) -> Any:
+        return self._body_source
+
+    def get_body_new(self) -> Any:
+        return self._body_new
+
+    def get_fast_path(self) -> str | None:
+        return self._fast_path
+
+    def get_metrics(self) -> CaseMetrics | None:
+        return self._metrics
+
+    def get_case_id(self) -> int | None:
+        return self._case_id
+
+    def is_streaming(self) -> bool:
+        return self._streaming
+
+    def get_request_errors(self) -> list[BodyDiff]:
+        return self._request_errors
+
 
 class ComparationResult:
+    __slots__ = (
+        "_are_equal",
+        "_diff_status_code",
+        "_diff_body",
+        "_fast_path",
+        "_diff_latency",
+    )
+
     def __init__(
         self,
         are_equal: bool,
         diff_status_code: dict[str, Any],
-        diff_body: list[dict[str, Any]],
+        diff_body: Iterable[Mapping[str, Any]],
+        fast_path: str | None = None,
+        diff_latency: dict[str, Any] | None = None,
     ):
+        """
+        :param diff_body: diferencias en el body. Los dicts en el formato de
+            los reportes se convierten a BodyDiff (`as_body_diff`).
+        :param fast_path: atajo con el que se resolvió la comparación del body
+            (FAST_PATH_BYTES o FAST_PATH_CANONICAL) o None si se usó el diff
+            completo.
+        :param diff_latency: regresión de latencia de new respecto de source o
+            None si no la hay.
+        """
         self._are_equal = are_equal
         self._diff_status_code = diff_status_code
-        self._diff_body = diff_body
+        self._diff_body = [as_body_diff(diff) for diff in diff_body]
+        self._fast_path = fast_path
+        self._diff_latency = diff_latency or {}
 
     def is_equal(self) -> bool:
         return self._are_equal
 
-    def get_diffs(self) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    def get_diffs(self) -> tuple[dict[str, Any], list[Mapping[str, Any]]]:
         """Devuelve una tupla (diff_status_code, diff_body).
 
         - diff_status_code: dict con cambios en código de estado
-        - diff_body: lista de dicts con cambios en el body
+        - diff_body: lista de BodyDiff con cambios en el body
         """
         return self._diff_status_code, self._diff_body
 
     def get_diff_status_code(self) -> dict[str, Any]:
         return self._diff_status_code
 
-    def get_diff_body(self) -> list[dict[str, Any]]:
+    def get_diff_body(self) -> list[Mapping[str, Any]]:
         return self._diff_body
 
+    def get_fast_path(self) -> str | None:
+        return self._fast_path
+
+    def get_diff_latency(self) -> dict[str, Any]:
+        return self._diff_latency
+
 
 class TestResult:
+    __slots__ = ("_source", "_new", "_comparation_result", "_metrics", "_case_id")
+
     def __init__(
         self,
         source: EndpointData,
         new: EndpointData,
         comparation_result: ComparationResult,
+        metrics: CaseMetrics | None = None,
+        case_id: int | None = None,
     ):
         self._source = source
         self._new = new
         self._comparation_result = comparation_result
+        self._metrics = metrics
+        self._case_id = case_id
 
     def get_source(self) -> EndpointData:
         return self._source
@@ -89,3 +527,11 @@ class TestResult:
 
     def get_comparation_result(self) -> ComparationResult:
         return self._comparation_result
+
+    def get_metrics(self) -> CaseMetrics | None:
+        """Tiempos y tamaños del caso o None si no se midieron."""
+        return self._metrics
+
+    def get_case_id(self) -> int | None:
+        """Posición del caso en la entrada o None si no se conoce."""
+        return self._case_id
@@ -1,7 +1,7 @@
 import pytest
 
 from api_signature_tester.etl.etl_csv import LoaderCsv
-from api_signature_tester.etl.etl_source_data import ETLDataProcess
+from api_signature_tester.etl.etl_source_data import ETLDataProcess, ETLDataStream
 
 
 @pytest.fixture
@@ -100,3 +100,77 @@ def test_empty_csv(tmp_path):
     assert isinstance(result, ETLDataProcess)
     assert len(result.get_rest_data()) == 0
     assert len(result.get_load_errors()) == 0
+
+
+def test_stream_data_yields_lazily(temp_csv):
+    # Given
+    loader = LoaderCsv()
+
+    # When
+    stream = loader.stream_data(temp_csv)
+    iterator = iter(stream.get_rest_data())
+    first_test = next(iterator)
+
+    # Then
+    assert isinstance(stream, ETLDataStream)
+    assert first_test.get_source().get_url() == "http://api.test/v1"
+    assert first_test.get_new().get_params() == {"param3": "value3"}
+    assert len(list(iterator)) == 1
+    assert stream.get_load_errors() == []
+
+
+def test_stream_data_keeps_errors_aside(temp_csv_invalid):
+    # Given
+    loader = LoaderCsv()
+
+    # When
+    stream = loader.stream_data(temp_csv_invalid)
+    data = list(stream.get_rest_data())
+
+    # Then
+    assert data == []
+    assert stream.get_load_error_count() == 1
+    assert "Error processing row 2" in stream.get_load_errors()[0]
+
+
+def test_stream_limits_stored_errors():
+    # Given
+    def produce(stream):
+        for i in range(5):
+            stream.add_load_error(f"Error processing row {i}")
+        yield from ()
+
+    stream = ETLDataStream(produce, max_load_errors=2)
+
+    # When
+    list(stream.get_rest_data())
+
+    # Then
+    assert stream.get_load_error_count() == 5
+    assert stream.get_load_errors() == [
+        "Error processing row 0",
+        "Error processing row 1",
+    ]
+
+
+def test_stream_data_file_not_found():
+    with pytest.raises(FileNotFoundError):
+        LoaderCsv().stream_data("csv_no_exist.csv")
+
+
+def test_stream_data_reads_optional_test_path_json(tmp_path):
+    # Given
+    csv_file = tmp_path / "paths.csv"
+    csv_file.write_text(
+        "url_source,method_source,params_source,headers_source,url_new,"
+        "method_new,params_new,headers_new,test_path_json\n"
+        "http://api.test/v1,GET,,,http://api.test/v2,GET,,,data.items\n"
+        "http://api.test/v1,GET,,,http://api.test/v2,GET,,\n"
+    )
+
+    # When
+    data = list(LoaderCsv().stream_data(str(csv_file)).get_rest_data())
+
+    # Then
+    assert data[0].get_test_path_json() == "data.items"
+    assert data[1].get_test_path_json() is None
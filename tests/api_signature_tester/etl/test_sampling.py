@@ -0,0 +1,252 @@
+import logging
+
+import pytest
+
+from api_signature_tester.etl.etl_csv import LoaderCsv
+from api_signature_tester.etl.etl_source_data import TestData
+from api_signature_tester.etl.sampling import StratifiedSampler, path_template
+from api_signature_tester.etl.shard import Shard
+from api_signature_tester.pipeline.sync_process import ApiSignatureTesterSynchBase
+from api_signature_tester.validator.json_decoder import StdlibJsonDecoder
+from api_signature_tester.validator.validator_model import (
+    ComparationResult,
+    EndpointData,
+    TestResult,
+)
+
+
+def build_cases(counts: dict[tuple[str, str], int]) -> list[TestData]:
+    cases = []
+    for (method, resource), count in counts.items():
+        for _ in range(count):
+            url = f"http://api.test/v1/{resource}/{len(cases)}"
+            cases.append(
+                TestData(
+                    EndpointData(url, method, {}, {}),
+                    EndpointData(url.replace("v1", "v2"), method, {}, {}),
+                    case_id=len(cases),
+                )
+            )
+    return cases
+
+
+def sample_sizes(plan) -> dict[tuple[str, str], int]:
+    return {stratum: plan.get_sample_size(stratum) for stratum in plan.get_strata()}
+
+
+def test_path_template_replaces_identifiers():
+    assert path_template("http://api/v1/users/42/orders?page=2") == (
+        "/v1/users/{id}/orders"
+    )
+    assert path_template(
+        "http://api/items/3f2b8c1e-9d4a-4b7e-8f6a-1c2d3e4f5a6b/tags"
+    ) == ("/items/{id}/tags")
+    assert path_template("http://api/blobs/0123456789abcdef01") == "/blobs/{id}"
+    assert path_template("http://api/v2/status") == "/v2/status"
+    assert path_template("http://api") == "/"
+
+
+def test_rate_takes_a_fraction_of_each_stratum():
+    cases = build_cases({("GET", "users"): 100, ("POST", "users"): 10, ("GET", "x"): 1})
+
+    plan = StratifiedSampler(rate=0.05, seed=7).plan(cases)
+
+    assert sample_sizes(plan) == {
+        ("GET", "/v1/users/{id}"): 5,
+        ("GET", "/v1/x/{id}"): 1,
+        ("POST", "/v1/users/{id}"): 1,
+    }
+    assert plan.get_population(("GET", "/v1/users/{id}")) == 100
+    assert plan.get_case_ids() <= set(range(111))
+    assert len(plan.get_case_ids()) == 7
+
+
+def test_budget_is_split_in_proportion_to_strata():
+    cases = build_cases({("GET", "a"): 600, ("GET", "b"): 300, ("GET", "c"): 100})
+
+    plan = StratifiedSampler(budget=50, seed=1).plan(cases)
+
+    assert sample_sizes(plan) == {
+        ("GET", "/v1/a/{id}"): 30,
+        ("GET", "/v1/b/{id}"): 15,
+        ("GET", "/v1/c/{id}"): 5,
+    }
+
+
+def test_budget_keeps_small_strata_and_respects_total():
+    cases = build_cases({("GET", "a"): 1000, ("GET", "b"): 2, ("DELETE", "c"): 1})
+
+    plan = StratifiedSampler(budget=10, seed=1).plan(cases)
+    assert sum(sample_sizes(plan).values()) == 10
+    assert plan.get_sample_size(("DELETE", "/v1/c/{id}")) == 1
+
+    # Sin presupuesto para todos los estratos quedan afuera los más chicos
+    small = StratifiedSampler(budget=2, seed=1).plan(cases)
+    assert sample_sizes(small)[("DELETE", "/v1/c/{id}")] == 0
+    assert len(small.get_case_ids()) == 2
+
+    # Un presupuesto mayor que la entrada ejecuta todos los casos
+    assert len(StratifiedSampler(budget=5000).plan(cases).get_case_ids()) == 1003
+
+
+def test_same_seed_selects_same_cases():
+    cases = build_cases({("GET", "a"): 500, ("POST", "b"): 500})
+
+    first = StratifiedSampler(rate=0.1, seed=42).plan(cases)
+    second = StratifiedSampler(rate=0.1, seed=42).plan(cases)
+    other = StratifiedSampler(rate=0.1, seed=43).plan(cases)
+
+    assert first.get_case_ids() == second.get_case_ids()
+    assert first.get_case_ids() != other.get_case_ids()
+    assert first.get_seed() == 42
+
+
+def test_seed_is_derived_from_input_when_not_given():
+    cases = build_cases({("GET", "a"): 500, ("POST", "b"): 500})
+
+    first = StratifiedSampler(rate=0.1).plan(cases)
+    second = StratifiedSampler(rate=0.1).plan(cases)
+
+    assert first.get_case_ids() == second.get_case_ids()
+    assert first.get_seed() == second.get_seed()
+    assert StratifiedSampler(rate=0.2).plan(cases).get_seed() != first.get_seed()
+    assert StratifiedSampler(rate=0.1).plan(cases[:-1]).get_seed() != first.get_seed()
+
+
+def test_invalid_sampler_options():
+    with pytest.raises(ValueError):
+        StratifiedSampler()
+    with pytest.raises(ValueError):
+        StratifiedSampler(rate=0.1, budget=10)
+    with pytest.raises(ValueError):
+        StratifiedSampler(rate=0)
+    with pytest.raises(ValueError):
+        StratifiedSampler(budget=0)
+
+
+def test_stream_data_returns_only_sampled_cases(tmp_path):
+    csv_file = tmp_path / "suite.csv"
+    csv_file.write_text(
+        "\n".join(
+            ["su,sm,sp,sh,nu,nm,np,nh"]
+            + [f"http://src.test/{i},GET,,,http://new.test/{i},GET,," for i in range(5)]
+            + ["fila inválida"]
+        )
+    )
+
+    stream = LoaderCsv().stream_data(str(csv_file), case_ids={1, 3})
+
+    assert [case.get_case_id() for case in stream.get_rest_data()] == [1, 3]
+    assert len(stream.get_load_errors()) == 1
+
+
+class FailingUsersPipeline:
+    """Falla en los casos de `/users/`."""
+
+    def __init__(self):
+        self.executed = []
+
+    def execute(self, source, new, test_path_json=None, case_id=None):
+        self.executed.append(case_id)
+        is_equal = "/users/" not in source.get_url()
+        return TestResult(
+            source, new, ComparationResult(is_equal, {}, []), None, case_id
+        )
+
+    def close(self):
+        pass
+
+    def get_pool_stats(self):
+        return None
+
+    def get_scheduler(self):
+        return None
+
+    def get_json_decoder(self):
+        return StdlibJsonDecoder()
+
+
+class FakeSettings:
+    def __init__(self, properties):
+        self._properties = properties
+
+    def get_properties(self, key):
+        return self._properties.get(key)
+
+
+def test_engine_runs_sample_and_reports_failure_rate_per_stratum(tmp_path):
+    csv_file = tmp_path / "suite.csv"
+    csv_file.write_text(
+        "\n".join(
+            ["su,sm,sp,sh,nu,nm,np,nh"]
+            + [
+                f"http://src.test/{resource}/{i},GET,,,http://new.test/{i},GET,,"
+                for resource in ("users", "orders")
+                for i in range(50)
+            ]
+        )
+    )
+    pipeline = FailingUsersPipeline()
+    engine = ApiSignatureTesterSynchBase(
+        pipeline,
+        logging.getLogger("test"),
+        FakeSettings(
+            {
+                "report_md_path": str(tmp_path / "report.md"),
+                "report_html_path": str(tmp_path / "report.html"),
+            }
+        ),
+        input_csv_path=str(csv_file),
+        sampler=StratifiedSampler(budget=10, seed=3),
+    )
+
+    engine.execute()
+
+    plan = engine.get_sampling_plan()
+    assert plan is not None
+    assert sorted(pipeline.executed) == sorted(plan.get_case_ids())
+    assert len(pipeline.executed) == 10
+    markdown = (tmp_path / "report.md").read_text(encoding="utf-8")
+    assert "Muestreo estratificado: tasa de fallos por estrato" in markdown
+    assert "| GET | /orders/{id} | 50 | 5 | 0 | 0.0% | 0.0% - 43.4% |" in markdown
+    assert "| GET | /users/{id} | 50 | 5 | 5 | 100.0% | 56.6% - 100.0% |" in markdown
+    assert "Muestreo estratificado" in (tmp_path / "report.html").read_text(
+        encoding="utf-8"
+    )
+
+
+def test_shards_without_seed_run_one_shared_sample(tmp_path):
+    csv_file = tmp_path / "suite.csv"
+    csv_file.write_text(
+        "\n".join(
+            ["su,sm,sp,sh,nu,nm,np,nh"]
+            + [
+                f"http://src.test/{resource}/{i},GET,,,http://new.test/{i},GET,,"
+                for resource in ("users", "orders", "items")
+                for i in range(40)
+            ]
+        )
+    )
+    settings = FakeSettings({"shard_output_dir": str(tmp_path / "shards")})
+    executed = []
+    plans = []
+    for index in range(2):
+        pipeline = FailingUsersPipeline()
+        engine = ApiSignatureTesterSynchBase(
+            pipeline,
+            logging.getLogger("test"),
+            settings,
+            input_csv_path=str(csv_file),
+            shard=Shard(index, 2),
+            sampler=StratifiedSampler(budget=15),
+        )
+        engine.execute()
+        executed.append(pipeline.executed)
+        plans.append(engine.get_sampling_plan())
+
+    # Los dos procesos eligen el mismo plan y se reparten sus casos
+    assert plans[0].get_seed() == plans[1].get_seed()
+    assert plans[0].get_case_ids() == plans[1].get_case_ids()
+    assert not set(executed[0]) & set(executed[1])
+    assert sorted(executed[0] + executed[1]) == sorted(plans[0].get_case_ids())
+    assert len(plans[0].get_case_ids()) == 15
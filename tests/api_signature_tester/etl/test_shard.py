@@ -0,0 +1,75 @@
+from pathlib import Path
+
+import pytest
+
+from api_signature_tester.etl.etl_csv import LoaderCsv
+from api_signature_tester.etl.shard import SHARD_BY_HASH, SHARD_BY_ROW, Shard
+
+
+@pytest.fixture
+def suite_csv(tmp_path):
+    rows = ["source_url,source_method,sp,sh,new_url,new_method,np,nh"]
+    rows += [
+        f"http://api.test/v1/{i},GET,id={i},,http://api.test/v2/{i},GET,id={i},"
+        for i in range(20)
+    ]
+    rows.insert(6, "fila,rota")
+    csv_file = tmp_path / "suite.csv"
+    csv_file.write_text("\n".join(rows))
+    return str(csv_file)
+
+
+def load_shard(path: str, shard: Shard | None):
+    stream = LoaderCsv().stream_data(path, shard)
+    return list(stream.get_rest_data()), stream.get_load_errors()
+
+
+def test_parse_shard():
+    shard = Shard.parse("2/4", SHARD_BY_HASH)
+
+    assert shard.get_index() == 1
+    assert shard.get_count() == 4
+    assert shard.get_strategy() == SHARD_BY_HASH
+
+
+@pytest.mark.parametrize("value", ["0/4", "5/4", "1-4", "a/b"])
+def test_parse_shard_rejects_invalid_values(value):
+    with pytest.raises(ValueError):
+        Shard.parse(value)
+
+
+@pytest.mark.parametrize("strategy", [SHARD_BY_ROW, SHARD_BY_HASH])
+def test_shards_partition_the_suite(suite_csv, strategy):
+    # Given
+    all_cases, all_errors = load_shard(suite_csv, None)
+
+    # When
+    shards = [load_shard(suite_csv, Shard(i, 3, strategy)) for i in range(3)]
+
+    # Then: cada caso y cada error de carga aparecen en un único shard
+    case_ids = sorted(case.get_case_id() for cases, _ in shards for case in cases)
+    assert case_ids == [case.get_case_id() for case in all_cases]
+    assert sum(len(errors) for _, errors in shards) == len(all_errors) == 1
+
+
+def test_row_shard_uses_row_position(suite_csv):
+    cases, _ = load_shard(suite_csv, Shard(1, 4, SHARD_BY_ROW))
+
+    assert [case.get_case_id() for case in cases] == [1, 9, 13, 17]
+
+
+def test_hash_shard_is_stable_across_row_order(tmp_path, suite_csv):
+    # Given: el mismo CSV con las filas en orden inverso
+    header, *rows = Path(suite_csv).read_text().splitlines()
+    reversed_csv = tmp_path / "reversed.csv"
+    reversed_csv.write_text("\n".join([header, *reversed(rows)]))
+    shard = Shard(0, 3, SHARD_BY_HASH)
+
+    # When
+    cases, _ = load_shard(suite_csv, shard)
+    reversed_cases, _ = load_shard(str(reversed_csv), shard)
+
+    # Then
+    assert {case.get_source().get_url() for case in cases} == {
+        case.get_source().get_url() for case in reversed_cases
+    }
@@ -0,0 +1,231 @@
+import logging
+import threading
+import time
+
+import pytest
+
+from api_signature_tester.etl.etl_source_data import ETLDataProcess, TestData
+from api_signature_tester.etl.shard import Shard
+from api_signature_tester.pipeline.async_process import ApiSignatureTesterAsync
+from api_signature_tester.report.jsonl_report_writer import read_jsonl_results
+from api_signature_tester.report.result_journal import ResultJournal
+from api_signature_tester.validator.json_decoder import StdlibJsonDecoder
+from api_signature_tester.validator.validator_model import (
+    ComparationResult,
+    EndpointData,
+    TestResult,
+)
+
+
+class FakeSettings:
+    def __init__(self, properties=None):
+        self._properties = properties or {}
+
+    def get_properties(self, key):
+        return self._properties.get(key)
+
+
+class SlowFakePipeline:
+    """Pipeline que tarda más en los primeros casos para desordenar la salida."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.max_seen = 0
+
+    def execute(self, source, new, *args, **kwargs):
+        with self._lock:
+            self.in_flight += 1
+            self.max_seen = max(self.max_seen, self.in_flight)
+        time.sleep(0.05 if source.get_url().endswith("/0") else 0.01)
+        with self._lock:
+            self.in_flight -= 1
+        return TestResult(source, new, ComparationResult(True, {}, []))
+
+
+def build_cases(total: int) -> ETLDataProcess:
+    data = ETLDataProcess()
+    for i in range(total):
+        data.add_test_data(
+            TestData(
+                source=EndpointData(f"http://src.test/{i}", "GET", {}, {}),
+                new=EndpointData(f"http://new.test/{i}", "GET", {}, {}),
+            )
+        )
+    return data
+
+
+def test_run_test_cases_keeps_load_order_and_limit():
+    pipeline = SlowFakePipeline()
+    engine = ApiSignatureTesterAsync(
+        pipeline, logging.getLogger("test"), FakeSettings(), max_in_flight=4
+    )
+
+    results = list(engine.run_test_cases(build_cases(12)))
+
+    assert [r.get_source().get_url() for r in results] == [
+        f"http://src.test/{i}" for i in range(12)
+    ]
+    assert 1 < pipeline.max_seen <= 4
+
+
+class BlockingFirstCasePipeline(SlowFakePipeline):
+    """El caso 0 no termina hasta que se ejecutó el último caso."""
+
+    def __init__(self, last_url: str, timeout: float = 5):
+        super().__init__()
+        self.last_url = last_url
+        self.timeout = timeout
+        self.last_started = threading.Event()
+        self.unblocked = False
+
+    def execute(self, source, new, *args, **kwargs):
+        if source.get_url().endswith("/0"):
+            self.unblocked = self.last_started.wait(self.timeout)
+        elif source.get_url() == self.last_url:
+            self.last_started.set()
+        return super().execute(source, new, *args, **kwargs)
+
+
+def test_slow_case_does_not_block_other_slots():
+    pipeline = BlockingFirstCasePipeline("http://src.test/7")
+    engine = ApiSignatureTesterAsync(
+        pipeline, logging.getLogger("test"), FakeSettings(), max_in_flight=2
+    )
+
+    results = list(engine.run_test_cases(build_cases(8)))
+
+    # Los casos 1..7 usan el otro slot mientras el 0 sigue en curso
+    assert pipeline.unblocked
+    assert [r.get_source().get_url() for r in results] == [
+        f"http://src.test/{i}" for i in range(8)
+    ]
+    assert pipeline.max_seen <= 2
+
+
+def test_reorder_window_bounds_cases_ahead_of_slow_case():
+    pipeline = BlockingFirstCasePipeline("http://src.test/9", timeout=0.3)
+    engine = ApiSignatureTesterAsync(
+        pipeline, logging.getLogger("test"), FakeSettings(), max_in_flight=2
+    )
+    engine.REORDER_WINDOW_FACTOR = 2
+
+    results = list(engine.run_test_cases(build_cases(10)))
+
+    # Con una ventana de 4 casos el 9 no se lanza hasta entregar el 0
+    assert not pipeline.unblocked
+    assert len(results) == 10
+
+
+def test_max_in_flight_from_settings():
+    engine = ApiSignatureTesterAsync(
+        SlowFakePipeline(),
+        logging.getLogger("test"),
+        FakeSettings({"max_in_flight": 3}),
+    )
+    assert engine.get_max_in_flight() == 3
+
+
+def test_max_in_flight_invalid():
+    engine = ApiSignatureTesterAsync(
+        SlowFakePipeline(), logging.getLogger("test"), FakeSettings(), max_in_flight=0
+    )
+    with pytest.raises(ValueError, match="max_in_flight"):
+        list(engine.run_test_cases(build_cases(1)))
+
+
+class RecordingPipeline:
+    def execute(self, source, new, test_path_json=None, case_id=None):
+        return TestResult(source, new, ComparationResult(True, {}, []), None, case_id)
+
+    def close(self):
+        pass
+
+    def get_pool_stats(self):
+        return None
+
+    def get_scheduler(self):
+        return None
+
+    def get_json_decoder(self):
+        return StdlibJsonDecoder()
+
+
+def test_sharded_execution_writes_partial_results(tmp_path):
+    # Given
+    csv_file = tmp_path / "suite.csv"
+    csv_file.write_text(
+        "\n".join(
+            ["su,sm,sp,sh,nu,nm,np,nh"]
+            + [f"http://src.test/{i},GET,,,http://new.test/{i},GET,," for i in range(6)]
+        )
+    )
+    engine = ApiSignatureTesterAsync(
+        RecordingPipeline(),
+        logging.getLogger("test"),
+        FakeSettings({"shard_output_dir": str(tmp_path / "shards")}),
+        input_csv_path=str(csv_file),
+        max_in_flight=2,
+        shard=Shard.parse("2/3"),
+    )
+
+    # When
+    engine.execute()
+
+    # Then
+    partial = tmp_path / "shards" / "results-2-of-3.jsonl"
+    assert engine.get_journal_path() == str(partial)
+    assert [r.get_case_id() for r in read_jsonl_results(str(partial))] == [1, 4]
+
+
+def test_resume_skips_cases_in_journal_and_reports_all(tmp_path):
+    # Given: una ejecución anterior cortada después de los casos 0 y 1
+    csv_file = tmp_path / "suite.csv"
+    csv_file.write_text(
+        "\n".join(
+            ["su,sm,sp,sh,nu,nm,np,nh"]
+            + [f"http://src.test/{i},GET,,,http://new.test/{i},GET,," for i in range(4)]
+        )
+    )
+    journal = ResultJournal()
+    journal.open(str(tmp_path / "journal.jsonl"))
+    for i in range(2):
+        journal.append(
+            RecordingPipeline().execute(
+                EndpointData(f"http://src.test/{i}", "GET", {}, {}),
+                EndpointData(f"http://new.test/{i}", "GET", {}, {}),
+                case_id=i,
+            )
+        )
+    journal.close()
+    pipeline = CountingPipeline()
+    engine = ApiSignatureTesterAsync(
+        pipeline,
+        logging.getLogger("test"),
+        FakeSettings(
+            {
+                "journal_path": str(tmp_path / "journal.jsonl"),
+                "report_md_path": str(tmp_path / "report.md"),
+                "report_html_path": str(tmp_path / "report.html"),
+            }
+        ),
+        input_csv_path=str(csv_file),
+        resume=True,
+    )
+
+    # When
+    engine.execute()
+
+    # Then: solo se ejecutan los casos pendientes y el reporte tiene todos
+    assert pipeline.executed == [2, 3]
+    markdown = (tmp_path / "report.md").read_text(encoding="utf-8")
+    assert "**Total de pruebas:** 4" in markdown
+
+
+class CountingPipeline(RecordingPipeline):
+    def __init__(self):
+        self.executed = []
+
+    def execute(self, source, new, test_path_json=None, case_id=None):
+        self.executed.append(case_id)
+        return super().execute(source, new, test_path_json, case_id)
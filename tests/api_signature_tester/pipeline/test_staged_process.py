@@ -0,0 +1,121 @@
+import logging
+
+import pytest
+
+from api_signature_tester.etl.etl_source_data import ETLDataProcess, TestData
+from api_signature_tester.pipeline.staged_process import ApiSignatureTesterStaged
+from api_signature_tester.validator.pipeline_api_validaror import RequestError
+from api_signature_tester.validator.pipeline_json_api import (
+    PipelineFullJsonApiValidator,
+)
+from api_signature_tester.validator.validator_model import DiffType, EndpointData
+
+
+class FakeSettings:
+    def get_properties(self, key):
+        return None
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, json_data=None):
+        self.status_code = status_code
+        self._json_data = json_data
+
+    def json(self):
+        return self._json_data
+
+
+class FakeJsonPipeline(PipelineFullJsonApiValidator):
+    """Responde sin red: el caso N devuelve {"n": N} en source y new."""
+
+    def _exetute_requests(self, source, new):
+        n = int(source.get_url().rsplit("/", 1)[1])
+        new_value = n + 1 if n % 3 == 0 else n
+        return FakeResponse(200, {"n": n}), FakeResponse(200, {"n": new_value})
+
+
+class TimingOutPipeline(FakeJsonPipeline):
+    """El caso 2 no obtiene respuesta de new."""
+
+    def _exetute_requests(self, source, new):
+        response_source, response_new = super()._exetute_requests(source, new)
+        if source.get_url().endswith("/2"):
+            return response_source, RequestError("ReadTimeout: slow", 2, 3)
+        return response_source, response_new
+
+
+class FailingPipeline(FakeJsonPipeline):
+    def _exetute_requests(self, source, new):
+        raise ConnectionError("boom")
+
+
+def build_cases(total: int) -> ETLDataProcess:
+    data = ETLDataProcess()
+    for i in range(total):
+        data.add_test_data(
+            TestData(
+                source=EndpointData(f"http://src.test/{i}", "GET", {}, {}),
+                new=EndpointData(f"http://new.test/{i}", "GET", {}, {}),
+            )
+        )
+    return data
+
+
+@pytest.mark.parametrize("diff_processes", [0, 2])
+def test_staged_keeps_order_and_compares(diff_processes):
+    engine = ApiSignatureTesterStaged(
+        FakeJsonPipeline(),
+        logging.getLogger("test"),
+        FakeSettings(),
+        fetch_workers=4,
+        diff_processes=diff_processes,
+        queue_size=3,
+    )
+
+    results = list(engine.run_test_cases(build_cases(10)))
+
+    assert [r.get_source().get_url() for r in results] == [
+        f"http://src.test/{i}" for i in range(10)
+    ]
+    assert [r.get_comparation_result().is_equal() for r in results] == [
+        i % 3 != 0 for i in range(10)
+    ]
+    assert "fetch" in engine.get_stage_seconds()
+
+
+@pytest.mark.parametrize("diff_processes", [0, 2])
+def test_staged_reports_request_errors_and_keeps_running(diff_processes):
+    engine = ApiSignatureTesterStaged(
+        TimingOutPipeline(),
+        logging.getLogger("test"),
+        FakeSettings(),
+        diff_processes=diff_processes,
+    )
+
+    results = list(engine.run_test_cases(build_cases(5)))
+
+    assert len(results) == 5
+    failed = results[2]
+    assert not failed.get_comparation_result().is_equal()
+    assert failed.get_comparation_result().get_diff_body()[0].get_type() == (
+        DiffType.REQUEST_ERROR
+    )
+    assert failed.get_metrics().get_new().get_retries() == 2
+    assert failed.get_metrics().get_new().get_timeouts() == 3
+    assert [r.get_comparation_result().is_equal() for r in results[3:]] == [
+        False,
+        True,
+    ]
+
+
+def test_staged_propagates_stage_errors():
+    engine = ApiSignatureTesterStaged(
+        FailingPipeline(),
+        logging.getLogger("test"),
+        FakeSettings(),
+        diff_processes=0,
+    )
+
+    with pytest.raises(RuntimeError, match="fetch") as error:
+        list(engine.run_test_cases(build_cases(2)))
+    assert isinstance(error.value.__cause__, ConnectionError)
@@ -0,0 +1,99 @@
+import pytest
+
+from api_signature_tester.report.diff_patterns import (
+    STATUS_CODE_DIFF,
+    DiffPatternSummary,
+)
+from api_signature_tester.report.markdown_report_generator import (
+    MarkdownReportWriter,
+)
+from api_signature_tester.validator.validator_model import (
+    BodyDiff,
+    ComparationResult,
+    DiffType,
+    EndpointData,
+    TestResult,
+)
+
+
+def build_result(diffs, case_id=None, diff_status_code=None) -> TestResult:
+    endpoint = EndpointData("http://api.test/v1/a", "GET", {}, {})
+    return TestResult(
+        endpoint,
+        endpoint,
+        ComparationResult(not diffs, diff_status_code or {}, diffs),
+        case_id=case_id,
+    )
+
+
+def renamed_field(case_id: int) -> TestResult:
+    return build_result(
+        [
+            BodyDiff(DiffType.KEY_ADDED, f"root['data'][{i}]['name']", "", "")
+            for i in range(3)
+        ]
+        + [
+            BodyDiff(DiffType.KEY_REMOVED, f"root['data'][{case_id}]['nombre']", "", "")
+        ],
+        case_id=case_id,
+    )
+
+
+def test_patterns_group_array_indexes_and_count_cases():
+    summary = DiffPatternSummary(max_samples=2)
+    for case_id in range(100):
+        summary.append(renamed_field(case_id))
+    summary.append(build_result([], case_id=100))
+
+    patterns = summary.get_patterns()
+    assert [(p.get_diff_type(), p.get_path()) for p in patterns] == [
+        (DiffType.KEY_ADDED, "root['data'][*]['name']"),
+        (DiffType.KEY_REMOVED, "root['data'][*]['nombre']"),
+    ]
+    assert patterns[0].get_cases() == 100
+    assert patterns[0].get_occurrences() == 300
+    assert patterns[0].get_sample_case_ids() == [0, 1]
+    assert patterns[1].get_occurrences() == 100
+
+
+def test_status_code_diffs_are_patterns():
+    summary = DiffPatternSummary()
+    status = {"status_code": {"old_value": 200, "new_value": 500}}
+    summary.append(build_result([], diff_status_code=status))
+    summary.append(build_result([], diff_status_code=status))
+
+    assert summary.get_rows() == [[STATUS_CODE_DIFF, "200 -> 500", "2", "2", "0, 1"]]
+
+
+def test_rows_are_limited_to_top_and_max_patterns():
+    summary = DiffPatternSummary(top=1, max_patterns=2)
+    for key in ("a", "a", "b", "c"):
+        summary.append(
+            build_result([BodyDiff(DiffType.VALUE_CHANGED, f"root['{key}']", 1, 2)])
+        )
+
+    rows = summary.get_rows()
+    assert rows[0][:4] == [DiffType.VALUE_CHANGED, "root['a']", "2", "2"]
+    # 'b' quedó fuera del top y 'c' superó max_patterns: solo se cuentan
+    assert rows[1] == ["", "(otros patrones)", "", "2", ""]
+    assert summary.get_untracked_occurrences() == 1
+
+    with pytest.raises(ValueError):
+        DiffPatternSummary(top=0)
+
+
+def test_report_size_does_not_grow_with_repeated_patterns(tmp_path):
+    output = tmp_path / "report.md"
+    writer = MarkdownReportWriter()
+    writer.open(str(output))
+    for case_id in range(50):
+        writer.append(renamed_field(case_id))
+    writer.close()
+
+    content = output.read_text(encoding="utf-8")
+    summary = content[content.index("Patrones de diferencias más frecuentes") :]
+    assert (
+        "| Clave añadida | root['data'][*]['name'] | 50 | 150 | 0, 1, 2, 3, 4 |"
+        in summary
+    )
+    assert summary.count("\n| ") == 3
@@ -0,0 +1,103 @@
+import json
+import re
+
+import pytest
+
+from api_signature_tester.report.html_paged_report import (
+    HTML_MODE_PAGED,
+    PagedHTMLReportWriter,
+    case_to_record,
+    create_html_report_writer,
+)
+from api_signature_tester.report.html_report_genetaror import HTMLReportWriter
+from api_signature_tester.validator.validator_model import (
+    BodyDiff,
+    CaseMetrics,
+    ComparationResult,
+    DiffType,
+    EndpointData,
+    RequestMetrics,
+    TestResult,
+)
+
+
+def build_result(case_id: int, are_equal: bool = False) -> TestResult:
+    diffs = (
+        []
+        if are_equal
+        else [BodyDiff(DiffType.VALUE_CHANGED, "root['a']", "</script>", {"x": 1})]
+    )
+    return TestResult(
+        EndpointData(f"http://api.test/v1/{case_id}", "GET", {}, {}),
+        EndpointData(f"http://api.test/v2/{case_id}", "GET", {}, {}),
+        ComparationResult(
+            are_equal, {"status_code": {"old_value": 200, "new_value": 500}}, diffs
+        ),
+        CaseMetrics(RequestMetrics(10.0, 2.0, 100), RequestMetrics(None, None, 90)),
+        case_id=case_id,
+    )
+
+
+def _chunks(content: str) -> list[list]:
+    return [
+        json.loads(chunk.replace("<\\/", "</"))
+        for chunk in re.findall(r"REPORT\.add\((\[.*?\])\);", content)
+    ]
+
+
+def test_case_record_is_compact_json():
+    record = case_to_record(3, build_result(7))
+
+    assert record[:7] == [
+        3,
+        7,
+        0,
+        "GET",
+        "http://api.test/v1/7",
+        "http://api.test/v2/7",
+        "200 -> 500",
+    ]
+    assert record[8] == [["Cambio de valor", "root['a']", "</script>", {"x": 1}]]
+    assert record[9][0][0] == "Source"
+
+
+def test_writer_embeds_cases_in_chunks(tmp_path):
+    output = tmp_path / "report.html"
+    writer = PagedHTMLReportWriter(chunk_size=2)
+    writer.open(str(output))
+    for case_id in range(5):
+        writer.append(build_result(case_id, are_equal=case_id % 2 == 0))
+    writer.close()
+
+    content = output.read_text(encoding="utf-8")
+    chunks = _chunks(content)
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert [case[1] for chunk in chunks for case in chunk] == [0, 1, 2, 3, 4]
+    # Sin un bloque HTML por caso y sin cerrar el <script> con los valores
+    assert "<details" not in content
+    assert content.count("</script>") == 4
+    assert "Total de casos: 5 | ✅ 3 exitosos | ❌ 2 con diferencias" in content
+    assert "Patrones de diferencias más frecuentes" in content
+    assert content.rstrip().endswith("</body></html>")
+
+
+def test_writer_with_side_files(tmp_path):
+    output = tmp_path / "report.html"
+    writer = PagedHTMLReportWriter(chunk_size=3, side_files=True)
+    writer.open(str(output))
+    for case_id in range(4):
+        writer.append(build_result(case_id))
+    writer.close()
+
+    content = output.read_text(encoding="utf-8")
+    assert '<script src="report_data/cases-00001.js"></script>' in content
+    assert '<script src="report_data/cases-00002.js"></script>' in content
+    side = (tmp_path / "report_data" / "cases-00002.js").read_text(encoding="utf-8")
+    assert [case[1] for chunk in _chunks(side) for case in chunk] == [3]
+
+
+def test_create_html_report_writer():
+    assert type(create_html_report_writer()) is HTMLReportWriter
+    assert isinstance(create_html_report_writer(HTML_MODE_PAGED), PagedHTMLReportWriter)
+    with pytest.raises(ValueError):
+        create_html_report_writer("virtual")
@@ -0,0 +1,103 @@
+import pytest
+
+from api_signature_tester.report.metrics_summary import (
+    MetricHistogram,
+    MetricsSummary,
+    get_case_metrics_rows,
+)
+from api_signature_tester.validator.validator_model import (
+    CaseMetrics,
+    ComparationResult,
+    EndpointData,
+    RequestMetrics,
+    TestResult,
+)
+
+
+def build_result(latency_ms: float | None) -> TestResult:
+    return TestResult(
+        EndpointData("http://src.test", "GET", {}, {}),
+        EndpointData("http://new.test", "GET", {}, {}),
+        ComparationResult(True, {}, []),
+        CaseMetrics(
+            RequestMetrics(latency_ms, 1.0, 100),
+            RequestMetrics(None, None, 120),
+            decode_ms=0.5,
+            diff_ms=0.0,
+        ),
+    )
+
+
+def test_histogram_percentiles_within_precision():
+    histogram = MetricHistogram()
+    for value in range(1, 1001):
+        histogram.add(float(value))
+
+    assert histogram.get_count() == 1000
+    assert histogram.get_percentile(50) == pytest.approx(500, rel=0.01)
+    assert histogram.get_percentile(99) == pytest.approx(990, rel=0.01)
+    assert histogram.get_percentile(100) == 1000
+
+
+def test_histogram_zero_and_empty_values():
+    histogram = MetricHistogram()
+    assert histogram.get_percentile(50) == 0.0
+
+    for value in (0.0, 0.0, 0.0, 8.0):
+        histogram.add(value)
+    assert histogram.get_percentile(50) == 0.0
+    assert histogram.get_percentile(99) == 8.0
+
+    with pytest.raises(ValueError):
+        histogram.add(-1)
+
+
+def test_summary_skips_missing_metrics():
+    summary = MetricsSummary()
+    for latency in (10.0, 20.0, 30.0):
+        summary.append(build_result(latency))
+    summary.append(
+        TestResult(
+            EndpointData("http://a", "GET", {}, {}),
+            EndpointData("http://b", "GET", {}, {}),
+            ComparationResult(True, {}, []),
+        )
+    )
+
+    rows = {row[0]: row for row in summary.get_rows()}
+    assert rows["Latencia source (ms)"][:2] == ["Latencia source (ms)", "3"]
+    assert rows["Latencia source (ms)"][-1] == "30"
+    assert "Latencia new (ms)" not in rows
+    assert rows["Bytes new"][2] == "120"
+    assert len(summary.get_headers()) == len(rows["Diff (ms)"])
+
+
+def test_summary_splits_decode_time_by_backend():
+    summary = MetricsSummary()
+    for decoder, decode_ms in (("stdlib", 4.0), ("orjson", 1.0), ("orjson", 2.0)):
+        result = build_result(10.0)
+        metrics = result.get_metrics()
+        assert metrics is not None
+        summary.append(
+            TestResult(
+                result.get_source(),
+                result.get_new(),
+                result.get_comparation_result(),
+                CaseMetrics(
+                    metrics.get_source(), metrics.get_new(), decode_ms, 0.1, decoder
+                ),
+            )
+        )
+
+    labels = [row[0] for row in summary.get_rows()]
+    assert labels[-3:] == ["Decode orjson (ms)", "Decode stdlib (ms)", "Diff (ms)"]
+    rows = {row[0]: row for row in summary.get_rows()}
+    assert rows["Decode orjson (ms)"][1] == "2"
+
+
+def test_case_metrics_rows():
+    rows = get_case_metrics_rows(build_result(12.25).get_metrics())
+    assert rows == [
+        ["Source", "12.2", "1", "100", "0", "0", "No"],
+        ["New", "-", "-", "120", "0", "0", "No"],
+    ]
@@ -0,0 +1,165 @@
+import pytest
+
+from api_signature_tester.report.diff_patterns import DiffPatternSummary
+from api_signature_tester.report.html_report_genetaror import (
+    HTMLReportGenerator,
+    HTMLReportWriter,
+)
+from api_signature_tester.report.incremental_report_writer import (
+    share_default_summaries,
+)
+from api_signature_tester.report.markdown_report_generator import (
+    MarkdownReportGenerator,
+    MarkdownReportWriter,
+)
+from api_signature_tester.validator.validator_model import (
+    CaseMetrics,
+    ComparationResult,
+    EndpointData,
+    RequestMetrics,
+    TestResult,
+)
+
+
+def build_result(url: str, are_equal: bool) -> TestResult:
+    diff_body = (
+        []
+        if are_equal
+        else [
+            {
+                "Tipo": "Cambio de valor",
+                "Ruta": "root['a']",
+                "Valor anterior": 1,
+                "Valor nuevo": 2,
+            }
+        ]
+    )
+    return TestResult(
+        EndpointData(url, "GET", {}, {}),
+        EndpointData(url.replace("v1", "v2"), "GET", {}, {}),
+        ComparationResult(are_equal, {}, diff_body),
+        CaseMetrics(
+            RequestMetrics(12.5, 4.0, 2048),
+            RequestMetrics(30.0, 9.0, 1024),
+            decode_ms=0.2,
+            diff_ms=1.5,
+        ),
+    )
+
+
+@pytest.mark.parametrize("writer_class", [MarkdownReportWriter, HTMLReportWriter])
+def test_writer_flushes_each_case_and_patches_totals(tmp_path, writer_class):
+    output = tmp_path / "reports" / "report.out"
+    writer = writer_class()
+    writer.open(str(output))
+
+    writer.append(build_result("http://api.test/v1/a", True))
+    partial = output.read_text(encoding="utf-8")
+    assert "http://api.test/v1/a" in partial
+    assert "Total de" not in partial
+
+    writer.append(build_result("http://api.test/v1/b", False))
+    writer.close()
+
+    content = output.read_text(encoding="utf-8")
+    assert "http://api.test/v1/b" in content
+    assert "root['a']" in content
+    assert content.index("Total de") < content.index("http://api.test/v1/a")
+
+
+def test_markdown_generate_totals(tmp_path):
+    output = tmp_path / "report.md"
+    MarkdownReportGenerator().generate(
+        [
+            build_result("http://api.test/v1/a", True),
+            build_result("http://x/v1", False),
+        ],
+        str(output),
+    )
+
+    content = output.read_text(encoding="utf-8")
+    assert "**Total de pruebas:** 2" in content
+    assert "✅ **Exitosas:** 1" in content
+    assert "❌ **Con diferencias:** 1" in content
+
+
+def test_html_generate_totals(tmp_path):
+    output = tmp_path / "report.html"
+    HTMLReportGenerator().generate([build_result("http://x/v1", False)], str(output))
+
+    content = output.read_text(encoding="utf-8")
+    assert "Total de casos: 1 | ✅ 0 exitosos | ❌ 1 con diferencias" in content
+    assert content.rstrip().endswith("</body></html>")
+
+
+def test_append_without_open():
+    with pytest.raises(RuntimeError):
+        MarkdownReportWriter().append(build_result("http://x/v1", True))
+
+
+@pytest.mark.parametrize("writer_class", [MarkdownReportWriter, HTMLReportWriter])
+def test_writer_renders_case_metrics_and_summary(tmp_path, writer_class):
+    output = tmp_path / "report.out"
+    writer = writer_class()
+    writer.open(str(output))
+    writer.append(build_result("http://api.test/v1/a", True))
+    writer.close()
+
+    content = output.read_text(encoding="utf-8")
+    assert "2048" in content
+    assert "Diff: " in content and "1.5 ms" in content
+    assert "Métricas de la ejecución" in content
+    assert content.index("Métricas de la ejecución") > content.index("v1/a")
+    assert "Latencia new (ms)" in content
+
+
+@pytest.mark.parametrize("writer_class", [MarkdownReportWriter, HTMLReportWriter])
+def test_writer_renders_latency_regression(tmp_path, writer_class):
+    output = tmp_path / "report.out"
+    result = TestResult(
+        EndpointData("http://api.test/v1/a", "GET", {}, {}),
+        EndpointData("http://api.test/v2/a", "GET", {}, {}),
+        ComparationResult(
+            False,
+            {},
+            [],
+            diff_latency={
+                "old_value": 10,
+                "new_value": 35.5,
+                "ratio": 3.55,
+                "samples": 3,
+            },
+        ),
+    )
+    writer = writer_class()
+    writer.open(str(output))
+    writer.append(result)
+    writer.close()
+
+    content = output.read_text(encoding="utf-8")
+    assert "Regresión de latencia" in content
+    assert "source 10 ms → new 35.5 ms (x3.55), 3 muestras por lado" in content
+
+
+def test_writers_share_default_summaries(tmp_path, monkeypatch):
+    appended = []
+    monkeypatch.setattr(
+        DiffPatternSummary, "append", lambda self, result: appended.append(result)
+    )
+    md_writer, html_writer = MarkdownReportWriter(), HTMLReportWriter()
+    share_default_summaries([md_writer, html_writer])
+    md_writer.open(str(tmp_path / "report.md"))
+    html_writer.open(str(tmp_path / "report.html"))
+
+    results = [build_result(f"http://api.test/v1/{n}", False) for n in "ab"]
+    for result in results:
+        md_writer.append(result)
+        html_writer.append(result)
+    md_writer.close()
+    html_writer.close()
+
+    # Un solo resumen de patrones por ejecución, calculado una vez por caso
+    assert appended == results
+    for report in ("report.md", "report.html"):
+        content = (tmp_path / report).read_text(encoding="utf-8")
+        assert "Métricas de la ejecución" in content
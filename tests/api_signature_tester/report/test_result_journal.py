@@ -0,0 +1,54 @@
+from api_signature_tester.report.jsonl_report_writer import read_jsonl_results
+from api_signature_tester.report.result_journal import ResultJournal
+from api_signature_tester.validator.validator_model import (
+    ComparationResult,
+    EndpointData,
+    TestResult,
+)
+
+
+def build_result(case_id: int) -> TestResult:
+    return TestResult(
+        EndpointData(f"http://api.test/v1/{case_id}", "GET", {}, {}),
+        EndpointData(f"http://api.test/v2/{case_id}", "GET", {}, {}),
+        ComparationResult(True, {}, []),
+        None,
+        case_id,
+    )
+
+
+def write_journal(path, case_ids, resume=False) -> None:
+    journal = ResultJournal(resume=resume)
+    journal.open(str(path))
+    for case_id in case_ids:
+        journal.append(build_result(case_id))
+    journal.close()
+
+
+def test_read_case_ids_of_missing_journal(tmp_path):
+    assert ResultJournal.read_case_ids(str(tmp_path / "journal.jsonl")) == set()
+
+
+def test_resume_drops_incomplete_line_and_appends(tmp_path):
+    # Given: un journal cortado a mitad de la escritura del caso 2
+    path = tmp_path / "journal.jsonl"
+    write_journal(path, [0, 1])
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"case_id": 2, "source": {"url": "http://api')
+    assert ResultJournal.read_case_ids(str(path)) == {0, 1}
+
+    # When
+    write_journal(path, [2, 3], resume=True)
+
+    # Then
+    assert ResultJournal.read_case_ids(str(path)) == {0, 1, 2, 3}
+    assert [r.get_case_id() for r in read_jsonl_results(str(path))] == [0, 1, 2, 3]
+
+
+def test_open_without_resume_starts_a_new_journal(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    write_journal(path, [0, 1])
+
+    write_journal(path, [5])
+
+    assert ResultJournal.read_case_ids(str(path)) == {5}
@@ -0,0 +1,93 @@
+from api_signature_tester.report.jsonl_report_writer import (
+    JsonlReportWriter,
+    read_jsonl_results,
+)
+from api_signature_tester.report.result_merge import (
+    merge_partial_reports,
+    merge_results,
+)
+from api_signature_tester.validator.validator_model import (
+    CaseMetrics,
+    ComparationResult,
+    EndpointData,
+    RequestMetrics,
+    TestResult,
+)
+
+
+def build_result(case_id: int, are_equal: bool = True) -> TestResult:
+    diff_body = [] if are_equal else [{"Tipo": "Cambio de valor", "Ruta": "root"}]
+    return TestResult(
+        EndpointData(f"http://api.test/v1/{case_id}", "GET", {"id": "1"}, {"k": "s"}),
+        EndpointData(f"http://api.test/v2/{case_id}", "GET", {}, {}),
+        ComparationResult(are_equal, {}, diff_body, None, None),
+        CaseMetrics(
+            RequestMetrics(12.5, 4.0, 2048, [12.5, 13.0], retries=1),
+            RequestMetrics(30.0, 9.0, 1024, hedged=True),
+            decode_ms=0.2,
+            diff_ms=1.5,
+        ),
+        case_id,
+    )
+
+
+def write_partial(path, case_ids, are_equal=True) -> str:
+    writer = JsonlReportWriter()
+    writer.open(str(path))
+    for case_id in case_ids:
+        writer.append(build_result(case_id, are_equal))
+    writer.close()
+    return str(path)
+
+
+def test_jsonl_round_trip(tmp_path):
+    # Given
+    path = write_partial(tmp_path / "partial.jsonl", [3], are_equal=False)
+
+    # When
+    (result,) = list(read_jsonl_results(path))
+
+    # Then
+    assert result.get_case_id() == 3
+    assert result.get_source().get_url() == "http://api.test/v1/3"
+    assert result.get_source().get_params() == {"id": "1"}
+    assert result.get_source().get_headers() == {}  # Los headers no se guardan
+    assert not result.get_comparation_result().is_equal()
+    assert result.get_comparation_result().get_diff_body() == [
+        {"Tipo": "Cambio de valor", "Ruta": "root"}
+    ]
+    metrics = result.get_metrics()
+    assert metrics is not None
+    assert metrics.get_source().get_latency_samples_ms() == [12.5, 13.0]
+    assert metrics.get_source().get_retries() == 1
+    assert metrics.get_new().is_hedged()
+    assert metrics.get_diff_ms() == 1.5
+
+
+def test_merge_restores_input_order_and_skips_duplicates(tmp_path):
+    partials = [
+        write_partial(tmp_path / "results-1-of-2.jsonl", [0, 2, 4]),
+        write_partial(tmp_path / "results-2-of-2.jsonl", [1, 3, 4]),
+    ]
+
+    case_ids = [result.get_case_id() for result in merge_results(partials)]
+
+    assert case_ids == [0, 1, 2, 3, 4]
+
+
+def test_merge_partial_reports_writes_markdown_and_html(tmp_path):
+    partials = [
+        write_partial(tmp_path / "results-1-of-2.jsonl", [0, 2]),
+        write_partial(tmp_path / "results-2-of-2.jsonl", [1], are_equal=False),
+    ]
+    md_path = tmp_path / "report.md"
+    html_path = tmp_path / "report.html"
+
+    total = merge_partial_reports(partials, str(md_path), str(html_path))
+
+    assert total == 3
+    markdown = md_path.read_text(encoding="utf-8")
+    assert "**Total de pruebas:** 3" in markdown
+    assert "**Con diferencias:** 1" in markdown
+    assert markdown.index("/v1/0") < markdown.index("/v1/1") < markdown.index("/v1/2")
+    assert "http://api.test/v1/1" in html_path.read_text(encoding="utf-8")
@@ -0,0 +1,80 @@
+import pytest
+
+from api_signature_tester.etl.etl_source_data import TestData
+from api_signature_tester.etl.sampling import StratifiedSampler
+from api_signature_tester.report.markdown_report_generator import (
+    MarkdownReportWriter,
+)
+from api_signature_tester.report.sampling_summary import (
+    SamplingSummary,
+    wilson_interval,
+)
+from api_signature_tester.validator.validator_model import (
+    ComparationResult,
+    EndpointData,
+    TestResult,
+)
+
+
+def build_result(url: str, method: str = "GET", is_equal: bool = True) -> TestResult:
+    endpoint = EndpointData(url, method, {}, {})
+    return TestResult(endpoint, endpoint, ComparationResult(is_equal, {}, []))
+
+
+def build_plan():
+    cases = [
+        TestData(EndpointData(url, "GET", {}, {}), EndpointData(url, "GET", {}, {}))
+        for url in [f"http://api/a/{i}" for i in range(90)]
+        + [f"http://api/b/{i}" for i in range(10)]
+    ]
+    return StratifiedSampler(rate=1).plan(cases)
+
+
+def test_wilson_interval():
+    assert wilson_interval(0, 10) == pytest.approx((0.0, 0.2775), abs=1e-4)
+    assert wilson_interval(5, 10) == pytest.approx((0.2366, 0.7634), abs=1e-4)
+    assert wilson_interval(10, 10) == pytest.approx((0.7225, 1.0), abs=1e-4)
+    low, high = wilson_interval(5, 10, confidence=0.99)
+    assert low < 0.2366 and high > 0.7634
+    with pytest.raises(ValueError):
+        wilson_interval(0, 0)
+
+
+def test_rows_per_stratum_and_weighted_total():
+    summary = SamplingSummary(build_plan())
+    for i in range(10):
+        summary.append(build_result(f"http://api/a/{i}", is_equal=i != 0))
+    for i in range(5):
+        summary.append(build_result(f"http://api/b/{i}", is_equal=False))
+
+    rate, low, high = summary.get_failure_rate()
+    # 0.9 * 10% + 0.1 * 100%
+    assert rate == pytest.approx(0.19)
+    assert low < rate < high
+    assert summary.get_rows() == [
+        ["GET", "/a/{id}", "90", "10", "1", "10.0%", "1.8% - 40.4%"],
+        ["GET", "/b/{id}", "10", "5", "5", "100.0%", "56.6% - 100.0%"],
+        ["", "(total estimado)", "100", "15", "6", "19.0%", "6.5% - 44.1%"],
+    ]
+
+
+def test_strata_without_results_and_empty_summary():
+    summary = SamplingSummary(build_plan())
+    assert summary.get_rows() == []
+    assert summary.get_failure_rate() is None
+
+    summary.append(build_result("http://api/a/1"))
+    assert summary.get_rows()[1] == ["GET", "/b/{id}", "10", "0", "0", "-", "-"]
+
+
+def test_writer_includes_added_summary(tmp_path):
+    output = tmp_path / "report.md"
+    writer = MarkdownReportWriter()
+    writer.add_summary(SamplingSummary(build_plan()))
+    writer.open(str(output))
+    writer.append(build_result("http://api/a/1", is_equal=False))
+    writer.close()
+
+    markdown = output.read_text(encoding="utf-8")
+    assert "Muestreo estratificado: tasa de fallos por estrato" in markdown
+    assert "| GET | /a/{id} | 90 | 1 | 1 | 100.0% |" in markdown
@@ -0,0 +1,144 @@
+import sqlite3
+
+import pytest
+
+from api_signature_tester.report.sqlite_report_writer import (
+    SqliteReportGenerator,
+    SqliteReportWriter,
+    SqliteResultsStore,
+)
+from api_signature_tester.validator.validator_model import (
+    BodyDiff,
+    CaseMetrics,
+    ComparationResult,
+    DiffType,
+    EndpointData,
+    RequestMetrics,
+    TestResult,
+)
+
+
+def build_result(
+    case_id: int, url: str, status: tuple[int, int] | None = None, diffs=()
+) -> TestResult:
+    diff_status_code = (
+        {}
+        if status is None
+        else {"status_code": dict(zip(("old_value", "new_value"), status, strict=True))}
+    )
+    return TestResult(
+        EndpointData(url, "GET", {}, {}),
+        EndpointData(url.replace("v1", "v2"), "GET", {}, {}),
+        ComparationResult(not diffs and status is None, diff_status_code, list(diffs)),
+        CaseMetrics(
+            RequestMetrics(10.0, 2.0, 100, retries=1),
+            RequestMetrics(12.0, 3.0, 90, hedged=True),
+            decode_ms=0.5,
+        ),
+        case_id=case_id,
+    )
+
+
+def renamed(index: int) -> BodyDiff:
+    return BodyDiff(DiffType.KEY_ADDED, f"root['data'][{index}]['name']", "", "")
+
+
+def test_writer_inserts_cases_metrics_and_diffs_in_batches(tmp_path):
+    path = str(tmp_path / "db" / "results.sqlite")
+    writer = SqliteReportWriter("run-1", batch_size=2)
+    writer.open(path)
+    writer.append(build_result(0, "http://api/v1/a"))
+    writer.append(build_result(1, "http://api/v1/b", diffs=[renamed(0), renamed(1)]))
+    # El primer bloque ya está en la base antes de cerrar
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM cases").fetchone() == (2,)
+    writer.append(build_result(2, "http://api/v1/c", status=(200, 500)))
+    writer.close()
+
+    with sqlite3.connect(path) as connection:
+        assert connection.execute(
+            "SELECT run_id, total, passed, fast_path FROM runs"
+        ).fetchall() == [("run-1", 3, 1, 0)]
+        assert connection.execute(
+            "SELECT case_id, is_equal, status_old, status_new FROM cases ORDER BY id"
+        ).fetchall() == [(0, 1, None, None), (1, 0, None, None), (2, 0, 200, 500)]
+        assert connection.execute(
+            "SELECT side, retries, hedged FROM case_metrics WHERE case_row = 1"
+        ).fetchall() == [("source", 1, 0), ("new", 0, 1)]
+        assert (
+            connection.execute(
+                "SELECT diff_type, path_pattern, old_value FROM diffs"
+            ).fetchall()
+            == [("Clave añadida", "root['data'][*]['name']", '""')] * 2
+        )
+
+
+def test_store_queries_history_across_runs(tmp_path):
+    path = str(tmp_path / "results.sqlite")
+    SqliteReportGenerator("run-1").generate(
+        [build_result(0, "http://api/v1/a"), build_result(1, "http://api/v1/b")], path
+    )
+    SqliteReportGenerator("run-2").generate(
+        [
+            build_result(0, "http://api/v1/a", status=(200, 404)),
+            build_result(1, "http://api/v1/b", diffs=[renamed(3)]),
+        ],
+        path,
+    )
+
+    with SqliteResultsStore(path) as store:
+        runs = store.get_runs()
+        assert [run["run_id"] for run in runs] == ["run-2", "run-1"]
+        assert runs[0]["failed"] == 2
+
+        assert store.get_status_code_regressions(since=runs[0]["started_at"]) == [
+            {
+                "method": "GET",
+                "source_url": "http://api/v1/a",
+                "cases": 1,
+                "runs": 1,
+                "last_seen": runs[0]["started_at"],
+                "status_old": 200,
+                "status_new": 404,
+            }
+        ]
+        assert store.get_status_code_regressions(since="9999") == []
+
+        history = store.get_endpoint_history("http://api/v1/a", "GET")
+        assert [(h["run_id"], h["failed"], h["status_changes"]) for h in history] == [
+            ("run-2", 1, 1),
+            ("run-1", 0, 0),
+        ]
+
+        diff_history = store.get_diff_type_history("Clave añadida")
+        assert [(h["run_id"], h["path_pattern"], h["cases"]) for h in diff_history] == [
+            ("run-2", "root['data'][*]['name']", 1)
+        ]
+
+
+def test_history_queries_use_indexes(tmp_path):
+    path = str(tmp_path / "results.sqlite")
+    SqliteReportGenerator("run-1").generate([build_result(0, "http://api/v1/a")], path)
+
+    with SqliteResultsStore(path) as store:
+        connection = store._connection
+        for sql, parameters in (
+            ("SELECT * FROM cases WHERE source_url = ? AND method = ?", ("u", "GET")),
+            ("SELECT * FROM diffs WHERE diff_type = ? AND run_id = ?", ("t", "r")),
+            ("SELECT * FROM cases WHERE method = ?", ("GET",)),
+            ("SELECT * FROM cases WHERE run_id = ?", ("r",)),
+        ):
+            plan = " ".join(
+                row[3]
+                for row in connection.execute(f"EXPLAIN QUERY PLAN {sql}", parameters)
+            )
+            assert "USING INDEX" in plan, sql
+
+
+def test_writer_errors(tmp_path):
+    with pytest.raises(RuntimeError):
+        SqliteReportWriter().append(build_result(0, "http://api/v1/a"))
+    with pytest.raises(ValueError):
+        SqliteReportWriter(batch_size=0)
+    with pytest.raises(FileNotFoundError):
+        SqliteResultsStore(str(tmp_path / "missing.sqlite"))
@@ -0,0 +1,144 @@
+import pytest
+
+from api_signature_tester.validator.array_rules import (
+    ARRAY_KEYED,
+    ARRAY_ORDERED,
+    ArrayRule,
+    ArrayRules,
+    path_pattern,
+)
+from api_signature_tester.validator.pipeline_json_api import (
+    PipelineFullJsonApiValidator,
+)
+
+
+def _diffs(source, new, rules):
+    pipelline = PipelineFullJsonApiValidator(array_rules=ArrayRules(rules))
+    return [
+        (diff["Tipo"], diff["Ruta"], diff["Valor anterior"], diff["Valor nuevo"])
+        for diff in pipelline.compare_body(source, new)
+    ]
+
+
+def test_parse_rules():
+    assert ArrayRule.parse("ordered").get_mode() == ARRAY_ORDERED
+    keyed = ArrayRule.parse({"keys": "id"})
+    assert keyed.get_mode() == ARRAY_KEYED
+    assert keyed.get_keys() == ("id",)
+    assert keyed.item_key({"id": 1, "v": 2}) == (1,)
+    assert keyed.item_key({"v": 2}) is None
+
+    with pytest.raises(ValueError):
+        ArrayRule.parse("sorted")
+    with pytest.raises(ValueError):
+        ArrayRule.parse({"mode": "keyed"})
+    with pytest.raises(ValueError):
+        ArrayRules({"root['items']": 1})
+
+
+def test_keyed_array_matches_items_by_key():
+    source = {
+        "items": [
+            {"id": 1, "v": "a"},
+            {"id": 2, "v": "b"},
+            {"id": 3, "v": "c"},
+        ]
+    }
+    new = {
+        "items": [
+            {"id": 4, "v": "d"},
+            {"id": 3, "v": "c"},
+            {"id": 1, "v": "z"},
+        ]
+    }
+
+    diffs = _diffs(source, new, {"root['items']": {"mode": "keyed", "keys": ["id"]}})
+
+    assert diffs == [
+        ("Cambio de valor", "root['items'][0]['v']", "a", "z"),
+        ("Elemento añadido", "root['items'][0]", "", {"id": 4, "v": "d"}),
+        ("Elemento eliminado", "root['items'][1]", {"id": 2, "v": "b"}, ""),
+    ]
+
+
+def test_keyed_array_with_composite_and_repeated_keys():
+    source = [
+        {"a": 1, "b": 1, "v": 1},
+        {"a": 1, "b": 1, "v": 2},
+        {"a": 1, "b": 2, "v": 3},
+        "sin clave",
+    ]
+    new = [
+        {"a": 1, "b": 2, "v": 3},
+        {"a": 1, "b": 1, "v": 1},
+        {"a": 1, "b": 1, "v": 5},
+        "sin clave",
+    ]
+
+    diffs = _diffs(source, new, {"root": {"mode": "keyed", "keys": ["a", "b"]}})
+
+    # Las claves repetidas se emparejan en orden de aparición
+    assert diffs == [("Cambio de valor", "root[1]['v']", 2, 5)]
+
+
+def test_ordered_array_compares_by_position():
+    diffs = _diffs({"l": [1, 2, 3]}, {"l": [2, 1]}, {"root['l']": "ordered"})
+
+    assert diffs == [
+        ("Cambio de valor", "root['l'][0]", 1, 2),
+        ("Cambio de valor", "root['l'][1]", 2, 1),
+        ("Elemento eliminado", "root['l'][2]", 3, ""),
+    ]
+
+
+def test_same_items_in_other_order_are_equal_unless_ordered():
+    source = {"l": [1, 2, 3]}
+    new = {"l": [3, 2, 1]}
+
+    assert _diffs(source, new, {}) == []
+    assert _diffs(source, new, {"root['l']": {"keys": ["id"]}}) == []
+    assert len(_diffs(source, new, {"root['l']": "ordered"})) == 2
+
+
+def test_rules_apply_to_nested_arrays_with_wildcard():
+    source = {
+        "orders": [
+            {"id": 1, "lines": [{"sku": "a", "q": 1}, {"sku": "b", "q": 1}]},
+            {"id": 2, "lines": [{"sku": "c", "q": 1}]},
+        ]
+    }
+    new = {
+        "orders": [
+            {"id": 2, "lines": [{"sku": "c", "q": 1}]},
+            {"id": 1, "lines": [{"sku": "b", "q": 3}, {"sku": "a", "q": 1}]},
+        ]
+    }
+    rules = {
+        "root['orders']": {"keys": ["id"]},
+        "root['orders'][*]['lines']": {"keys": ["sku"]},
+    }
+
+    assert _diffs(source, new, rules) == [
+        ("Cambio de valor", "root['orders'][0]['lines'][1]['q']", 1, 3)
+    ]
+
+
+def test_keyed_array_of_many_items():
+    source = {"items": [{"id": i, "v": i} for i in range(20000)]}
+    new = {"items": [{"id": i, "v": i} for i in reversed(range(1, 20001))]}
+    new["items"][5]["v"] = -1
+
+    diffs = _diffs(source, new, {"root['items']": {"keys": ["id"]}})
+
+    assert diffs == [
+        ("Cambio de valor", "root['items'][19995]['v']", 19995, -1),
+        ("Elemento añadido", "root['items'][0]", "", {"id": 20000, "v": 20000}),
+        ("Elemento eliminado", "root['items'][0]", {"id": 0, "v": 0}, ""),
+    ]
+
+
+def test_path_pattern_replaces_only_array_indexes():
+    assert path_pattern("root['data'][3]['field']") == "root['data'][*]['field']"
+    assert path_pattern("root[0][12]") == "root[*][*]"
+    assert path_pattern("root['x[3]']['1']") == "root['x[3]']['1']"
+    assert path_pattern(".") == "."
@@ -0,0 +1,144 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from api_signature_tester.validator.host_scheduler import HostLimiter, HostScheduler
+from api_signature_tester.validator.pipeline_json_api import (
+    PipelineFullJsonApiValidator,
+)
+from api_signature_tester.validator.validator_model import EndpointData
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def build_limiter(clock, max_rps=10.0, max_in_flight=4, threshold=None):
+    return HostLimiter(
+        "http://api.test",
+        max_rps=max_rps,
+        min_rps=1.0,
+        max_in_flight=max_in_flight,
+        increase_rps=2.0,
+        backoff_factor=0.5,
+        latency_threshold_ms=threshold,
+        clock=clock,
+    )
+
+
+def test_backoff_halves_rate_and_limit_once_per_cooldown():
+    clock = FakeClock()
+    limiter = build_limiter(clock)
+
+    limiter.acquire()
+    limiter.release(429, 5.0)
+    clock.now += 0.5
+    limiter.acquire()
+    limiter.release(503, 5.0)
+    stats = limiter.get_stats()
+    assert (stats.get_rate(), stats.get_concurrency_limit()) == (5.0, 2)
+    assert stats.get_backoffs() == 1
+
+    clock.now += HostLimiter.BACKOFF_COOLDOWN_SECONDS - 0.5
+    limiter.acquire()
+    limiter.release(None, None)
+    stats = limiter.get_stats()
+    assert (stats.get_rate(), stats.get_concurrency_limit()) == (2.5, 1)
+
+
+def test_additive_increase_is_capped():
+    clock = FakeClock()
+    limiter = build_limiter(clock, threshold=100.0)
+    limiter.acquire()
+    limiter.release(200, 500.0)  # latencia alta: backoff
+    assert limiter.get_stats().get_rate() == 5.0
+
+    for _ in range(50):
+        clock.now += 1
+        limiter.acquire()
+        limiter.release(200, 10.0)
+
+    stats = limiter.get_stats()
+    assert stats.get_rate() == 10.0
+    assert stats.get_concurrency_limit() == 4
+    assert stats.get_requests_sent() == 51
+
+
+def test_in_flight_limit_blocks_until_release():
+    limiter = build_limiter(FakeClock(), max_rps=None, max_in_flight=1)
+    limiter.acquire()
+    acquired = threading.Event()
+
+    def second_request():
+        limiter.acquire()
+        acquired.set()
+
+    threading.Thread(target=second_request, daemon=True).start()
+    assert not acquired.wait(0.1)
+    limiter.release(200, 1.0)
+    assert acquired.wait(1)
+
+
+def test_scheduler_enforces_rate_per_host():
+    scheduler = HostScheduler(max_rps=20, max_in_flight=4)
+    started = time.monotonic()
+    for _ in range(5):
+        scheduler.send("http://a.test/x", lambda: FakeResponse(200))
+    scheduler.send("http://b.test/x", lambda: FakeResponse(200))
+
+    # El primer token está disponible; los otros 4 llegan a 20/s
+    assert time.monotonic() - started >= 0.18
+    stats = {s.get_host(): s for s in scheduler.get_stats()}
+    assert stats["http://a.test"].get_requests_sent() == 5
+    assert stats["http://b.test"].get_requests_sent() == 1
+
+
+def test_scheduler_honors_retry_after_and_errors():
+    scheduler = HostScheduler(max_rps=None)
+    scheduler.send("http://a.test", lambda: FakeResponse(429, {"Retry-After": "0.2"}))
+    started = time.monotonic()
+    scheduler.send("http://a.test", lambda: FakeResponse(200))
+    assert time.monotonic() - started >= 0.15
+
+    with pytest.raises(ConnectionError):
+        scheduler.send("http://c.test", Mock(side_effect=ConnectionError("down")))
+    stats = {s.get_host(): s for s in scheduler.get_stats()}
+    assert stats["http://c.test"].get_backoffs() == 1
+    assert stats["http://a.test"].get_rate() is not None
+
+
+def test_scheduler_rejects_invalid_settings():
+    with pytest.raises(ValueError, match="backoff_factor"):
+        HostScheduler(backoff_factor=1.5)
+
+
+def test_pipeline_sends_requests_through_scheduler(monkeypatch):
+    monkeypatch.setattr(
+        requests, "get", Mock(side_effect=lambda **kwargs: FakeResponse(200))
+    )
+    scheduler = HostScheduler(max_rps=100)
+    pipeline = PipelineFullJsonApiValidator(scheduler=scheduler)
+
+    pipeline._exetute_requests(
+        EndpointData("http://src.test/a", "GET", {}, {}),
+        EndpointData("http://new.test/a", "GET", {}, {}),
+    )
+
+    assert pipeline.get_scheduler() is scheduler
+    assert sorted(s.get_host() for s in scheduler.get_stats()) == [
+        "http://new.test",
+        "http://src.test",
+    ]
@@ -0,0 +1,79 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from api_signature_tester.validator.http_session_pool import HttpSessionPool, PoolStats
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_session_is_shared_per_host():
+    pool = HttpSessionPool()
+    s1 = pool.get_session("http://api.test/v1/users")
+    s2 = pool.get_session("http://API.test/v2?x=1")
+    s3 = pool.get_session("https://api.test/v1")
+    assert s1 is s2
+    assert s1 is not s3
+    pool.close()
+
+
+def test_get_session_invalid_url():
+    with pytest.raises(ValueError, match="URL inválida"):
+        HttpSessionPool().get_session("/relative/path")
+
+
+def test_stats_show_connection_reuse(local_server):
+    pool = HttpSessionPool(pool_size=2)
+    session = pool.get_session(local_server)
+    for _ in range(5):
+        assert session.get(f"{local_server}/item").status_code == 200
+
+    stats = pool.get_stats()
+    pool.close()
+
+    assert stats.get_hosts() == 1
+    assert stats.get_requests_sent() == 5
+    assert stats.get_new_connections() == 1
+    assert stats.get_open_connections() == 1
+    assert stats.get_reuse_ratio() == pytest.approx(0.8)
+
+
+def test_stats_without_keep_alive(local_server):
+    pool = HttpSessionPool(keep_alive=False)
+    session = pool.get_session(local_server)
+    for _ in range(3):
+        session.get(f"{local_server}/item")
+
+    stats = pool.get_stats()
+    pool.close()
+
+    assert stats.get_new_connections() == 3
+    assert stats.get_reuse_ratio() == 0.0
+
+
+def test_reuse_ratio_without_requests():
+    assert PoolStats(0, 0, 0, 0).get_reuse_ratio() == 0.0
@@ -0,0 +1,111 @@
+import pytest
+import requests
+
+from api_signature_tester.validator import json_decoder
+from api_signature_tester.validator.json_decoder import (
+    OrjsonJsonDecoder,
+    StdlibJsonDecoder,
+    get_json_decoder,
+)
+from api_signature_tester.validator.pipeline_json_api import (
+    PipelineFullJsonApiValidator,
+)
+
+
+class SpyDecoder(StdlibJsonDecoder):
+    def __init__(self):
+        self.decoded: list[bytes] = []
+
+    def get_name(self) -> str:
+        return "spy"
+
+    def decode(self, content: bytes):
+        self.decoded.append(content)
+        return super().decode(content)
+
+
+def build_response(content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = content
+    return response
+
+
+def test_stdlib_decoder_reads_bytes_with_bom():
+    decoder = StdlibJsonDecoder()
+
+    assert decoder.decode(b'{"a": [1, 2]}') == {"a": [1, 2]}
+    assert decoder.decode('﻿{"a": 1}'.encode()) == {"a": 1}
+
+
+def test_get_json_decoder_by_name():
+    assert isinstance(get_json_decoder("stdlib"), StdlibJsonDecoder)
+    assert get_json_decoder(None).get_name() in ("stdlib", "orjson")
+    with pytest.raises(ValueError, match="desconocido"):
+        get_json_decoder("simdjson")
+
+
+def test_orjson_decoder_requires_orjson(monkeypatch):
+    monkeypatch.setattr(json_decoder, "orjson", None)
+
+    assert isinstance(get_json_decoder("auto"), StdlibJsonDecoder)
+    with pytest.raises(ValueError, match="orjson"):
+        get_json_decoder("orjson")
+
+
+def test_orjson_decoder_matches_stdlib():
+    pytest.importorskip("orjson")
+    decoder = OrjsonJsonDecoder()
+
+    assert decoder.decode(b'{"a": 1.5, "b": null}') == {"a": 1.5, "b": None}
+    # orjson rechaza estos documentos; se decodifican con la stdlib
+    assert decoder.decode(b'{"big": 123456789012345678901234567890}') == {
+        "big": 123456789012345678901234567890
+    }
+    assert decoder.decode('﻿{"a": 1}'.encode()) == {"a": 1}
+
+
+def test_pipeline_decodes_raw_bytes_with_its_decoder():
+    # Given
+    decoder = SpyDecoder()
+    pipeline = PipelineFullJsonApiValidator(json_decoder=decoder)
+    source = build_response(b'{"a": 1}')
+    new = build_response(b"<html>error</html>")
+
+    # When
+    j1, j2 = pipeline.get_body_response(source, new)
+    decoded = pipeline.decode_case(None, None, source, new)  # type: ignore[arg-type]
+
+    # Then
+    assert (j1, j2) == ({"a": 1}, None)
+    assert decoder.decoded[:2] == [b'{"a": 1}', b"<html>error</html>"]
+    metrics = decoded.get_metrics()
+    assert metrics is not None
+    assert metrics.get_json_decoder() == "spy"
+
+
+def test_pipeline_decodes_body_in_declared_charset():
+    # Given: requests toma el charset del Content-Type
+    body = '{"nombre": "José", "ciudad": "Córdoba"}'.encode("latin-1")
+    source = build_response(body)
+    source.headers["Content-Type"] = "application/json; charset=latin-1"
+    source.encoding = "latin-1"
+    new = build_response('{"nombre": "José", "ciudad": "Cordoba"}'.encode())
+    new.encoding = "utf-8"
+    pipeline = PipelineFullJsonApiValidator(
+        json_decoder=SpyDecoder(), streaming_diff_min_bytes=1
+    )
+
+    # When
+    j1, j2 = pipeline.get_body_response(source, new)
+    result = pipeline.compare_decoded_case(
+        pipeline.decode_case(None, None, source, new)  # type: ignore[arg-type]
+    )
+
+    # Then: sin diff de formato y sin el diff incremental (solo lee UTF-8)
+    assert j1 == {"nombre": "José", "ciudad": "Córdoba"}
+    assert j2 == {"nombre": "José", "ciudad": "Cordoba"}
+    assert not pipeline.use_streaming_diff(source, new)
+    assert [
+        (d["Tipo"], d["Ruta"]) for d in result.get_comparation_result().get_diff_body()
+    ] == [("Cambio de valor", "root['ciudad']")]
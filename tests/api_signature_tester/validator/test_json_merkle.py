@@ -0,0 +1,111 @@
+import copy
+
+from deepdiff import DeepDiff
+
+from api_signature_tester.validator.json_merkle import (
+    SubtreeHasher,
+    find_changed_fragments,
+)
+from api_signature_tester.validator.pipeline_json_api import (
+    PipelineFullJsonApiValidator,
+)
+
+
+def test_hash_ignores_key_order_array_order_and_repetitions():
+    hasher = SubtreeHasher()
+
+    assert hasher.digest({"a": 1, "b": [1, 2]}) == hasher.digest(
+        {"b": [2, 1, 1], "a": 1}
+    )
+    assert hasher.digest(1) == hasher.digest(1.0)
+    assert hasher.digest(True) != hasher.digest(1)
+    assert hasher.digest("1") != hasher.digest(1)
+    assert hasher.digest({"a": None}) != hasher.digest({"a": "None"})
+    assert hasher.digest({"ab": "c"}) != hasher.digest({"a": "bc"})
+
+
+def test_only_changed_subtrees_are_returned():
+    source = {"items": [{"id": i, "v": {"x": i}} for i in range(100)], "meta": {"n": 1}}
+    new = copy.deepcopy(source)
+    new["items"][40]["v"]["x"] = -1
+    new["meta"]["m"] = 2
+
+    fragments = find_changed_fragments(source, new)
+
+    paths = sorted(fragment.get_path() for fragment in fragments)
+    assert paths == ["root['items']", "root['meta']"]
+    items = next(f for f in fragments if f.get_path() == "root['items']")
+    # Del array solo se conserva el elemento distinto, en su misma posición
+    changed = [i for i, item in enumerate(items.get_new()) if isinstance(item, dict)]
+    assert changed == [40]
+    assert items.get_source()[40] == {"id": 40, "v": {"x": 40}}
+    assert items.get_new()[40] == {"id": 40, "v": {"x": -1}}
+
+
+def test_equal_documents_have_no_fragments():
+    assert find_changed_fragments({"a": [1, {"b": 2}]}, {"a": [{"b": 2}, 1]}) == []
+
+
+def _types_and_paths(diffs):
+    return {(diff["Tipo"], diff["Ruta"]) for diff in diffs}
+
+
+def test_compare_body_keeps_paths_of_the_full_document():
+    source = {
+        "a": {"b": [{"id": 1, "v": 1}, {"id": 2, "v": 2}, {"id": 3, "v": 3}]},
+        "c": 1,
+        "gone": True,
+    }
+    new = {
+        "a": {"b": [{"id": 3, "v": 3}, {"id": 2, "v": 20}, {"id": 4, "v": 4}, 5]},
+        "c": 2,
+        "added": {},
+    }
+
+    diffs = PipelineFullJsonApiValidator().compare_body(source, new)
+
+    deep_diff = DeepDiff(source, new, ignore_order=True)
+    expected = (
+        {("Cambio de valor", path) for path in deep_diff.get("values_changed", {})}
+        | {("Elemento añadido", path) for path in deep_diff["iterable_item_added"]}
+        | {("Clave añadida", path) for path in deep_diff["dictionary_item_added"]}
+        | {("Clave eliminada", path) for path in deep_diff["dictionary_item_removed"]}
+    )
+    assert _types_and_paths(diffs) == expected
+    assert ("Elemento añadido", "root['a']['b'][3]") in expected
+    assert ("Cambio de valor", "root['a']['b'][1]['v']") in expected
+
+
+def test_compare_body_orders_diffs_by_type():
+    diffs = PipelineFullJsonApiValidator().compare_body(
+        {"x": {"gone": 1, "k": 1}, "y": 1}, {"x": {"added": 1, "k": 1}, "y": 2}
+    )
+
+    assert [diff["Tipo"] for diff in diffs] == [
+        "Cambio de valor",
+        "Clave añadida",
+        "Clave eliminada",
+    ]
+    assert diffs[1]["Ruta"] == "root['x']['added']"
+
+
+def test_compare_body_matches_deep_diff_for_objects_with_few_common_keys():
+    source = {"x": {"a": 1, "b": 2, "c": 3}, "y": 1}
+    new = {"x": {"d": 1, "e": 2, "c": 3}, "y": 1}
+
+    diffs = PipelineFullJsonApiValidator().compare_body(source, new)
+
+    # Con menos de un tercio de claves en común DeepDiff reporta el objeto
+    assert _types_and_paths(diffs) == {("Cambio de valor", "root['x']")}
+
+
+def test_compare_body_merges_removed_and_added_item_at_same_index():
+    source = {"l": [{"id": 1}, {"id": 5, "v": 1}, {"id": 2}]}
+    new = {"l": [{"id": 1}, {"id": 0, "v": [2, 1, 3]}, {"id": 2}]}
+
+    diffs = PipelineFullJsonApiValidator().compare_body(source, new)
+
+    deep_diff = DeepDiff(source, new, ignore_order=True)
+    assert _types_and_paths(diffs) == {
+        ("Cambio de valor", path) for path in deep_diff["values_changed"]
+    }
@@ -0,0 +1,168 @@
+import json
+
+import pytest
+
+from api_signature_tester.validator import stream_diff
+from api_signature_tester.validator.json_stream import (
+    START_ARRAY,
+    START_MAP,
+    JsonEventReader,
+    JsonStreamError,
+    build_value,
+    iter_chunks,
+    iter_json_events,
+)
+from api_signature_tester.validator.stream_diff import StreamingJsonDiff, diff_values
+
+DOCUMENT = {
+    "id": 12345678901234567890,
+    "name": 'café ☃ "quoted" \\ escaped',
+    "price": -12.5e-3,
+    "active": True,
+    "deleted": False,
+    "parent": None,
+    "tags": ["a", "b", [], {}],
+    "items": [{"id": 1, "values": [1, 2.5, "x"]}, {"id": 2, "nested": {"k": []}}],
+}
+
+
+def _decode(content: bytes, chunk_size: int):
+    events = JsonEventReader(iter_chunks(content, chunk_size)).iter_events()
+    value = build_value(events, next(events))
+    assert next(events, None) is None
+    return value
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64 * 1024])
+def test_events_rebuild_same_document_as_json_loads(chunk_size):
+    content = json.dumps(DOCUMENT, ensure_ascii=False, indent=2).encode("utf-8")
+
+    assert _decode(content, chunk_size) == json.loads(content)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3])
+def test_scalar_documents_and_bom(chunk_size):
+    assert _decode(b"  123  ", chunk_size) == 123
+    assert _decode(b'"\\u00e9"', chunk_size) == "é"
+    assert _decode(b"null", chunk_size) is None
+    assert _decode(b"\xef\xbb\xbf[true]", chunk_size) == [True]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"",
+        b"{",
+        b'{"a" 1}',
+        b'{"a": 1,}',
+        b"[1 2]",
+        b"[1] 2",
+        b"tru",
+        b'"abc',
+        b"{1: 2}",
+    ],
+)
+def test_invalid_documents_raise(content):
+    with pytest.raises(JsonStreamError):
+        _decode(content, 2)
+
+
+def _create_body_diff(type, path, old_value, new_value):
+    return {
+        "Tipo": type,
+        "Ruta": path,
+        "Valor anterior": old_value,
+        "Valor nuevo": new_value,
+    }
+
+
+def _stream_diff(source, new, chunk_size=3):
+    return StreamingJsonDiff(_create_body_diff).compare(
+        iter_json_events(json.dumps(source).encode(), chunk_size),
+        iter_json_events(json.dumps(new).encode(), chunk_size),
+    )
+
+
+def test_stream_diff_equal_documents():
+    assert _stream_diff(DOCUMENT, DOCUMENT) == []
+
+
+def test_stream_diff_reports_value_changes_with_paths():
+    new = json.loads(json.dumps(DOCUMENT))
+    new["items"][1]["nested"]["k"] = [1]
+    new["active"] = 1
+
+    diffs = _stream_diff(DOCUMENT, new)
+
+    assert diffs == [
+        _create_body_diff("Cambio de valor", "root['active']", True, 1),
+        _create_body_diff(
+            "Elemento añadido", "root['items'][1]['nested']['k'][0]", "", 1
+        ),
+    ]
+
+
+def test_stream_diff_reports_added_and_removed_keys():
+    diffs = _stream_diff(
+        {"a": 1, "b": {"x": 1}, "c": 3}, {"a": 1, "b": {"x": 2}, "d": 4}
+    )
+
+    assert diffs == [
+        _create_body_diff("Cambio de valor", "root['b']['x']", 1, 2),
+        _create_body_diff("Clave eliminada", "root['c']", "", ""),
+        _create_body_diff("Clave añadida", "root['d']", "", ""),
+    ]
+
+
+def test_stream_diff_keys_in_different_order_are_equal():
+    assert _stream_diff({"a": 1, "b": [1, 2]}, {"b": [1, 2], "a": 1}) == []
+
+
+def test_stream_diff_buffers_only_keys_out_of_order(monkeypatch):
+    built = []
+
+    def spy_build_value(events, first):
+        built.append(first[0])
+        return build_value(events, first)
+
+    monkeypatch.setattr(stream_diff, "build_value", spy_build_value)
+    big = [[i, {"v": i}] for i in range(50)]
+    source = {"moved": {"x": 1}, "big": big, "tail": {"y": [1, 2]}}
+    new = {"inserted": 0, "big": big, "tail": {"y": [1, 3]}, "moved": {"x": 2}}
+
+    diffs = _stream_diff(source, new)
+
+    assert diffs == [
+        _create_body_diff("Cambio de valor", "root['tail']['y'][1]", 2, 3),
+        _create_body_diff("Cambio de valor", "root['moved']['x']", 1, 2),
+        _create_body_diff("Clave añadida", "root['inserted']", "", ""),
+    ]
+    # Solo se construyen los valores de "moved" e "inserted" y los escalares;
+    # "big" y "tail" se comparan a la par sin construir sus arrays
+    assert START_ARRAY not in built
+    assert built.count(START_MAP) == 2
+
+
+def test_stream_diff_extra_array_items_and_type_changes():
+    diffs = _stream_diff({"l": [1, 2, 3], "t": {"a": 1}}, {"l": [1], "t": [1]})
+
+    assert diffs == [
+        _create_body_diff("Elemento eliminado", "root['l'][1]", 2, ""),
+        _create_body_diff("Elemento eliminado", "root['l'][2]", 3, ""),
+        _create_body_diff("Cambio de valor", "root['t']", {"a": 1}, [1]),
+    ]
+
+
+def test_stream_diff_matches_in_memory_diff():
+    source = {"a": [1, {"b": 2}], "c": "x", "d": {"e": None}}
+    new = {"a": [1, {"b": 3}, 4], "d": {"e": False}, "f": 1}
+
+    expected: list = []
+    diff_values(
+        "root",
+        source,
+        new,
+        lambda *args: expected.append(_create_body_diff(*args)),
+    )
+
+    assert sorted(map(str, _stream_diff(source, new))) == sorted(map(str, expected))
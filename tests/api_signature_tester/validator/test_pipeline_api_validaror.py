@@ -1,4 +1,5 @@
 import json
+import threading
 from typing import Any
 from unittest.mock import Mock
 
@@ -8,6 +9,7 @@ from requests.models import Response
 
 from api_signature_tester.validator.pipeline_api_validaror import PipelineApiValidaror
 from api_signature_tester.validator.validator_model import (
+    BodyDiff,
     EndpointData,
 )
 
@@ -57,7 +59,7 @@ def test_create_body_diff_structure():
     p = FakePipelineApiValidaror()
 
     diff = p.create_body_diff("Cambio", "root['a']", "1", "2")
-    assert isinstance(diff, dict)
+    assert isinstance(diff, BodyDiff)
     assert set(diff.keys()) == {"Tipo", "Ruta", "Valor anterior", "Valor nuevo"}
     assert diff["Tipo"] == "Cambio"
     assert diff["Ruta"] == "root['a']"
@@ -137,3 +139,27 @@ def test_compare_responses_status_code_and_body():
     # status diff present
     assert status_diff["status_code"]["old_value"] == 200
     assert status_diff["status_code"]["new_value"] == 500
+
+
+def test__exetute_requests_parallel_overlaps_requests(monkeypatch):
+    src_resp = FakeResponse(200, json_data={"a": 1})
+    new_resp = FakeResponse(200, json_data={"a": 2})
+    started = threading.Barrier(2, timeout=2)
+
+    def side_effect(url=None, params=None, headers=None):
+        # Ambas requests deben estar en vuelo a la vez para pasar la barrera
+        started.wait()
+        return src_resp if url == "http://src.test" else new_resp
+
+    monkeypatch.setattr(requests, "get", Mock(side_effect=side_effect))
+
+    source = EndpointData(url="http://src.test", method="GET", params={}, headers={})
+    new = EndpointData(url="http://new.test", method="GET", params={}, headers={})
+
+    p = FakePipelineApiValidaror(parallel_requests=True)
+    try:
+        r1, r2 = p._exetute_requests(source, new)
+    finally:
+        p.close()
+    assert r1 is src_resp
+    assert r2 is new_resp
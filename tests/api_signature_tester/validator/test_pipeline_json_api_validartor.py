@@ -1,9 +1,20 @@
 import json
+from datetime import timedelta
+from unittest.mock import Mock
 
 import pytest
+import requests
 
+from api_signature_tester.validator.jmespath_cache import compile_expression
 from api_signature_tester.validator.pipeline_json_api import (
     PipelineFullJsonApiValidator,
+    PipelineJsonApiParcialValidator,
+)
+from api_signature_tester.validator.validator_model import (
+    FAST_PATH_BYTES,
+    FAST_PATH_CANONICAL,
+    EndpointData,
+    LatencyPolicy,
 )
 
 
@@ -108,3 +119,283 @@ def test_compare_responses_body_diff_dictionary_item_removed():
     assert len(body_diff) == 1
     assert set(body_diff[0].keys()) == {"Tipo", "Ruta", "Valor anterior", "Valor nuevo"}
     assert body_diff[0]["Tipo"] == "Clave eliminada"
+
+
+class FakeRawResponse(FakeResponse):
+    def __init__(self, status_code: int, content: bytes):
+        super().__init__(status_code)
+        self.content = content
+
+    def json(self):
+        return json.loads(self.content)
+
+
+def _execute_with_responses(pipelline, r1, r2):
+    source = EndpointData("http://src.test", "GET", {}, {})
+    new = EndpointData("http://new.test", "GET", {}, {})
+    decoded = pipelline.decode_case(source, new, r1, r2)
+    return pipelline.compare_decoded_case(decoded).get_comparation_result()
+
+
+def test_fast_path_byte_identical_bodies(monkeypatch):
+    pipelline = PipelineFullJsonApiValidator()
+    monkeypatch.setattr(pipelline, "compare_body", Mock(side_effect=AssertionError))
+    monkeypatch.setattr(
+        pipelline, "get_body_response", Mock(side_effect=AssertionError)
+    )
+
+    result = _execute_with_responses(
+        pipelline,
+        FakeRawResponse(200, b'{"a": 1}'),
+        FakeRawResponse(200, b'{"a": 1}'),
+    )
+
+    assert result.is_equal()
+    assert result.get_fast_path() == FAST_PATH_BYTES
+
+
+def test_fast_path_canonical_equal_bodies(monkeypatch):
+    pipelline = PipelineFullJsonApiValidator()
+    monkeypatch.setattr(pipelline, "compare_body", Mock(side_effect=AssertionError))
+
+    result = _execute_with_responses(
+        pipelline,
+        FakeRawResponse(200, b'{"a": 1, "b": {"x": 2.0, "y": [1, 2]}}'),
+        FakeRawResponse(200, b'{"b":{"y":[1,2],"x":2},"a":1}'),
+    )
+
+    assert result.is_equal()
+    assert result.get_fast_path() == FAST_PATH_CANONICAL
+
+
+def test_no_fast_path_when_bodies_differ():
+    pipelline = PipelineFullJsonApiValidator()
+
+    result = _execute_with_responses(
+        pipelline,
+        FakeRawResponse(200, b'{"a": 1}'),
+        FakeRawResponse(200, b'{"a": 2}'),
+    )
+
+    assert not result.is_equal()
+    assert result.get_fast_path() is None
+    assert result.get_diff_body()[0]["Tipo"] == "Cambio de valor"
+
+
+def test_per_row_path_overrides_default_path():
+    compile_expression.cache_clear()
+    pipelline = PipelineJsonApiParcialValidator("data")
+    r1 = FakeRawResponse(200, b'{"data": {"a": 1}, "meta": {"v": 1}}')
+    r2 = FakeRawResponse(200, b'{"data": {"a": 2}, "meta": {"v": 1}}')
+    source = EndpointData("http://src.test", "GET", {}, {})
+    new = EndpointData("http://new.test", "GET", {}, {})
+
+    for _ in range(3):
+        decoded = pipelline.decode_case(source, new, r1, r2, "meta")
+        assert decoded.get_body_source() == {"v": 1}
+
+    assert pipelline.get_body_response(r1, r2) == ({"a": 1}, {"a": 2})
+    # "meta" y "data" se compilan una sola vez cada una
+    assert compile_expression.cache_info().misses == 2
+
+
+def test_execute_records_request_metrics(monkeypatch):
+    def fake_get(url=None, params=None, headers=None):
+        response = FakeRawResponse(200, b'{"a": 1}' if "src" in url else b'{"a": 2}')
+        response.elapsed = timedelta(milliseconds=5)
+        return response
+
+    monkeypatch.setattr(requests, "get", fake_get)
+    pipelline = PipelineFullJsonApiValidator()
+
+    result = pipelline.execute(
+        EndpointData("http://src.test", "GET", {}, {}),
+        EndpointData("http://new.test", "GET", {}, {}),
+    )
+
+    metrics = result.get_metrics()
+    assert metrics.get_source().get_ttfb_ms() == pytest.approx(5)
+    assert metrics.get_source().get_latency_ms() >= 0
+    assert metrics.get_new().get_response_bytes() == 8
+    assert metrics.get_decode_ms() >= 0
+    assert metrics.get_diff_ms() >= 0
+
+
+def test_metrics_without_timing_for_responses_not_sent():
+    pipelline = PipelineFullJsonApiValidator()
+    source = EndpointData("http://src.test", "GET", {}, {})
+    new = EndpointData("http://new.test", "GET", {}, {})
+    r1 = FakeRawResponse(200, b'{"a": 1}')
+    r1.elapsed = timedelta(0)
+
+    decoded = pipelline.decode_case(source, new, r1, FakeRawResponse(200, b"{}"))
+    metrics = pipelline.compare_decoded_case(decoded).get_metrics()
+
+    assert metrics.get_source().get_latency_ms() is None
+    assert metrics.get_source().get_ttfb_ms() is None
+    assert metrics.get_source().get_response_bytes() == 8
+    assert metrics.get_new().get_response_bytes() == 2
+
+
+def _timed_response(latency_ms: float) -> FakeRawResponse:
+    response = FakeRawResponse(200, b'{"a": 1}')
+    response.elapsed = timedelta(milliseconds=1)
+    response.total_elapsed = timedelta(milliseconds=latency_ms)
+    return response
+
+
+def _pipeline_with_latencies(policy, source_ms, new_ms):
+    pipelline = PipelineFullJsonApiValidator(latency_policy=policy)
+    latencies = {"http://src.test": iter(source_ms), "http://new.test": iter(new_ms)}
+    sent = []
+
+    def send_request(endpoint):
+        sent.append(endpoint.get_url())
+        return _timed_response(next(latencies[endpoint.get_url()]))
+
+    pipelline._send_request = send_request
+    return pipelline, sent
+
+
+def test_latency_regression_uses_median_of_samples():
+    policy = LatencyPolicy(max_ratio=2.0, samples=3)
+    pipelline, sent = _pipeline_with_latencies(policy, [10, 12, 11], [50, 20, 30])
+
+    result = pipelline.execute(
+        EndpointData("http://src.test", "GET", {}, {}),
+        EndpointData("http://new.test", "GET", {}, {}),
+    ).get_comparation_result()
+
+    assert sent == ["http://src.test", "http://new.test"] * 3
+    assert not result.is_equal()
+    assert result.get_fast_path() == FAST_PATH_BYTES
+    assert result.get_diff_latency() == {
+        "old_value": 11,
+        "new_value": 30,
+        "ratio": pytest.approx(2.727),
+        "samples": 3,
+    }
+
+
+def test_latency_sampling_does_not_repeat_non_idempotent_requests():
+    policy = LatencyPolicy(max_ratio=2.0, samples=3)
+    pipelline, sent = _pipeline_with_latencies(policy, [10, 12, 11], [50, 20, 30])
+
+    result = pipelline.execute(
+        EndpointData("http://src.test", "POST", {}, {}),
+        EndpointData("http://new.test", "POST", {}, {}),
+    ).get_comparation_result()
+
+    # Un solo POST por lado; la latencia se compara con esa muestra
+    assert sent == ["http://src.test", "http://new.test"]
+    assert result.get_diff_latency()["samples"] == 1
+    assert result.get_diff_latency()["new_value"] == 50
+
+
+def test_latency_within_ratio_but_over_budget():
+    source = EndpointData("http://src.test", "GET", {}, {})
+    new = EndpointData("http://new.test", "GET", {}, {})
+
+    pipelline, _ = _pipeline_with_latencies(LatencyPolicy(max_ratio=2.0), [100], [150])
+    assert pipelline.execute(source, new).get_comparation_result().is_equal()
+
+    pipelline, _ = _pipeline_with_latencies(
+        LatencyPolicy(max_ratio=2.0, budget_ms=30), [100], [150]
+    )
+    result = pipelline.execute(source, new).get_comparation_result()
+    assert result.get_diff_latency()["new_value"] == 150
+
+
+def test_latency_is_not_compared_without_policy_or_timing():
+    pipelline = PipelineFullJsonApiValidator()
+    decoded = pipelline.decode_case(
+        EndpointData("http://src.test", "GET", {}, {}),
+        EndpointData("http://new.test", "GET", {}, {}),
+        _timed_response(1),
+        _timed_response(500),
+    )
+    assert pipelline.compare_decoded_case(decoded).get_comparation_result().is_equal()
+
+    pipelline = PipelineFullJsonApiValidator(latency_policy=LatencyPolicy(budget_ms=1))
+    untimed = FakeRawResponse(200, b'{"a": 1}')
+    assert pipelline.compare_latency(None) == {}
+    decoded = pipelline.decode_case(
+        EndpointData("http://src.test", "GET", {}, {}),
+        EndpointData("http://new.test", "GET", {}, {}),
+        untimed,
+        _timed_response(500),
+    )
+    assert pipelline.compare_decoded_case(decoded).get_comparation_result().is_equal()
+
+
+def test_latency_policy_requires_a_limit():
+    with pytest.raises(ValueError, match="max_ratio or budget_ms"):
+        LatencyPolicy(samples=3)
+
+
+def _raw_response(content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = content
+    return response
+
+
+def test_streaming_diff_for_large_bodies():
+    pipelline = PipelineFullJsonApiValidator(streaming_diff_min_bytes=1)
+    source = EndpointData("http://src.test", "GET", {}, {})
+    new = EndpointData("http://new.test", "GET", {}, {})
+
+    decoded = pipelline.decode_case(
+        source,
+        new,
+        _raw_response(b'{"a": 1, "b": [1, 2]}'),
+        _raw_response(b'{"a": 2, "b": [1, 2], "c": 3}'),
+    )
+    result = pipelline.compare_decoded_case(decoded).get_comparation_result()
+
+    assert decoded.is_streaming()
+    assert decoded.get_body_source() == b'{"a": 1, "b": [1, 2]}'
+    assert [(d["Tipo"], d["Ruta"]) for d in result.get_diff_body()] == [
+        ("Cambio de valor", "root['a']"),
+        ("Clave añadida", "root['c']"),
+    ]
+
+
+def test_streaming_diff_only_over_threshold():
+    pipelline = PipelineFullJsonApiValidator(streaming_diff_min_bytes=100)
+    source = EndpointData("http://src.test", "GET", {}, {})
+    new = EndpointData("http://new.test", "GET", {}, {})
+
+    decoded = pipelline.decode_case(
+        source, new, _raw_response(b'{"a": 1}'), _raw_response(b'{"a": 2}')
+    )
+
+    assert not decoded.is_streaming()
+    assert decoded.get_body_source() == {"a": 1}
+
+
+def test_streaming_diff_reports_format_error():
+    pipelline = PipelineFullJsonApiValidator(streaming_diff_min_bytes=1)
+
+    result = _execute_with_responses(
+        pipelline, _raw_response(b'{"a": 1}'), _raw_response(b"<html></html>")
+    )
+
+    assert result.get_diff_body() == [
+        pipelline.create_body_diff(
+            "format_error", ".", "source_is_json True", "new_is_json False"
+        )
+    ]
+
+
+def test_partial_validator_ignores_streaming_diff():
+    pipelline = PipelineJsonApiParcialValidator("a", streaming_diff_min_bytes=1)
+    source = EndpointData("http://src.test", "GET", {}, {})
+    new = EndpointData("http://new.test", "GET", {}, {})
+
+    decoded = pipelline.decode_case(
+        source, new, _raw_response(b'{"a": 1}'), _raw_response(b'{"a": 2}')
+    )
+
+    assert not decoded.is_streaming()
+    assert decoded.get_body_new() == 2
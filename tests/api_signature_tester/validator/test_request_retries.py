@@ -0,0 +1,213 @@
+import logging
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from api_signature_tester.etl.etl_source_data import ETLDataProcess, TestData
+from api_signature_tester.pipeline.sync_process import ApiSignatureTesterSynchBase
+from api_signature_tester.validator.latency_tracker import LatencyTracker
+from api_signature_tester.validator.pipeline_api_validaror import RequestError
+from api_signature_tester.validator.pipeline_json_api import (
+    PipelineFullJsonApiValidator,
+)
+from api_signature_tester.validator.validator_model import (
+    DiffType,
+    EndpointData,
+    RetryPolicy,
+)
+
+ENDPOINT = EndpointData("http://src.test/a", "GET", {}, {})
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, content: bytes = b"{}"):
+        self.status_code = status_code
+        self.content = content
+
+
+def build_pipeline(**kwargs) -> PipelineFullJsonApiValidator:
+    return PipelineFullJsonApiValidator(
+        retry_policy=RetryPolicy(backoff_seconds=0, **kwargs)
+    )
+
+
+def test_retries_retryable_status_and_records_counts(monkeypatch):
+    fake_get = Mock(
+        side_effect=[
+            requests.ReadTimeout("slow"),
+            FakeResponse(503),
+            FakeResponse(200),
+        ]
+    )
+    monkeypatch.setattr(requests, "get", fake_get)
+    pipeline = build_pipeline(
+        connect_timeout_seconds=1, read_timeout_seconds=2, retries=3
+    )
+
+    response = pipeline._send_request(ENDPOINT)
+    metrics = pipeline.get_request_metrics(response)
+
+    assert response.status_code == 200
+    assert fake_get.call_count == 3
+    assert fake_get.call_args.kwargs["timeout"] == (1, 2)
+    assert (metrics.get_retries(), metrics.get_timeouts()) == (2, 1)
+    assert not metrics.is_hedged()
+
+
+def test_returns_last_response_when_retries_are_exhausted(monkeypatch):
+    monkeypatch.setattr(requests, "get", Mock(return_value=FakeResponse(502)))
+    response = build_pipeline(retries=2)._send_request(ENDPOINT)
+    assert response.status_code == 502
+    assert response.retries == 2
+
+
+def test_raises_request_error_after_exhausting_retries(monkeypatch):
+    fake_get = Mock(
+        side_effect=[
+            requests.ReadTimeout("slow"),
+            requests.ConnectionError("down"),
+            requests.ConnectionError("down"),
+        ]
+    )
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    with pytest.raises(RequestError) as error:
+        build_pipeline(retries=2)._send_request(ENDPOINT)
+    assert fake_get.call_count == 3
+    assert str(error.value) == "ConnectionError: down"
+    assert (error.value.get_retries(), error.value.get_timeouts()) == (2, 1)
+
+
+def test_failed_request_is_reported_as_failed_case(monkeypatch):
+    monkeypatch.setattr(requests, "get", Mock(return_value=FakeResponse(200)))
+    fake_post = Mock(side_effect=requests.ReadTimeout("slow"))
+    monkeypatch.setattr(requests, "post", fake_post)
+    post = EndpointData("http://new.test/a", "POST", {}, {})
+
+    result = build_pipeline(retries=3).execute(ENDPOINT, post, case_id=7)
+
+    # POST no es idempotente: un solo intento
+    assert fake_post.call_count == 1
+    assert not result.get_comparation_result().is_equal()
+    assert result.get_case_id() == 7
+    assert result.get_comparation_result().get_diff_body() == [
+        {
+            "Tipo": DiffType.REQUEST_ERROR,
+            "Ruta": ".",
+            "Valor anterior": "",
+            "Valor nuevo": "ReadTimeout: slow",
+        }
+    ]
+    metrics = result.get_metrics()
+    assert metrics.get_source().get_response_bytes() == 2
+    assert (metrics.get_new().get_retries(), metrics.get_new().get_timeouts()) == (
+        0,
+        1,
+    )
+
+
+@pytest.mark.parametrize("parallel_requests", [False, True])
+def test_run_with_timing_out_endpoint_reports_every_case(
+    monkeypatch, parallel_requests
+):
+    def fake_get(url, **kwargs):
+        if url.endswith("/hang"):
+            raise requests.ReadTimeout("slow")
+        return FakeResponse(200, b'{"ok": true}')
+
+    monkeypatch.setattr(requests, "get", fake_get)
+    cases = ETLDataProcess()
+    for i, name in enumerate(["a", "hang", "b", "c"]):
+        cases.add_test_data(
+            TestData(
+                EndpointData(f"http://src.test/{name}", "GET", {}, {}),
+                EndpointData(f"http://new.test/{name}", "GET", {}, {}),
+                case_id=i,
+            )
+        )
+    pipeline = PipelineFullJsonApiValidator(
+        parallel_requests=parallel_requests,
+        retry_policy=RetryPolicy(backoff_seconds=0, retries=1),
+    )
+    engine = ApiSignatureTesterSynchBase(pipeline, logging.getLogger("test"), None)
+
+    results = list(engine.run_test_cases(cases))
+    pipeline.close()
+
+    assert [r.get_case_id() for r in results] == [0, 1, 2, 3]
+    assert [r.get_comparation_result().is_equal() for r in results] == [
+        True,
+        False,
+        True,
+        True,
+    ]
+    failed = results[1].get_comparation_result().get_diff_body()[0]
+    assert failed.get_type() == DiffType.REQUEST_ERROR
+    assert failed.get_old_value() == "ReadTimeout: slow"
+    assert results[1].get_metrics().get_source().get_timeouts() == 2
+
+
+def test_non_idempotent_methods_are_not_retried(monkeypatch):
+    fake_post = Mock(return_value=FakeResponse(503))
+    monkeypatch.setattr(requests, "post", fake_post)
+
+    build_pipeline(retries=3)._send_request(
+        EndpointData("http://src.test/a", "POST", {}, {})
+    )
+    assert fake_post.call_count == 1
+
+
+def test_hedged_request_returns_first_response(monkeypatch):
+    calls = []
+    release_slow = threading.Event()
+
+    def fake_get(**kwargs):
+        calls.append(kwargs["url"])
+        if len(calls) == 1:
+            release_slow.wait(2)
+            return FakeResponse(200, b'{"slow": true}')
+        return FakeResponse(200, b'{"fast": true}')
+
+    monkeypatch.setattr(requests, "get", fake_get)
+    pipeline = build_pipeline(hedging=True)
+    for _ in range(RetryPolicy.HEDGE_MIN_SAMPLES):
+        pipeline._latency_tracker.add(ENDPOINT.get_url(), 20.0)
+
+    started = time.monotonic()
+    response = pipeline._send_request(ENDPOINT)
+    elapsed = time.monotonic() - started
+    release_slow.set()
+    pipeline.close()
+
+    assert response.content == b'{"fast": true}'
+    assert response.hedged is True
+    assert len(calls) == 2
+    assert elapsed < 1
+
+
+def test_without_policy_requests_have_no_timeout(monkeypatch):
+    fake_get = Mock(return_value=FakeResponse(200))
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    PipelineFullJsonApiValidator()._send_request(ENDPOINT)
+    assert "timeout" not in fake_get.call_args.kwargs
+
+
+def test_latency_tracker_percentile_needs_min_samples():
+    tracker = LatencyTracker(window=10, min_samples=3)
+    tracker.add("http://a.test/x", 5.0)
+    assert tracker.get_percentile("http://a.test/y", 95) is None
+
+    for value in (1.0, 2.0, 3.0, 4.0, 100.0):
+        tracker.add("http://a.test/x", value)
+    assert tracker.get_percentile("http://a.test", 50) == 3.0
+    assert tracker.get_percentile("http://a.test", 95) == 100.0
+    assert tracker.get_percentile("http://b.test", 95) is None
+
+
+def test_backoff_grows_exponentially_up_to_max():
+    policy = RetryPolicy(backoff_seconds=0.5, max_backoff_seconds=3)
+    assert [policy.get_backoff_seconds(i) for i in range(4)] == [0.5, 1, 2, 3]
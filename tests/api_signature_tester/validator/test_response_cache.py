@@ -0,0 +1,163 @@
+import time
+from unittest.mock import Mock
+
+import pytest
+import requests
+from requests.models import Response
+
+from api_signature_tester.validator.pipeline_json_api import (
+    PipelineFullJsonApiValidator,
+)
+from api_signature_tester.validator.response_cache import (
+    CACHE_MODE_REPLAY,
+    ResponseCache,
+)
+from api_signature_tester.validator.validator_model import DiffType, EndpointData
+
+
+def build_response(status_code: int, content: bytes) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers["Content-Type"] = "application/json"
+    response.url = "http://src.test"
+    return response
+
+
+SOURCE = EndpointData("http://src.test", "GET", {"b": "2", "a": "1"}, {"X-Trace": "1"})
+NEW = EndpointData("http://new.test", "GET", {}, {})
+
+
+def test_key_normalizes_params_and_ignores_unselected_headers(tmp_path):
+    cache = ResponseCache(str(tmp_path), header_keys=["Accept"])
+    same = EndpointData(
+        "http://src.test", "get", {"a": "1", "b": "2"}, {"X-Trace": "2"}
+    )
+    other = EndpointData("http://src.test", "GET", {"a": "1"}, {})
+    accept = EndpointData(
+        "http://src.test", "GET", {"a": "1", "b": "2"}, {"accept": "x"}
+    )
+
+    assert cache.build_key(SOURCE) == cache.build_key(same)
+    assert cache.build_key(SOURCE) != cache.build_key(other)
+    assert cache.build_key(SOURCE) != cache.build_key(accept)
+
+
+def test_put_and_get_round_trip(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    cache.put(SOURCE, build_response(201, b'{"a": 1}'))
+
+    cached = cache.get(SOURCE)
+
+    assert cached is not None
+    assert cached.status_code == 201
+    assert cached.json() == {"a": 1}
+    assert cached.headers["content-type"] == "application/json"
+
+
+def test_expired_entries_are_dropped(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl_seconds=0.01)
+    cache.put(SOURCE, build_response(200, b"{}"))
+    time.sleep(0.05)
+
+    assert cache.get(SOURCE) is None
+    assert cache.get_size_bytes() == 0
+
+
+def test_eviction_keeps_cache_under_max_bytes(tmp_path):
+    cache = ResponseCache(str(tmp_path), max_bytes=600)
+    endpoints = [EndpointData(f"http://src.test/{i}", "GET", {}, {}) for i in range(5)]
+    for endpoint in endpoints:
+        cache.put(endpoint, build_response(200, b"x" * 100))
+        time.sleep(0.01)
+
+    assert cache.get_size_bytes() <= 600
+    assert cache.get(endpoints[0]) is None
+    assert cache.get(endpoints[-1]) is not None
+
+
+def test_eviction_uses_index_built_on_open(tmp_path, monkeypatch):
+    endpoints = [EndpointData(f"http://src.test/{i}", "GET", {}, {}) for i in range(4)]
+    first = ResponseCache(str(tmp_path))
+    for endpoint in endpoints[:3]:
+        first.put(endpoint, build_response(200, b"x" * 100))
+        time.sleep(0.01)
+    # Lugar para tres entradas (los metadatos varían en algunos bytes)
+    max_bytes = first.get_size_bytes() + 20
+
+    cache = ResponseCache(str(tmp_path), max_bytes=max_bytes)
+    assert cache.get_size_bytes() == first.get_size_bytes()
+    # Escribir y desalojar no vuelve a recorrer el directorio
+    monkeypatch.setattr("pathlib.Path.glob", Mock(side_effect=AssertionError("glob")))
+    cache.put(endpoints[3], build_response(200, b"x" * 100))
+    cache.put(endpoints[1], build_response(200, b"x" * 100))
+    cache.put(endpoints[0], build_response(200, b"x" * 100))
+
+    assert cache.get_size_bytes() <= max_bytes
+    assert cache.get(endpoints[2]) is None
+    assert all(cache.get(endpoints[i]) is not None for i in (0, 1, 3))
+
+
+def test_pipeline_reuses_cached_source_response(tmp_path, monkeypatch):
+    fake_get = Mock(side_effect=lambda url, **kwargs: build_response(200, b"{}"))
+    monkeypatch.setattr(requests, "get", fake_get)
+    pipeline = PipelineFullJsonApiValidator(response_cache=ResponseCache(str(tmp_path)))
+
+    pipeline._exetute_requests(SOURCE, NEW)
+    pipeline._exetute_requests(SOURCE, NEW)
+
+    called_urls = [call.kwargs["url"] for call in fake_get.call_args_list]
+    assert called_urls == ["http://src.test", "http://new.test", "http://new.test"]
+
+
+def test_pipeline_replay_does_not_use_network(tmp_path, monkeypatch):
+    ResponseCache(str(tmp_path)).put(SOURCE, build_response(200, b'{"v": 1}'))
+    ResponseCache(str(tmp_path)).put(NEW, build_response(200, b'{"v": 2}'))
+    monkeypatch.setattr(requests, "get", Mock(side_effect=AssertionError))
+    pipeline = PipelineFullJsonApiValidator(
+        response_cache=ResponseCache(str(tmp_path), mode=CACHE_MODE_REPLAY)
+    )
+
+    result = pipeline.execute(SOURCE, NEW)
+
+    assert not result.get_comparation_result().is_equal()
+    assert result.get_comparation_result().get_diff_body()[0]["Ruta"] == "root['v']"
+
+
+def test_pipeline_replay_reports_missing_recording_as_failed_case(
+    tmp_path, monkeypatch
+):
+    ResponseCache(str(tmp_path)).put(SOURCE, build_response(200, b'{"v": 1}'))
+    monkeypatch.setattr(requests, "get", Mock(side_effect=AssertionError))
+    pipeline = PipelineFullJsonApiValidator(
+        response_cache=ResponseCache(str(tmp_path), mode=CACHE_MODE_REPLAY)
+    )
+
+    result = pipeline.execute(SOURCE, EndpointData("http://other.test", "GET", {}, {}))
+
+    assert not result.get_comparation_result().is_equal()
+    diff = result.get_comparation_result().get_diff_body()[0]
+    assert diff.get_type() == DiffType.REQUEST_ERROR
+    assert diff.get_old_value() == ""
+    assert diff.get_new_value() == (
+        "No hay respuesta grabada para GET http://other.test"
+    )
+
+
+@pytest.mark.parametrize(
+    ("status_code", "recorded"),
+    [(200, True), (404, True), (410, True), (401, False), (429, False), (503, False)],
+)
+def test_pipeline_records_only_stable_responses(
+    tmp_path, monkeypatch, status_code, recorded
+):
+    monkeypatch.setattr(
+        requests, "get", Mock(return_value=build_response(status_code, b"{}"))
+    )
+    cache = ResponseCache(str(tmp_path))
+    pipeline = PipelineFullJsonApiValidator(response_cache=cache)
+
+    pipeline._exetute_requests(SOURCE, NEW)
+
+    assert (cache.get(SOURCE) is not None) is recorded
+    assert (cache.get(NEW) is not None) is recorded
@@ -0,0 +1,89 @@
+import pickle
+
+import pytest
+
+from api_signature_tester.etl.etl_source_data import TestData
+from api_signature_tester.report.jsonl_report_writer import (
+    result_from_dict,
+    result_to_dict,
+)
+from api_signature_tester.validator.validator_model import (
+    BodyDiff,
+    ComparationResult,
+    DiffType,
+    EndpointData,
+    TestResult,
+)
+
+DIFF_DICT = {
+    "Tipo": "Cambio de valor",
+    "Ruta": "root['a']",
+    "Valor anterior": 1,
+    "Valor nuevo": 2,
+}
+
+
+def test_body_diff_reads_like_the_report_dict():
+    diff = BodyDiff(DiffType.VALUE_CHANGED, "root['a']", 1, 2)
+
+    assert diff == DIFF_DICT
+    assert diff.to_dict() == DIFF_DICT
+    assert dict(diff) == DIFF_DICT
+    assert diff["Tipo"] == "Cambio de valor"
+    assert diff.get("Ruta") == "root['a']"
+    assert diff.get("Otra", "") == ""
+    with pytest.raises(KeyError):
+        diff["Otra"]
+
+
+def test_body_diff_interns_types():
+    diff = BodyDiff.from_dict(DIFF_DICT)
+    custom = BodyDiff("Cambio de esquema", "root", "", "")
+
+    assert diff.get_type() is DiffType.VALUE_CHANGED
+    assert custom.get_type() == "Cambio de esquema"
+    assert custom.get_type() is BodyDiff("Cambio de esquema", "x", "", "").get_type()
+
+
+def test_models_have_no_instance_dict():
+    endpoint = EndpointData("http://x", "GET", {}, {})
+    result = TestResult(
+        endpoint, endpoint, ComparationResult(False, {}, [DIFF_DICT]), case_id=3
+    )
+    test_data = TestData(endpoint, endpoint, case_id=3)
+
+    for model in (endpoint, test_data, result, result.get_comparation_result()):
+        assert not hasattr(model, "__dict__")
+    with pytest.raises(AttributeError):
+        endpoint.extra = 1  # type: ignore[attr-defined]
+
+
+def test_comparation_result_converts_report_dicts():
+    result = ComparationResult(False, {}, [DIFF_DICT, {"Tipo": "parcial"}])
+
+    diff_body = result.get_diff_body()
+    assert isinstance(diff_body[0], BodyDiff)
+    # Un dict incompleto se conserva tal cual
+    assert diff_body[1] == {"Tipo": "parcial"}
+
+
+def test_slotted_result_survives_pickle_and_jsonl():
+    endpoint = EndpointData("http://x", "GET", {"q": "1"}, {})
+    result = TestResult(
+        endpoint,
+        endpoint,
+        ComparationResult(
+            False, {}, [BodyDiff(DiffType.KEY_ADDED, "root['k']", "", "")]
+        ),
+        case_id=7,
+    )
+
+    for restored in (
+        pickle.loads(pickle.dumps(result)),  # noqa: S301
+        result_from_dict(result_to_dict(result)),
+    ):
+        assert restored.get_case_id() == 7
+        assert restored.get_source().get_params() == {"q": "1"}
+        assert restored.get_comparation_result().get_diff_body() == [
+            BodyDiff(DiffType.KEY_ADDED, "root['k']", "", "")
+        ]
@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from benchmarks.memory_benchmark import build_results, main, run_benchmark
+
+
+def test_compact_results_use_less_memory():
+    report = run_benchmark(cases=200, diffs_per_case=5)
+
+    by_representation = {r["representation"]: r for r in report["results"]}
+    assert (
+        by_representation["compact"]["bytes_per_case"]
+        < by_representation["dict"]["bytes_per_case"]
+    )
+    assert 0 < report["savings_ratio"] < 1
+
+
+def test_build_results_rejects_unknown_representation():
+    with pytest.raises(ValueError):
+        build_results("tuple", 1, 1)
+
+
+def test_main_writes_report(tmp_path, capsys):
+    output = tmp_path / "memory.json"
+
+    assert (
+        main(["--cases", "20", "--diffs-per-case", "2", "--output", str(output)]) == 0
+    )
+
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert report["scenario"] == {"cases": 20, "diffs_per_case": 2}
+    assert "savings:" in capsys.readouterr().out
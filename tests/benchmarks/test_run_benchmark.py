@@ -0,0 +1,83 @@
+import json
+
+import pytest
+import requests
+
+from benchmarks.run_benchmark import main, percentiles, run_benchmark
+from benchmarks.stand_in_server import PayloadSpec, StandInServer
+
+
+def test_has_diff_spreads_cases_evenly():
+    spec = PayloadSpec(diff_ratio=0.25)
+    assert [i for i in range(12) if spec.has_diff(i)] == [3, 7, 11]
+    assert not any(PayloadSpec(diff_ratio=0.0).has_diff(i) for i in range(10))
+
+
+def test_stand_in_server_serves_payloads():
+    with StandInServer(PayloadSpec(size_bytes=500, diff_ratio=1.0)) as server:
+        source = requests.get(f"{server.get_base_url()}/source/0", timeout=5)
+        new = requests.get(f"{server.get_base_url()}/new/0", timeout=5)
+        missing = requests.get(f"{server.get_base_url()}/other", timeout=5)
+
+    assert source.status_code == 200
+    assert 0 < len(source.content) <= 500
+    assert new.json()["items"][-1]["changed"] is True
+    assert missing.status_code == 404
+
+
+def test_run_benchmark_reports_metrics():
+    report = run_benchmark(
+        PayloadSpec(size_bytes=300, diff_ratio=0.5),
+        cases=6,
+        engines=["sync"],
+        max_in_flight=2,
+        isolated=False,
+        json_decoders=["stdlib"],
+    )
+
+    result = report["results"][0]
+    assert report["scenario"]["cases"] == 6
+    assert result["engine"] == "sync"
+    assert result["json_decoder"] == "stdlib"
+    assert result["decode_ms_per_case"] > 0
+    assert result["cases"] == 6
+    assert result["failed"] == 3
+    assert result["cases_per_sec"] > 0
+    assert set(result["latency_ms"]) == {"p50", "p95", "p99"}
+    assert set(result["stage_seconds"]) == {"fetch", "decode", "diff"}
+    assert result["peak_rss_mb"] > 0
+
+
+def test_run_benchmark_rejects_unknown_engine():
+    with pytest.raises(ValueError, match="desconocido"):
+        run_benchmark(PayloadSpec(), cases=1, engines=["turbo"])
+
+
+def test_run_benchmark_rejects_unknown_json_decoder():
+    with pytest.raises(ValueError, match="desconocido"):
+        run_benchmark(PayloadSpec(), cases=1, engines=["sync"], json_decoders=["x"])
+
+
+def test_main_writes_results_file(tmp_path):
+    output = tmp_path / "results" / "bench.json"
+    main(
+        [
+            "--cases",
+            "3",
+            "--engines",
+            "sync",
+            "--latency-ms",
+            "0",
+            "--output",
+            str(output),
+        ]
+    )
+
+    assert json.loads(output.read_text())["results"][0]["cases"] == 3
+
+
+def test_percentiles():
+    assert percentiles([]) == {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+    assert percentiles([4.0])["p99"] == 4.0
+    values = [float(v) for v in range(1, 101)]
+    assert percentiles(values)["p50"] == pytest.approx(50.5)